@@ -1,3 +1,15 @@
 from .scene import Scene
 from .window import Window
-from . import sprite, types
\ No newline at end of file
+from . import (
+	animation,
+	assets,
+	atlas,
+	bundle,
+	memory,
+	particles,
+	physics,
+	scaling,
+	sprite,
+	tilemap,
+	types,
+)
\ No newline at end of file
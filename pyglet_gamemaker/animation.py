@@ -0,0 +1,260 @@
+"""Module holding Animation and Animator classes."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from itertools import compress, repeat
+from operator import le, sub
+from typing import TYPE_CHECKING, cast
+
+import pyglet
+from pyglet.event import EventDispatcher
+
+if TYPE_CHECKING:
+	from collections.abc import Sequence
+
+	from pyglet.image import TextureRegion
+	from pyglet.sprite import Sprite
+
+	from .sprite import SpriteSheet
+	from .types import EventHandler
+
+
+class Animation:
+	"""A sequence of frames from a `~pgm.sprite.SpriteSheet`, played by an `Animator`.
+
+	Only holds the frames and their timing, so one animation can be played on any
+	number of sprites.
+	"""
+
+	frames: list[TextureRegion]
+	"""The image of every frame"""
+	durations: list[float]
+	"""How long each frame is shown, in seconds"""
+	loop: bool
+	"""If True, restart after the last frame. Otherwise, stay on it."""
+
+	def __init__(
+		self,
+		sheet: SpriteSheet,
+		frames: Sequence[int | str],
+		duration: float | Sequence[float] = 0.1,
+		loop: bool = True,
+	) -> None:
+		"""Create an animation.
+
+		Args:
+			sheet (SpriteSheet):
+				The sprite sheet holding the frames
+			frames (Sequence[int | str]):
+				Sheet indices (or names) of the frames, in order (ex. `range(4, 8)`)
+			duration (float | Sequence[float], optional):
+				How long each frame is shown, in seconds. Either one for every frame,
+				or one per frame.
+				Defaults to 0.1.
+			loop (bool, optional):
+				If True, restart after the last frame. Otherwise, stay on it.
+				Defaults to True.
+		"""
+		if not frames:
+			raise ValueError('Animation needs at least 1 frame.')
+
+		self.frames = [cast('TextureRegion', sheet[frame]) for frame in frames]
+		self.durations = (
+			[duration] * len(frames)
+			if isinstance(duration, int | float)
+			else list(duration)
+		)
+		if len(self.durations) != len(self.frames):
+			raise ValueError(
+				f'Animation has {len(self.frames)} frames, but {len(self.durations)} durations.'
+			)
+		if min(self.durations) <= 0:
+			raise ValueError('Animation frame durations must be positive.')
+		self.loop = loop
+
+	@classmethod
+	def from_range(
+		cls,
+		sheet: SpriteSheet,
+		start: int | str,
+		end: int | str,
+		duration: float | Sequence[float] = 0.1,
+		loop: bool = True,
+	) -> Animation:
+		"""Create an animation of every frame from `start` to `end` (inclusive).
+
+		Args:
+			sheet (SpriteSheet):
+				The sprite sheet holding the frames
+			start (int | str):
+				Sheet index (or name) of the first frame
+			end (int | str):
+				Sheet index (or name) of the last frame
+			duration (float | Sequence[float], optional):
+				How long each frame is shown, in seconds.
+				Defaults to 0.1.
+			loop (bool, optional):
+				If True, restart after the last frame.
+				Defaults to True.
+
+		Returns:
+			Animation: The animation
+		"""
+		start = start if isinstance(start, int) else sheet.lookup[start]
+		end = end if isinstance(end, int) else sheet.lookup[end]
+		return cls(sheet, range(start, end + 1), duration, loop)
+
+
+class Animator(EventDispatcher):
+	"""Plays animations on many sprites from one tick.
+
+	The current frame and the time left on it of every playing sprite are stored in
+	flat arrays. `.update` subtracts the time from all of them at once, then only sets
+	the image of sprites whose frame changed.
+
+	Play animations using `.play` and stop using `.stop`. Call `.update` once per frame,
+	or `.schedule` it. Every scene has one, updated by the window.
+
+	Dispatches:
+	- `on_animation_end` when an animation that doesn't loop reaches its last frame.
+		- Args: sprite, animation
+
+	Use kwargs to attach event handlers.
+	"""
+
+	sprites: list[Sprite | None]
+	"""The sprite in every slot (None if free)"""
+	animations: list[Animation | None]
+	"""The animation playing in every slot (None if free)"""
+	frame: array[int]
+	"""Current frame of every slot"""
+	time_left: array[float]
+	"""Time left on the current frame of every slot, in seconds (inf if not advancing)"""
+
+	_slots: dict[Sprite, int]
+	"""Holds the slot of every playing sprite"""
+	_free: list[int]
+	"""Holds the free slots"""
+
+	def __init__(self, **kwargs: EventHandler) -> None:
+		"""Create an animator.
+
+		Args:
+			**kwargs (EventHandler):
+				Event handlers to attach (name=func)
+		"""
+		self.sprites, self.animations = [], []
+		self.frame, self.time_left = array('i'), array('d')
+		self._slots, self._free = {}, []
+
+		self.push_handlers(**kwargs)
+
+	def play(self, sprite: Sprite, animation: Animation, restart: bool = True) -> None:
+		"""Play an animation on a sprite, replacing the one playing on it.
+
+		Args:
+			sprite (Sprite):
+				The sprite
+			animation (Animation):
+				The animation
+			restart (bool, optional):
+				If False and the sprite is already playing this animation,
+				keep playing from the current frame.
+				Defaults to True.
+		"""
+		if (slot := self._slots.get(sprite)) is None:
+			if self._free:
+				slot = self._free.pop()
+			else:
+				slot = len(self.sprites)
+				self.sprites.append(None)
+				self.animations.append(None)
+				self.frame.append(0)
+				self.time_left.append(math.inf)
+			self._slots[sprite] = slot
+		elif not restart and self.animations[slot] is animation:
+			return
+
+		self.sprites[slot], self.animations[slot] = sprite, animation
+		self.frame[slot], self.time_left[slot] = 0, animation.durations[0]
+		sprite.image = animation.frames[0]
+
+	def stop(self, sprite: Sprite) -> None:
+		"""Stop animating a sprite. It keeps its current image.
+
+		Args:
+			sprite (Sprite):
+				The sprite
+		"""
+		slot = self._slots.pop(sprite)
+		self.sprites[slot] = self.animations[slot] = None
+		self.time_left[slot] = math.inf
+		self._free.append(slot)
+
+	def clear(self) -> None:
+		"""Stop animating every sprite."""
+		for sprite in list(self._slots):
+			self.stop(sprite)
+
+	def is_playing(self, sprite: Sprite) -> bool:
+		"""Check if a sprite has an animation.
+
+		Args:
+			sprite (Sprite):
+				The sprite
+
+		Returns:
+			bool: If True, the sprite has an animation (even one finished on its last frame)
+		"""
+		return sprite in self._slots
+
+	def schedule(self) -> None:
+		"""Schedule `.update` every frame. Not needed for the animator of a scene."""
+		pyglet.clock.schedule(self.update)
+
+	def unschedule(self) -> None:
+		"""Unschedule `.update`."""
+		pyglet.clock.unschedule(self.update)
+
+	def update(self, dt: float) -> None:
+		"""Advance every animation and set the image of sprites whose frame changed.
+
+		Args:
+			dt (float):
+				Time since the last update, in seconds
+		"""
+		time_left = self.time_left
+		time_left[:] = array('d', map(sub, time_left, repeat(dt)))
+
+		ended = []
+		for slot in compress(range(len(time_left)), map(le, time_left, repeat(0))):
+			animation = self.animations[slot]
+			sprite = self.sprites[slot]
+			assert animation is not None and sprite is not None
+
+			# Several frames can pass in one tick
+			frame, left = self.frame[slot], time_left[slot]
+			while left <= 0:
+				if frame + 1 < len(animation.frames):
+					frame += 1
+				elif animation.loop:
+					frame = 0
+				else:
+					left = math.inf
+					ended.append((sprite, animation))
+					break
+				left += animation.durations[frame]
+
+			time_left[slot] = left
+			if frame != self.frame[slot]:
+				self.frame[slot] = frame
+				sprite.image = animation.frames[frame]
+
+		# After every sprite is updated, in case handlers play new animations
+		for sprite, animation in ended:
+			self.dispatch_event('on_animation_end', sprite, animation)
+
+
+Animator.register_event_type('on_animation_end')
@@ -0,0 +1,210 @@
+"""Module holding AssetLoader class."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, cast
+
+import pyglet
+from pyglet.event import EventDispatcher
+from pyglet.image import ImageData, Texture
+
+from .sprite import SpriteSheet
+
+if TYPE_CHECKING:
+	from concurrent.futures import Future
+	from typing import BinaryIO
+
+	from .types import EventHandler
+
+
+class AssetLoader(EventDispatcher):
+	"""Loads sprite sheets in the background so the window keeps running.
+
+	Image files are decoded to raw RGBA on a thread pool. Each frame, the main thread
+	uploads up to `upload_budget` bytes of decoded pixels to textures, a strip of rows
+	at a time, so even one huge sheet is spread over several frames.
+
+	Add sheets using `.add`, then call `.start`. Finished sheets are stored in `.sheets`
+	and also shared through `~pgm.sprite.SpriteSheet.load`.
+
+	Dispatches:
+	- `on_load_progress` every frame while loading.
+		- Args: progress (0-1)
+	- `on_load_complete` once every sheet is loaded.
+		- Args: sheets {file path: SpriteSheet}
+
+	Use kwargs to attach event handlers.
+	"""
+
+	upload_budget: int
+	"""Most bytes uploaded to textures per frame"""
+	max_workers: int | None
+	"""Number of decoding threads (None for the `ThreadPoolExecutor` default)"""
+	sheets: dict[str, SpriteSheet]
+	"""Stores every loaded sheet {file path: sheet}"""
+
+	_requests: dict[str, tuple[int, int]]
+	"""Holds the grid of every sheet to load {file path: (rows, cols)}"""
+	_decoding: dict[str, Future[tuple[float, int, int, bytes]]]
+	"""Holds the decode job of every sheet not uploaded yet"""
+	_started: dict[str, float]
+	"""Holds when each sheet being uploaded started decoding, from `time.perf_counter()`"""
+	_uploads: dict[str, tuple[Texture, ImageData, int]]
+	"""Holds (texture, decoded image, rows uploaded) of every sheet being uploaded"""
+	_executor: ThreadPoolExecutor | None = None
+	"""The decoding threads, or None if not loading"""
+
+	def __init__(
+		self,
+		upload_budget: int = 4 * 1024 * 1024,
+		max_workers: int | None = None,
+		**kwargs: EventHandler,
+	) -> None:
+		"""Create an asset loader.
+
+		Args:
+			upload_budget (int, optional):
+				Most bytes uploaded to textures per frame.
+				Defaults to 4 MiB.
+			max_workers (int | None, optional):
+				Number of decoding threads.
+				Defaults to None (the `ThreadPoolExecutor` default).
+			**kwargs (EventHandler):
+				Event handlers to attach (name=func)
+		"""
+		self.upload_budget, self.max_workers = upload_budget, max_workers
+		self.sheets = {}
+		self._requests, self._decoding, self._uploads = {}, {}, {}
+		self._started = {}
+
+		self.push_handlers(**kwargs)
+
+	def add(self, file_path: str, rows: int, cols: int) -> None:
+		"""Add a sprite sheet to load.
+
+		Args:
+			file_path (str):
+				The path to the sprite sheet (in `pyglet.resource.path`)
+			rows (int):
+				The number of rows for sprites
+			cols (int):
+				The number of columns for sprites
+		"""
+		# Find the file now, so missing files fail here and the
+		# 	resource index is built before the threads use it
+		pyglet.resource.location(file_path)
+		self._requests[file_path] = rows, cols
+
+	def start(self) -> None:
+		"""Start decoding every added sheet and uploading them each frame.
+
+		Does nothing if already loading.
+		"""
+		if self._executor is not None:
+			return
+
+		self._executor = ThreadPoolExecutor(self.max_workers)
+		for file_path in self._requests.keys() - self.sheets.keys():
+			self._decoding[file_path] = self._executor.submit(self._decode, file_path)
+
+		pyglet.clock.schedule(self._tick)
+
+	@property
+	def progress(self) -> float:
+		"""How much (0-1) of the loading is done. Decoding and uploading each count for half."""
+		if not self._requests:
+			return 1
+
+		done = 0.0
+		for file_path in self._requests:
+			if file_path in self.sheets:
+				done += 1
+			elif file_path in self._uploads:
+				_, image, rows_uploaded = self._uploads[file_path]
+				done += 0.5 + 0.5 * rows_uploaded / image.height
+			elif file_path in self._decoding and self._decoding[file_path].done():
+				done += 0.5
+		return done / len(self._requests)
+
+	@property
+	def done(self) -> bool:
+		"""If True, every added sheet is loaded."""
+		return len(self.sheets) == len(self._requests)
+
+	@staticmethod
+	def _decode(file_path: str) -> tuple[float, int, int, bytes]:
+		# Runs on a worker thread: decode the file to raw RGBA
+		# 	The start time is returned so each sheet is timed on its own
+		start = time.perf_counter()
+		with pyglet.resource.file(file_path) as file:
+			image = pyglet.image.load(file_path, file=cast('BinaryIO', file))
+		data = image.get_image_data()
+		return start, data.width, data.height, data.get_bytes('RGBA', data.width * 4)
+
+	def _tick(self, dt: float) -> None:
+		# Runs every frame on the main thread: upload decoded pixels within the budget
+		budget = self.upload_budget
+
+		for file_path in list(self._decoding):
+			if budget <= 0:
+				break
+			if not self._decoding[file_path].done():
+				continue
+
+			if file_path not in self._uploads:
+				# Raises any decoding error here, on the main thread
+				start, width, height, data = self._decoding[file_path].result()
+				self._started[file_path] = start
+				self._uploads[file_path] = (
+					Texture.create(width, height),
+					ImageData(width, height, 'RGBA', data),
+					0,
+				)
+
+			texture, image, rows_uploaded = self._uploads[file_path]
+			rows = min(
+				max(budget // (image.width * 4), 1), image.height - rows_uploaded
+			)
+			texture.blit_into(
+				image.get_region(0, rows_uploaded, image.width, rows),
+				0,
+				rows_uploaded,
+				0,
+			)
+			budget -= rows * image.width * 4
+			rows_uploaded += rows
+
+			if rows_uploaded < image.height:
+				self._uploads[file_path] = texture, image, rows_uploaded
+				continue
+
+			del self._uploads[file_path], self._decoding[file_path]
+			self._add_sheet(file_path, texture)
+
+		self.dispatch_event('on_load_progress', self.progress)
+
+		if self.done:
+			pyglet.clock.unschedule(self._tick)
+			if self._executor is not None:
+				self._executor.shutdown(wait=False)
+				self._executor = None
+			self.dispatch_event('on_load_complete', self.sheets)
+
+	def _add_sheet(self, file_path: str, texture: Texture) -> None:
+		rows, cols = self._requests[file_path]
+		self.sheets[file_path] = sheet = SpriteSheet.from_image(
+			texture, rows, cols, file_path
+		)
+
+		# Share with `SpriteSheet.load` unless it already has this sheet
+		SpriteSheet._cache.setdefault((file_path, rows, cols), sheet)
+		start = self._started.pop(file_path)
+		SpriteSheet.load_log.append(
+			(start, file_path, 'loader', time.perf_counter() - start)
+		)
+
+
+AssetLoader.register_event_type('on_load_progress')
+AssetLoader.register_event_type('on_load_complete')
@@ -0,0 +1,124 @@
+"""Module holding AtlasBuilder class."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pyglet.image import Texture
+
+if TYPE_CHECKING:
+	from .sprite import SpriteSheet
+
+
+class AtlasBuilder:
+	"""Packs the images of many sprite sheets into a few large textures.
+
+	Sprites drawn from different textures can't share a draw call, so a scene using
+	many sheets splits its batch. After `.build`, every added `~pgm.sprite.SpriteSheet`
+	indexes regions of a shared atlas texture instead of its own (and its `.img` is its
+	region of the atlas). Indexing (including names from `SpriteSheet.name()`) works
+	the same as before. Packed sheets are marked `.in_atlas`, so
+	`~pgm.memory.TextureTracker` keeps them loaded.
+
+	Sheets are packed with a shelf packer: tallest first, left to right along rows
+	("shelves") as tall as their first sheet. A new texture (page) is started when
+	one is full.
+	"""
+
+	width: int
+	"""Width of each atlas texture"""
+	height: int
+	"""Height of each atlas texture"""
+	border: int
+	"""Empty pixels around each sheet, so neighbours don't bleed into each other"""
+	sheets: list[SpriteSheet]
+	"""The sheets to pack"""
+	pages: list[Texture]
+	"""The atlas textures made by `.build`"""
+
+	def __init__(self, width: int = 2048, height: int = 2048, border: int = 1) -> None:
+		"""Create an atlas builder.
+
+		Args:
+			width (int, optional):
+				Width of each atlas texture.
+				Defaults to 2048.
+			height (int, optional):
+				Height of each atlas texture.
+				Defaults to 2048.
+			border (int, optional):
+				Empty pixels around each sheet.
+				Defaults to 1.
+		"""
+		self.width, self.height, self.border = width, height, border
+		self.sheets, self.pages = [], []
+
+	def add(self, *sheets: SpriteSheet) -> None:
+		"""Add sheets to pack on the next `.build`.
+
+		Args:
+			*sheets (SpriteSheet):
+				The sheets to pack
+		"""
+		for sheet in sheets:
+			width, height = self._get_size(sheet)
+			if width > self.width or height > self.height:
+				raise ValueError(
+					f'SpriteSheet {sheet.path!r} ({sheet.img.width}x{sheet.img.height}) '
+					f'does not fit in a {self.width}x{self.height} atlas.'
+				)
+			self.sheets.append(sheet)
+
+	def build(self) -> list[Texture]:
+		"""Pack every added sheet and point them at the atlas textures.
+
+		Returns:
+			list[Texture]: The atlas textures
+		"""
+		placements = self._pack()
+		self.pages = [
+			Texture.create(self.width, self.height)
+			for _ in range(
+				max((page for page, _, _ in placements.values()), default=-1) + 1
+			)
+		]
+
+		for sheet in self.sheets:
+			page, x, y = placements[id(sheet)]
+			texture = self.pages[page]
+			x, y = x + self.border, y + self.border
+
+			texture.blit_into(sheet.img.get_image_data(), x, y, 0)
+			# Same frames as before, but over the atlas region
+			sheet._set_image(
+				texture.get_region(x, y, sheet.img.width, sheet.img.height)
+			)
+			sheet.in_atlas = True
+
+		return self.pages
+
+	def _pack(self) -> dict[int, tuple[int, int, int]]:
+		# Get the (page, x, y) of every sheet {id(sheet): placement}
+		placements = {}
+		page = shelf_x = shelf_y = shelf_height = 0
+
+		for sheet in sorted(self.sheets, key=lambda sheet: -self._get_size(sheet)[1]):
+			width, height = self._get_size(sheet)
+
+			# Start a new shelf above the current one
+			if shelf_x + width > self.width:
+				shelf_x, shelf_y = 0, shelf_y + shelf_height
+				shelf_height = 0
+			# Start a new page
+			if shelf_y + height > self.height:
+				page += 1
+				shelf_x = shelf_y = shelf_height = 0
+
+			placements[id(sheet)] = page, shelf_x, shelf_y
+			shelf_x += width
+			shelf_height = max(shelf_height, height)
+
+		return placements
+
+	def _get_size(self, sheet: SpriteSheet) -> tuple[int, int]:
+		return sheet.img.width + self.border * 2, sheet.img.height + self.border * 2
@@ -0,0 +1,156 @@
+"""Module holding AssetBundle class."""
+
+from __future__ import annotations
+
+import ctypes
+import json
+import mmap
+import struct
+import time
+from typing import TYPE_CHECKING, cast
+
+from pyglet.image import ImageData
+
+from .sprite import PackedSpriteSheet, SpriteSheet
+
+if TYPE_CHECKING:
+	from collections.abc import Iterable
+	from typing import Any, BinaryIO
+
+_MAGIC = b'PGMB'
+# Magic, then the size of the JSON index that follows
+_HEADER = struct.Struct('<4sI')
+# Pixels of each sheet start on a multiple of this
+_ALIGN = 16
+
+
+class AssetBundle:
+	"""Sprite sheets stored as raw RGBA pixels in one file, loaded without decoding.
+
+	Build a bundle offline with `AssetBundle.build`. The file holds a header, a JSON
+	index (grid, names, size and offset of every sheet) and then the uncompressed
+	pixels of each sheet, aligned to 16 bytes.
+
+	Opening a bundle memory-maps it, and `.load` creates a texture straight from the
+	mapped pixels, so the only copy made is the upload to the GPU.
+	"""
+
+	file_path: str
+	"""The path to the bundle file"""
+	index: dict[str, dict[str, Any]]
+	"""The entry of every sheet {sheet file path: entry}"""
+
+	_file: BinaryIO
+	_map: mmap.mmap
+	_data_start: int
+	"""Position of the pixels of the first sheet (entry offsets are from here)"""
+
+	def __init__(self, file_path: str) -> None:
+		"""Open a bundle.
+
+		Args:
+			file_path (str):
+				The path to the bundle file (made by `AssetBundle.build`)
+		"""
+		self.file_path = file_path
+		self._file = open(file_path, 'rb')  # noqa: SIM115
+		# Copy-on-write, so ctypes can point into it. Nothing is ever written
+		self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+		magic, index_size = _HEADER.unpack_from(self._map)
+		if magic != _MAGIC:
+			self.close()
+			raise ValueError(f'{file_path!r} is not an asset bundle.')
+		self.index = json.loads(
+			self._map[_HEADER.size : _HEADER.size + index_size].decode()
+		)
+		self._data_start = _HEADER.size + index_size
+		self._data_start += -self._data_start % _ALIGN
+
+	@staticmethod
+	def build(file_path: str, sheets: Iterable[SpriteSheet]) -> None:
+		"""Write sprite sheets (with their names) to a new bundle file.
+
+		Args:
+			file_path (str):
+				The path to write the bundle to
+			sheets (Iterable[SpriteSheet]):
+				The sheets to store. Each is stored under its `.path`.
+		"""
+		index: dict[str, dict[str, Any]] = {}
+		blobs = []
+		offset = 0
+		for sheet in sheets:
+			# Only the grid is stored, which can't describe packed frames
+			if isinstance(sheet, PackedSpriteSheet):
+				raise TypeError(
+					f'AssetBundle can only store SpriteSheet grids, not the PackedSpriteSheet {sheet.data_path!r}.'
+				)
+			data = sheet.img.get_image_data()
+			pixels = data.get_bytes('RGBA', data.width * 4)
+
+			index[sheet.path] = {
+				'rows': sheet.rows,
+				'cols': sheet.cols,
+				'names': sheet.lookup,
+				'width': data.width,
+				'height': data.height,
+				'offset': offset,
+			}
+			padding = -len(pixels) % _ALIGN
+			blobs.append(pixels + bytes(padding))
+			offset += len(pixels) + padding
+
+		header = json.dumps(index).encode()
+		with open(file_path, 'wb') as file:
+			file.write(_HEADER.pack(_MAGIC, len(header)))
+			file.write(header)
+			file.write(bytes(-file.tell() % _ALIGN))
+			file.writelines(blobs)
+
+	def load(self, sheet_path: str) -> SpriteSheet:
+		"""Create a sprite sheet from the bundle, shared through `SpriteSheet.load`.
+
+		Args:
+			sheet_path (str):
+				The path the sheet was stored under
+
+		Returns:
+			SpriteSheet: The sprite sheet
+		"""
+		start = time.perf_counter()
+		entry = self.index[sheet_path]
+		width, height = entry['width'], entry['height']
+
+		# Points into the mapped file, and is uploaded without any conversion
+		pixels = (ctypes.c_ubyte * (width * height * 4)).from_buffer(
+			self._map, self._data_start + entry['offset']
+		)
+		texture = ImageData(width, height, 'RGBA', cast('bytes', pixels)).get_texture()
+		del pixels
+
+		sheet = SpriteSheet.from_image(
+			texture, entry['rows'], entry['cols'], sheet_path
+		)
+		if entry['names']:
+			sheet.lookup = dict(entry['names'])
+
+		# Share with `SpriteSheet.load` unless it already has this sheet
+		SpriteSheet._cache.setdefault((sheet_path, sheet.rows, sheet.cols), sheet)
+		SpriteSheet.load_log.append(
+			(start, sheet_path, 'bundle', time.perf_counter() - start)
+		)
+		return sheet
+
+	def load_all(self) -> dict[str, SpriteSheet]:
+		"""Create every sprite sheet in the bundle.
+
+		Returns:
+			dict[str, SpriteSheet]: Every sheet {sheet file path: sheet}
+		"""
+		return {sheet_path: self.load(sheet_path) for sheet_path in self.index}
+
+	def close(self) -> None:
+		"""Unmap and close the bundle file. Loaded sheets keep working."""
+		self._map.close()
+		self._file.close()
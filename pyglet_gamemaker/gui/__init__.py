@@ -1,4 +1,5 @@
 from .widget import Widget
 from .text import Text
+from .nine_slice import NineSlice
 from .button import Button
 from .text_button import TextButton
\ No newline at end of file
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 
 from pyglet.gui import PushButton as _PushButton
 
+from .nine_slice import NineSlice
 from .widget import Widget
 
 if TYPE_CHECKING:
@@ -35,6 +36,10 @@ class Button(_PushButton, Widget):
 	When creating object, give the starting index of the button images.
 	For example, passing in 0 will take 0 as the unpressed image, 1 as the hovered, and 2 as the pressed.
 
+	Pass `nine_slice` insets and/or a `size` to stretch the images to any size, keeping
+	their borders sharp (see `~pgm.gui.NineSlice`). Buttons of many sizes can then share
+	one small sheet.
+
 	Dispatches:
 	- `on_half_click` when pressed.
 	- `on_full_click` when pressed and released without mouse moving off.
@@ -48,6 +53,12 @@ class Button(_PushButton, Widget):
 	"""Image of hovered button"""
 	pressed_img: AbstractImage
 	"""Image of pressed button"""
+	sheet: SpriteSheet
+	"""The sprite sheet holding the button images"""
+	size: tuple[int, int] | None
+	"""The size the images are stretched to (None if drawn at their own size)"""
+	nine_slice: tuple[int, int, int, int] | None
+	"""Size of the image borders kept unstretched (left, right, bottom, top), in px"""
 	ID: str
 	"""Identifier of button"""
 	status: ButtonStatus
@@ -69,6 +80,8 @@ class Button(_PushButton, Widget):
 		anchor: Anchor = (0, 0),
 		dispatch: bool = True,
 		attach_events: bool = True,
+		size: tuple[int, int] | None = None,
+		nine_slice: tuple[int, int, int, int] | None = None,
 		**kwargs: EventHandler,
 	) -> None:
 		"""Create a button.
@@ -100,6 +113,13 @@ class Button(_PushButton, Widget):
 				If False, don't attach mouse events to window.
 				Event handlers can still be manually invoked.
 				Defaults to True.
+			size (tuple[int, int] | None, optional):
+				Size to stretch the images to. If None, uses the size of the images.
+				Defaults to None.
+			nine_slice (tuple[int, int, int, int] | None, optional):
+				Size of the image borders kept unstretched (left, right, bottom, top), in px.
+				If None and `size` is given, the whole image is stretched.
+				Defaults to None.
 			kwargs (Callable):
 				Event handlers (name=func)
 		"""
@@ -116,6 +136,24 @@ class Button(_PushButton, Widget):
 			group,
 		)
 
+		self.nine_slice = nine_slice
+		self.size = None
+		if size is not None or nine_slice is not None:
+			self.size = size or (self.unpressed_img.width, self.unpressed_img.height)
+			# Replace the sprite with one stretching the images in one vertex list
+			sprite = self._sprite
+			self._sprite = NineSlice(  # type: ignore[assignment]
+				self.unpressed_img,
+				x,
+				y,
+				*self.size,
+				nine_slice or (0, 0, 0, 0),
+				batch,
+				sprite.group,
+			)
+			sprite.delete()
+			self._width, self._height = self.size
+
 		self.start_pos = x, y
 		self.start_anchor = self.anchor = anchor
 		self.dispatch = dispatch
@@ -141,6 +179,7 @@ class Button(_PushButton, Widget):
 
 	def _parse_sheet(self, image_sheet: SpriteSheet, image_start: str | int) -> None:
 		"""Parse a sheet into individual images and store them."""
+		self.sheet = image_sheet
 		start = (
 			image_sheet.lookup[image_start]
 			if isinstance(image_start, str)
@@ -168,12 +207,12 @@ class Button(_PushButton, Widget):
 		prev_pos = self.pos
 		self._anchor = (
 			(
-				self.CONVERT_DYNAMIC[self.raw_anchor[0]] * self.hover_img.width
+				self.CONVERT_DYNAMIC[self.raw_anchor[0]] * self.width
 				if isinstance(self.raw_anchor[0], str)
 				else self.raw_anchor[0]
 			),
 			(
-				self.CONVERT_DYNAMIC[self.raw_anchor[1]] * self.hover_img.height
+				self.CONVERT_DYNAMIC[self.raw_anchor[1]] * self.height
 				if isinstance(self.raw_anchor[1], str)
 				else self.raw_anchor[1]
 			),
@@ -318,8 +357,8 @@ class Button(_PushButton, Widget):
 
 	@property
 	def width(self) -> int:  # noqa: D102
-		return self.hover_img.width
+		return self.size[0] if self.size is not None else self.hover_img.width
 
 	@property
 	def height(self) -> int:  # noqa: D102
-		return self.hover_img.height
+		return self.size[1] if self.size is not None else self.hover_img.height
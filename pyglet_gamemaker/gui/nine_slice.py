@@ -0,0 +1,223 @@
+"""Module holding NineSlice class.
+
+Use `~pgm.gui.NineSlice` instead of `~pgm.gui.nine_slice.NineSlice`
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pyglet.gl import GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA, GL_TRIANGLES
+from pyglet.sprite import SpriteGroup, get_default_shader
+
+if TYPE_CHECKING:
+	from pyglet.graphics import Batch, Group
+	from pyglet.graphics.vertexdomain import IndexedVertexList
+	from pyglet.image import AbstractImage
+
+# 9 quads over a 4x4 grid of vertices, row by row from the bottomleft
+_INDICES = [
+	i
+	for row in range(3)
+	for col in range(3)
+	for i in (
+		row * 4 + col,
+		row * 4 + col + 1,
+		row * 4 + col + 5,
+		row * 4 + col,
+		row * 4 + col + 5,
+		row * 4 + col + 4,
+	)
+]
+
+
+class NineSlice:
+	"""An image stretched to any size without stretching its borders.
+
+	The image is cut into 9 parts by `insets`. Corners keep their size, edges stretch
+	along one axis, and the center stretches along both. All 9 are drawn from one
+	vertex list of 16 vertices, so one small image can draw boxes of any size.
+
+	Can be used in place of a `~pyglet.sprite.Sprite` for `.image`, `.position`,
+	`.group`, `.visible` and `.delete`.
+	"""
+
+	insets: tuple[int, int, int, int]
+	"""Size of the borders of the image (left, right, bottom, top), in px"""
+
+	_image: AbstractImage
+	_x: float
+	_y: float
+	_width: float
+	_height: float
+	_visible: bool = True
+	_batch: Batch
+	_user_group: Group | None
+	_group: SpriteGroup
+	_vertex_list: IndexedVertexList
+
+	def __init__(
+		self,
+		image: AbstractImage,
+		x: float,
+		y: float,
+		width: float,
+		height: float,
+		insets: tuple[int, int, int, int],
+		batch: Batch,
+		group: Group | None = None,
+	) -> None:
+		"""Create a nine-slice.
+
+		Args:
+			image (AbstractImage):
+				The image to stretch (ex. a frame of a `~pgm.sprite.SpriteSheet`)
+			x (float):
+				x position of the bottomleft corner
+			y (float):
+				y position of the bottomleft corner
+			width (float):
+				Width to stretch to
+			height (float):
+				Height to stretch to
+			insets (tuple[int, int, int, int]):
+				Size of the borders of the image (left, right, bottom, top), in px
+			batch (Batch):
+				Batch for rendering
+			group (Group | None, optional):
+				Group for rendering.
+				Defaults to None.
+		"""
+		self._image, self.insets = image, insets
+		self._x, self._y, self._width, self._height = x, y, width, height
+		self._batch, self._user_group = batch, group
+		self._group = self._create_group()
+
+		self._vertex_list = get_default_shader().vertex_list_indexed(
+			16,
+			GL_TRIANGLES,
+			_INDICES,
+			batch,
+			self._group,
+			position=('f', self._get_positions()),
+			colors=('Bn', (255, 255, 255, 255) * 16),
+			translate=('f', (0, 0, 0) * 16),
+			scale=('f', (1, 1) * 16),
+			rotation=('f', (0,) * 16),
+			tex_coords=('f', self._get_tex_coords()),
+		)
+
+	def delete(self) -> None:
+		"""Delete the vertex list. The nine-slice can't be drawn afterwards."""
+		self._vertex_list.delete()
+
+	@property
+	def image(self) -> AbstractImage:
+		"""The image to stretch."""
+		return self._image
+
+	@image.setter
+	def image(self, image: AbstractImage) -> None:
+		if image is self._image:
+			return
+
+		old_texture = self._image.get_texture()
+		self._image = image
+		if image.get_texture().id != old_texture.id:
+			self._group = self._create_group()
+			self._batch.migrate(
+				self._vertex_list, GL_TRIANGLES, self._group, self._batch
+			)
+		self._vertex_list.tex_coords[:] = self._get_tex_coords()  # type: ignore[attr-defined]
+
+	@property
+	def position(self) -> tuple[float, float, float]:
+		"""The (x, y, z) position of the bottomleft corner. z is ignored."""
+		return self._x, self._y, 0
+
+	@position.setter
+	def position(self, position: tuple[float, float, float]) -> None:
+		self._x, self._y, _ = position
+		self._update_position()
+
+	@property
+	def size(self) -> tuple[float, float]:
+		"""The (width, height) the image is stretched to."""
+		return self._width, self._height
+
+	@size.setter
+	def size(self, size: tuple[float, float]) -> None:
+		self._width, self._height = size
+		self._update_position()
+
+	@property
+	def group(self) -> Group | None:
+		"""Group for rendering."""
+		return self._user_group
+
+	@group.setter
+	def group(self, group: Group | None) -> None:
+		self._user_group = group
+		self._group = self._create_group()
+		self._batch.migrate(self._vertex_list, GL_TRIANGLES, self._group, self._batch)
+
+	@property
+	def visible(self) -> bool:
+		"""If False, the nine-slice is not drawn."""
+		return self._visible
+
+	@visible.setter
+	def visible(self, visible: bool) -> None:
+		self._visible = visible
+		self._update_position()
+
+	def _create_group(self) -> SpriteGroup:
+		return SpriteGroup(
+			self._image.get_texture(),
+			GL_SRC_ALPHA,
+			GL_ONE_MINUS_SRC_ALPHA,
+			get_default_shader(),
+			self._user_group,
+		)
+
+	def _update_position(self) -> None:
+		if self._visible:
+			self._vertex_list.position[:] = self._get_positions()  # type: ignore[attr-defined]
+		else:
+			self._vertex_list.position[:] = (0, 0, 0) * 16  # type: ignore[attr-defined]
+
+	def _get_borders(self) -> tuple[float, float, float, float]:
+		# Get the on-screen insets, shrunk if the size is smaller than the borders
+		left, right, bottom, top = self.insets
+		shrink_x = min(self._width / (left + right), 1) if left + right else 1
+		shrink_y = min(self._height / (bottom + top), 1) if bottom + top else 1
+		return left * shrink_x, right * shrink_x, bottom * shrink_y, top * shrink_y
+
+	def _get_positions(self) -> list[float]:
+		left, right, bottom, top = self._get_borders()
+		x, y = self._x, self._y
+		xs = x, x + left, x + self._width - right, x + self._width
+		ys = y, y + bottom, y + self._height - top, y + self._height
+		return [value for row_y in ys for col_x in xs for value in (col_x, row_y, 0)]
+
+	def _get_tex_coords(self) -> list[float]:
+		# Same cuts as the positions, across the image's part of its texture
+		tex_coords = self._image.get_texture().tex_coords
+		u0, v0, r = tex_coords[0:3]
+		u1, v1 = tex_coords[6:8]
+		left, right, bottom, top = self.insets
+		width, height = self._image.width, self._image.height
+
+		us = (
+			u0,
+			u0 + (u1 - u0) * left / width,
+			u1 - (u1 - u0) * right / width,
+			u1,
+		)
+		vs = (
+			v0,
+			v0 + (v1 - v0) * bottom / height,
+			v1 - (v1 - v0) * top / height,
+			v1,
+		)
+		return [value for v in vs for u in us for value in (u, v, r)]
@@ -69,6 +69,8 @@ class TextButton(Widget):
 		hover_enlarge: int = 0,
 		dispatch: bool = True,
 		attach_events: bool = True,
+		size: tuple[int, int] | None = None,
+		nine_slice: tuple[int, int, int, int] | None = None,
 		**kwargs: EventHandler,
 	) -> None:
 		"""Create a button with text.
@@ -116,6 +118,12 @@ class TextButton(Widget):
 				If False, don't attach mouse events to window.
 				Event handlers can still be manually invoked.
 				Defaults to True.
+			size (tuple[int, int] | None, optional):
+				Size to stretch the button images to. See `~pgm.gui.Button` for more info.
+				Defaults to None.
+			nine_slice (tuple[int, int, int, int] | None, optional):
+				Size of the image borders kept unstretched. See `~pgm.gui.Button` for more info.
+				Defaults to None.
 			**kwargs (Callable[... Any]):
 				Any event handlers to attach to *button* (such as `on_full_click`)
 		"""
@@ -131,6 +139,8 @@ class TextButton(Widget):
 			button_anchor,
 			dispatch=dispatch,
 			attach_events=False,
+			size=size,
+			nine_slice=nine_slice,
 			**kwargs,
 		)
 		self.start_hover_enlarge = self.hover_enlarge = hover_enlarge
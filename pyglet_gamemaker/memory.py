@@ -0,0 +1,174 @@
+"""Module holding TextureTracker class."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pyglet
+from pyglet.resource import ResourceNotFoundException
+
+from .gui.button import Button
+from .gui.text import Text
+from .gui.text_button import TextButton
+from .sprite import SpriteSheet
+
+if TYPE_CHECKING:
+	from .scene import Scene
+	from .window import Window
+
+
+class TextureTracker:
+	"""Accounts for the texture memory used by each scene, and keeps it within a budget.
+
+	A scene uses the sprite sheets it loaded with `~pgm.Scene.load_sheet` or gave to its
+	buttons (and their frames from `~pgm.sprite.SpriteSheet.scaled`), and the glyph
+	textures of the fonts of its text widgets. Sizes assume 4 bytes per pixel.
+	Textures used by several scenes count for each scene, but once in the total.
+
+	If `budget` is set, `.enforce` (run by the window on every scene change) unloads
+	the sheets of inactive scenes, least recently active first, until the total fits.
+	Unloaded sheets load again the first time they are used. A texture is only freed
+	once nothing else (ex. a sprite) uses it.
+
+	Sheets given to a button of any scene are never unloaded: the button keeps its
+	images, so unloading would free nothing and reloading would upload a second copy.
+	Sheets packed by `~pgm.atlas.AtlasBuilder` are never unloaded either, since
+	reloading would take them out of the atlas. Both always count toward the total.
+	"""
+
+	window: Window
+	"""The window holding the scenes"""
+	budget: int | None
+	"""Most bytes of textures to keep (None for no limit)"""
+	evictions: int = 0
+	"""Number of sheets unloaded to stay within the budget"""
+
+	_last_active: dict[str, int]
+	"""Holds when each scene was last active, as a count of `.enforce` calls"""
+	_enforced: int = 0
+	"""Number of `.enforce` calls"""
+
+	def __init__(self, window: Window, budget: int | None = None) -> None:
+		"""Create a texture tracker.
+
+		Args:
+			window (Window):
+				The window holding the scenes
+			budget (int | None, optional):
+				Most bytes of textures to keep.
+				Defaults to None (no limit).
+		"""
+		self.window, self.budget = window, budget
+		self._last_active = {}
+
+	def get_sheets(self, scene: Scene) -> list[SpriteSheet]:
+		"""Get every sprite sheet a scene uses.
+
+		Args:
+			scene (Scene):
+				The scene
+
+		Returns:
+			list[SpriteSheet]: The sheets, each once
+		"""
+		sheets = {id(sheet): sheet for sheet in scene.sheets}
+		sheets |= {id(sheet): sheet for sheet in self._get_widget_sheets(scene)}
+		return list(sheets.values())
+
+	def get_textures(self, scene: Scene) -> dict[tuple[str, int], int]:
+		"""Get every texture a scene uses.
+
+		Args:
+			scene (Scene):
+				The scene
+
+		Returns:
+			dict[tuple[str, int], int]: {(kind, id): bytes}, where kind is
+				'sheets', 'scaled' or 'glyphs'
+		"""
+		textures = {}
+		for sheet in self.get_sheets(scene):
+			textures['sheets', id(sheet)] = sheet.texture_bytes
+			textures['scaled', id(sheet)] = SpriteSheet.scaled_cache.get_bytes(sheet)
+
+		for widget in scene.widgets.values():
+			if isinstance(widget, TextButton):
+				widget = widget.text
+			if isinstance(widget, Text):
+				font = widget.document.get_font(0)
+				for glyph in font.glyphs.values():
+					texture = glyph.owner
+					textures['glyphs', id(texture)] = texture.width * texture.height * 4
+		return textures
+
+	def report(self) -> dict[str, dict[str, int]]:
+		"""Get the texture memory used by every scene.
+
+		Returns:
+			dict[str, dict[str, int]]: {scene name: {kind: bytes}}, with kinds
+				'sheets', 'scaled', 'glyphs' and 'total'
+		"""
+		report = {}
+		for name, scene in self.window.scenes.items():
+			usage = dict.fromkeys(('sheets', 'scaled', 'glyphs', 'total'), 0)
+			for (kind, _), size in self.get_textures(scene).items():
+				usage[kind] += size
+				usage['total'] += size
+			report[name] = usage
+		return report
+
+	def get_total(self) -> int:
+		"""Get the texture memory used by all scenes, counting shared textures once.
+
+		Returns:
+			int: The bytes
+		"""
+		textures: dict[tuple[str, int], int] = {}
+		for scene in self.window.scenes.values():
+			textures |= self.get_textures(scene)
+		return sum(textures.values())
+
+	def enforce(self) -> None:
+		"""Unload sheets of inactive scenes until the total fits in `.budget`."""
+		self._enforced += 1
+		self._last_active[self.window.scene] = self._enforced
+		if self.budget is None or (total := self.get_total()) <= self.budget:
+			return
+
+		# Sheets the active scene uses, and sheets held by any widget, stay loaded
+		in_use = {
+			id(sheet)
+			for sheet in self.get_sheets(self.window.scenes[self.window.scene])
+		}
+		for scene in self.window.scenes.values():
+			in_use.update(id(sheet) for sheet in self._get_widget_sheets(scene))
+		inactive = sorted(
+			(name for name in self.window.scenes if name != self.window.scene),
+			key=lambda name: self._last_active.get(name, 0),
+		)
+		for name in inactive:
+			for sheet in self.get_sheets(self.window.scenes[name]):
+				if id(sheet) in in_use or not sheet.loaded or sheet.in_atlas:
+					continue
+				# Only sheets that can be loaded again from their file
+				try:
+					pyglet.resource.location(sheet.path)
+				except ResourceNotFoundException:
+					continue
+
+				total -= sheet.texture_bytes + SpriteSheet.scaled_cache.get_bytes(sheet)
+				sheet.unload()
+				self.evictions += 1
+				if total <= self.budget:
+					return
+
+	@staticmethod
+	def _get_widget_sheets(scene: Scene) -> list[SpriteSheet]:
+		# Get the sheets whose images are held by the widgets of a scene
+		sheets = []
+		for widget in scene.widgets.values():
+			if isinstance(widget, TextButton):
+				widget = widget.button
+			if isinstance(widget, Button):
+				sheets.append(widget.sheet)
+		return sheets
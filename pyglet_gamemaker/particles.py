@@ -0,0 +1,330 @@
+"""Module holding ParticleEmitter class."""
+
+from __future__ import annotations
+
+import ctypes
+import math
+import random
+from array import array
+from itertools import compress, repeat
+from operator import add, le, mul, sub
+from typing import TYPE_CHECKING
+
+from pyglet.gl import GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA, GL_TRIANGLES
+from pyglet.sprite import SpriteGroup, get_default_shader
+
+from .sprite import PackedSpriteSheet
+from .types import Color
+
+if TYPE_CHECKING:
+	from collections.abc import Sequence
+	from typing import Any
+
+	from pyglet.graphics import Batch, Group
+	from pyglet.graphics.vertexdomain import IndexedVertexList
+
+	from .sprite import SpriteSheet
+	from .types import Point2D
+
+
+class ParticleEmitter:
+	"""Emits textured particles, all drawn from one vertex list.
+
+	The state of every particle is stored in flat arrays (one value per particle),
+	and `.update` moves all of them, then writes their positions and colors with one
+	region write each. Particles are images from a `~pgm.sprite.SpriteSheet`.
+
+	Live particles are packed at the start of the arrays; a dying particle is replaced
+	by the last one. Particles emitted past `capacity` are dropped.
+
+	The arrays are updated in Python (no NumPy), at roughly 0.6 ms per 1000 live
+	particles per `.update`. About 10-20k particles fit in a 60 FPS frame; 50k take
+	about 30 ms.
+
+	Call `.emit` to add particles and `.update` once per frame.
+	"""
+
+	sheet: SpriteSheet
+	"""The sprite sheet holding the particle images"""
+	capacity: int
+	"""Most particles alive at once"""
+	pos: Point2D
+	"""Default position new particles are emitted from"""
+	gravity: Point2D
+	"""Acceleration applied to every particle, in px/s^2"""
+	fade: bool
+	"""If True, particles fade out over their life"""
+	count: int = 0
+	"""Number of live particles"""
+
+	x: array[float]
+	"""x position of each particle"""
+	y: array[float]
+	"""y position of each particle"""
+	vel_x: array[float]
+	"""x velocity of each particle, in px/s"""
+	vel_y: array[float]
+	"""y velocity of each particle, in px/s"""
+	life: array[float]
+	"""Time left of each particle, in seconds"""
+	max_life: array[float]
+	"""Starting life of each particle, in seconds"""
+	fade_rate: array[float]
+	"""Alpha lost per second of each particle (if `.fade` is True)"""
+	frame: array[int]
+	"""Sheet index of each particle"""
+	color: array[int]
+	"""Color of each particle (4 values per particle)"""
+
+	_drawn: int = 0
+	"""Number of particles written on the last `.update`"""
+	_tex_coords: list[tuple[float, ...]]
+	"""Holds the texture coords of every image in the sheet"""
+	_vertex_list: IndexedVertexList
+
+	def __init__(
+		self,
+		sheet: SpriteSheet,
+		batch: Batch,
+		group: Group | None = None,
+		capacity: int = 4096,
+		pos: Point2D = (0, 0),
+		gravity: Point2D = (0, 0),
+		fade: bool = True,
+	) -> None:
+		"""Create a particle emitter.
+
+		Args:
+			sheet (SpriteSheet):
+				The sprite sheet holding the particle images
+			batch (Batch):
+				Batch for rendering
+			group (Group | None, optional):
+				Group for rendering.
+				Defaults to None.
+			capacity (int, optional):
+				Most particles alive at once.
+				Defaults to 4096.
+			pos (Point2D, optional):
+				Default position new particles are emitted from.
+				Defaults to (0, 0).
+			gravity (Point2D, optional):
+				Acceleration applied to every particle, in px/s^2.
+				Defaults to (0, 0).
+			fade (bool, optional):
+				If True, particles fade out over their life.
+				Defaults to True.
+		"""
+		if isinstance(sheet, PackedSpriteSheet):
+			raise TypeError(
+				'ParticleEmitter needs same-size images from a SpriteSheet grid, not a PackedSpriteSheet.'
+			)
+		self.sheet, self.capacity = sheet, capacity
+		self.pos, self.gravity, self.fade = pos, gravity, fade
+
+		# Positions are float32 like the vertex list, so they can be copied directly
+		self.x, self.y = array('f', [0]) * capacity, array('f', [0]) * capacity
+		self.vel_x = array('d', [0]) * capacity
+		self.vel_y = array('d', [0]) * capacity
+		self.life = array('d', [0]) * capacity
+		self.max_life = array('d', [0]) * capacity
+		self.fade_rate = array('d', [0]) * capacity
+		self.frame = array('i', [0]) * capacity
+		self.color = array('B', [0]) * (capacity * 4)
+
+		self._tex_coords = [region.tex_coords for region in sheet.grid.items]
+
+		# Every image in the sheet is the same size, so the corners never change
+		width, height = sheet.item_width / 2, sheet.item_height / 2
+		corners = [
+			value
+			for x, y in ((-1, -1), (1, -1), (1, 1), (-1, 1))
+			for value in (x * width, y * height, 0)
+		]
+		self._vertex_list = get_default_shader().vertex_list_indexed(
+			capacity * 4,
+			GL_TRIANGLES,
+			[i * 4 + j for i in range(capacity) for j in (0, 1, 2, 0, 2, 3)],
+			batch,
+			SpriteGroup(
+				sheet.grid.get_texture(),
+				GL_SRC_ALPHA,
+				GL_ONE_MINUS_SRC_ALPHA,
+				get_default_shader(),
+				group,
+			),
+			position=('f', corners * capacity),
+			colors=('Bn', (0, 0, 0, 0) * capacity * 4),
+			translate=('f', (0, 0, 0) * capacity * 4),
+			scale=('f', (1, 1) * capacity * 4),
+			rotation=('f', (0,) * capacity * 4),
+			tex_coords=('f', self._tex_coords[0] * capacity),
+		)
+
+	def emit(
+		self,
+		count: int,
+		pos: Point2D | None = None,
+		speed: tuple[float, float] = (50, 100),
+		angle: tuple[float, float] = (0, 2 * math.pi),
+		life: tuple[float, float] = (1, 1),
+		frames: Sequence[int | str] = (0,),
+		color: Color = Color.WHITE,
+	) -> None:
+		"""Add particles with random speeds, directions and lives in the given ranges.
+
+		Args:
+			count (int):
+				Number of particles
+			pos (Point2D | None, optional):
+				Position to emit from. If None, uses `.pos`.
+				Defaults to None.
+			speed (tuple[float, float], optional):
+				(min, max) speed, in px/s.
+				Defaults to (50, 100).
+			angle (tuple[float, float], optional):
+				(min, max) direction, in radians.
+				Defaults to (0, 2 * math.pi).
+			life (tuple[float, float], optional):
+				(min, max) life, in seconds.
+				Defaults to (1, 1).
+			frames (Sequence[int | str], optional):
+				Sheet indices (or names) to pick from.
+				Defaults to (0,).
+			color (Color, optional):
+				Color of the particles.
+				Defaults to Color.WHITE.
+		"""
+		x, y = self.pos if pos is None else pos
+		frame_indices = [
+			frame if isinstance(frame, int) else self.sheet.lookup[frame]
+			for frame in frames
+		]
+		tex_coords = self._vertex_list.domain.attrib_name_buffers['tex_coords']
+
+		for i in range(self.count, min(self.count + count, self.capacity)):
+			particle_speed = random.uniform(*speed)
+			particle_angle = random.uniform(*angle)
+			self.x[i], self.y[i] = x, y
+			self.vel_x[i] = math.cos(particle_angle) * particle_speed
+			self.vel_y[i] = math.sin(particle_angle) * particle_speed
+			self.life[i] = self.max_life[i] = random.uniform(*life)
+			self.fade_rate[i] = color.value[3] / self.life[i]
+			self.color[i * 4 : i * 4 + 4] = array('B', color.value)
+
+			self.frame[i] = frame = random.choice(frame_indices)
+			tex_coords.set_region(
+				self._vertex_list.start + i * 4, 4, self._tex_coords[frame]
+			)
+			self.count += 1
+
+	def update(self, dt: float) -> None:
+		"""Move every particle, remove dead ones and write the vertex list.
+
+		Args:
+			dt (float):
+				Time since the last update, in seconds
+		"""
+		count = self.count
+		x, y, vel_x, vel_y = self.x, self.y, self.vel_x, self.vel_y
+		life = self.life
+
+		# Each array is updated with one map over the live particles
+		life[:count] = array('d', map(sub, life[:count], repeat(dt)))
+		if gravity_x := self.gravity[0] * dt:
+			vel_x[:count] = array('d', map(add, vel_x[:count], repeat(gravity_x)))
+		if gravity_y := self.gravity[1] * dt:
+			vel_y[:count] = array('d', map(add, vel_y[:count], repeat(gravity_y)))
+		x[:count] = array('f', map(add, x[:count], map(mul, vel_x[:count], repeat(dt))))
+		y[:count] = array('f', map(add, y[:count], map(mul, vel_y[:count], repeat(dt))))
+
+		# Going backwards, the particle moved into a removed slot is always alive
+		if count and min(life[:count]) <= 0:
+			for i in reversed(
+				list(compress(range(count), map(le, life[:count], repeat(0))))
+			):
+				self._remove(i)
+
+		self._write()
+
+	def clear(self) -> None:
+		"""Remove every particle."""
+		self.count = 0
+		self._write()
+
+	def delete(self) -> None:
+		"""Delete the vertex list. The emitter can't be used afterwards."""
+		self._vertex_list.delete()
+
+	def _remove(self, index: int) -> None:
+		# Move the last particle into the removed slot so the arrays stay packed
+		self.count -= 1
+		last = self.count
+		if index == last:
+			return
+
+		for values in (
+			self.x,
+			self.y,
+			self.vel_x,
+			self.vel_y,
+			self.life,
+			self.max_life,
+			self.fade_rate,
+		):
+			values[index] = values[last]
+		self.color[index * 4 : index * 4 + 4] = self.color[last * 4 : last * 4 + 4]
+
+		if self.frame[index] != self.frame[last]:
+			self.frame[index] = self.frame[last]
+			self._vertex_list.domain.attrib_name_buffers['tex_coords'].set_region(
+				self._vertex_list.start + index * 4,
+				4,
+				self._tex_coords[self.frame[index]],
+			)
+
+	def _write(self) -> None:
+		# Write the positions and colors of every live particle, and hide the
+		# 	particles that died since the last write.
+		# 	Values are laid out with strided slices and copied in one block
+		start, count = self._vertex_list.start, self.count
+
+		if count:
+			# 4 vertices of (x, y, z) per particle
+			translate = array('f', bytes(count * 48))
+			for vertex in range(4):
+				translate[vertex * 3 :: 12] = self.x[:count]
+				translate[vertex * 3 + 1 :: 12] = self.y[:count]
+
+			# 4 vertices of (r, g, b, a) per particle
+			color = self.color[: count * 4]
+			if self.fade:
+				color[3::4] = array(
+					'B', map(int, map(mul, self.life[:count], self.fade_rate[:count]))
+				)
+			# Each color is copied as one 32-bit value per vertex
+			packed = array('I')
+			packed.frombytes(color)
+			colors = array('I', bytes(count * 16))
+			for vertex in range(4):
+				colors[vertex::4] = packed
+
+			self._copy('translate', start, count * 4, translate)
+			self._copy('colors', start, count * 4, colors)
+
+		if self._drawn > count:
+			hidden = self._drawn - count
+			self._copy(
+				'colors', start + count * 4, hidden * 4, array('B', bytes(hidden * 16))
+			)
+		self._drawn = count
+
+	def _copy(self, name: str, start: int, count: int, data: array[Any]) -> None:
+		# Copy an array with the same layout as an attribute straight into its buffer
+		buffer = self._vertex_list.domain.attrib_name_buffers[name]
+		ctypes.memmove(
+			buffer.data_ptr + start * buffer.stride,
+			data.buffer_info()[0],
+			count * buffer.stride,
+		)
+		buffer.invalidate_region(start, count)
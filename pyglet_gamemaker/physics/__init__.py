@@ -0,0 +1,3 @@
+from .world import CollisionWorld
+from .solver import ContactSolver
+from .body import BodySystem, PhysicsBody
\ No newline at end of file
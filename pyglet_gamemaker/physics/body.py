@@ -0,0 +1,265 @@
+"""Module holding BodySystem and PhysicsBody classes.
+
+Use `~pgm.physics.{class}` instead of `~pgm.physics.body.{class}`
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+from ..shapes.hitbox import HitboxRender, HitboxRenderCircle
+from .solver import get_inv_mass
+
+if TYPE_CHECKING:
+	from ..shapes.compound import CompoundHitbox
+	from ..shapes.hitbox import Hitbox
+	from ..types import Point2D
+	from .world import Collider
+
+
+class PhysicsBody:
+	"""A handle to one body in a `BodySystem`.
+
+	The state lives in the system's arrays; the properties read and write it there.
+	Create using `~pgm.physics.BodySystem.add`.
+	"""
+
+	system: BodySystem
+	"""The system holding the body"""
+	index: int
+	"""Index of the body in the system's arrays. Changes when other bodies are removed."""
+	obj: Collider
+	"""The object moved by the body"""
+
+	def __init__(self, system: BodySystem, index: int, obj: Collider) -> None:
+		"""Create a handle to a body. Use `~pgm.physics.BodySystem.add` instead.
+
+		Args:
+			system (BodySystem):
+				The system holding the body
+			index (int):
+				Index of the body in the system's arrays
+			obj (Collider):
+				The object moved by the body
+		"""
+		self.system, self.index, self.obj = system, index, obj
+
+	def apply_impulse(self, impulse: Point2D) -> None:
+		"""Change velocity by an impulse, scaled by the inverse mass.
+
+		Args:
+			impulse (Point2D):
+				The impulse to apply
+		"""
+		inv_mass = self.system.inv_mass[self.index]
+		self.system.vel_x[self.index] += impulse[0] * inv_mass
+		self.system.vel_y[self.index] += impulse[1] * inv_mass
+
+	@property
+	def vel(self) -> Point2D:
+		"""The velocity, in px/s."""
+		return self.system.vel_x[self.index], self.system.vel_y[self.index]
+
+	@vel.setter
+	def vel(self, val: Point2D) -> None:
+		self.system.vel_x[self.index], self.system.vel_y[self.index] = val
+
+	@property
+	def angular_vel(self) -> float:
+		"""The angular velocity, in radians/s."""
+		return self.system.angular_vel[self.index]
+
+	@angular_vel.setter
+	def angular_vel(self, val: float) -> None:
+		self.system.angular_vel[self.index] = val
+
+	@property
+	def mass(self) -> float:
+		"""The mass. Static bodies have infinite mass (set with `float('inf')` or 0)."""
+		inv_mass = self.system.inv_mass[self.index]
+		return 1 / inv_mass if inv_mass else float('inf')
+
+	@mass.setter
+	def mass(self, val: float) -> None:
+		self.system.inv_mass[self.index] = get_inv_mass(val)
+
+	@property
+	def damping(self) -> float:
+		"""The fraction of velocity lost per second."""
+		return self.system.damping[self.index]
+
+	@damping.setter
+	def damping(self, val: float) -> None:
+		self.system.damping[self.index] = val
+
+
+class BodySystem:
+	"""Moves many objects by velocity in one step.
+
+	The state of every body is stored in flat arrays (one value per body), and
+	`.step` integrates all of them together, then pushes each new transform to its
+	object with a single coordinate update.
+
+	The position and angle of each object are read back at the start of `.step`, so
+	objects moved elsewhere (ex. by `~pgm.physics.ContactSolver`) stay in sync.
+
+	Add bodies using `.add` and remove using `.remove`.
+	"""
+
+	gravity: Point2D
+	"""Acceleration applied to every non-static body, in px/s^2"""
+	bodies: list[PhysicsBody]
+	"""Stores all bodies, in array order"""
+
+	x: array[float]
+	"""x position of each body"""
+	y: array[float]
+	"""y position of each body"""
+	angle: array[float]
+	"""Angle, in radians, of each body"""
+	vel_x: array[float]
+	"""x velocity of each body, in px/s"""
+	vel_y: array[float]
+	"""y velocity of each body, in px/s"""
+	angular_vel: array[float]
+	"""Angular velocity of each body, in radians/s"""
+	inv_mass: array[float]
+	"""Inverse mass of each body (0 if static)"""
+	damping: array[float]
+	"""Fraction of velocity lost per second of each body"""
+
+	def __init__(self, gravity: Point2D = (0, 0)) -> None:
+		"""Create a body system.
+
+		Args:
+			gravity (Point2D, optional):
+				Acceleration applied to every non-static body, in px/s^2.
+				Defaults to (0, 0).
+		"""
+		self.gravity = gravity
+		self.bodies = []
+
+		self.x, self.y, self.angle = array('d'), array('d'), array('d')
+		self.vel_x, self.vel_y, self.angular_vel = array('d'), array('d'), array('d')
+		self.inv_mass, self.damping = array('d'), array('d')
+
+	def add(
+		self,
+		obj: Collider,
+		vel: Point2D = (0, 0),
+		angular_vel: float = 0,
+		mass: float = 1,
+		damping: float = 0,
+	) -> PhysicsBody:
+		"""Add a body moving an object.
+
+		Args:
+			obj (Collider):
+				The object to move
+			vel (Point2D, optional):
+				Starting velocity, in px/s.
+				Defaults to (0, 0).
+			angular_vel (float, optional):
+				Starting angular velocity, in radians/s.
+				Defaults to 0.
+			mass (float, optional):
+				Mass of the body. Use `float('inf')` (or 0) for a static body, which
+				ignores gravity and impulses but still moves by its own velocity.
+				Defaults to 1.
+			damping (float, optional):
+				Fraction of velocity lost per second.
+				Defaults to 0.
+
+		Returns:
+			PhysicsBody: A handle to the body
+		"""
+		target = self._get_target(obj)
+		self.x.append(target._trans_pos[0])
+		self.y.append(target._trans_pos[1])
+		self.angle.append(target._angle)
+		self.vel_x.append(vel[0])
+		self.vel_y.append(vel[1])
+		self.angular_vel.append(angular_vel)
+		self.inv_mass.append(get_inv_mass(mass))
+		self.damping.append(damping)
+
+		body = PhysicsBody(self, len(self.bodies), obj)
+		self.bodies.append(body)
+		return body
+
+	def remove(self, body: PhysicsBody) -> None:
+		"""Remove a body. The object is left where it is.
+
+		Args:
+			body (PhysicsBody):
+				The body to remove. Must be in the system (not removed already).
+		"""
+		# A stale handle's index may point at another live body
+		if body.index >= len(self.bodies) or self.bodies[body.index] is not body:
+			raise ValueError('PhysicsBody is not in this BodySystem.')
+
+		# Move the last body into the removed slot so the arrays stay packed
+		index, last = body.index, len(self.bodies) - 1
+		for values in (
+			self.x,
+			self.y,
+			self.angle,
+			self.vel_x,
+			self.vel_y,
+			self.angular_vel,
+			self.inv_mass,
+			self.damping,
+		):
+			values[index] = values[last]
+			values.pop()
+
+		self.bodies[index] = self.bodies[last]
+		self.bodies[index].index = index
+		self.bodies.pop()
+
+	def step(self, dt: float) -> None:
+		"""Integrate every body and move their objects.
+
+		Args:
+			dt (float):
+				Time since the last step, in seconds
+		"""
+		targets = [self._get_target(body.obj) for body in self.bodies]
+		x, y, angle = self.x, self.y, self.angle
+		vel_x, vel_y, angular_vel = self.vel_x, self.vel_y, self.angular_vel
+		gravity_x, gravity_y = self.gravity[0] * dt, self.gravity[1] * dt
+
+		for i, target in enumerate(targets):
+			# Pick up any changes made to the object since the last step
+			x[i], y[i] = target._trans_pos
+			angle[i] = target._angle
+
+			# Semi-implicit Euler: update velocity first, then position
+			if self.inv_mass[i]:
+				vel_x[i] += gravity_x
+				vel_y[i] += gravity_y
+			if damping := self.damping[i]:
+				scale = 1 / (1 + damping * dt)
+				vel_x[i] *= scale
+				vel_y[i] *= scale
+				angular_vel[i] *= scale
+
+			x[i] += vel_x[i] * dt
+			y[i] += vel_y[i] * dt
+			angle[i] += angular_vel[i] * dt
+
+		# One coordinate update per object
+		for body, target, new_x, new_y, new_angle in zip(
+			self.bodies, targets, x, y, angle
+		):
+			target._trans_pos = new_x, new_y
+			target._angle = new_angle
+			body.obj._calc_coords()
+
+	@staticmethod
+	def _get_target(obj: Collider) -> Hitbox | CompoundHitbox:
+		# Get the object holding the transform
+		if isinstance(obj, HitboxRender | HitboxRenderCircle):
+			return obj.hitbox
+		return obj
@@ -0,0 +1,153 @@
+"""Module holding ContactSolver class.
+
+Use `~pgm.physics.ContactSolver` instead of `~pgm.physics.solver.ContactSolver`
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from collections.abc import Collection, Iterable, Mapping
+
+	from pyglet.math import Vec2
+
+	from .world import Collider
+
+
+class ContactSolver:
+	"""Pushes overlapping objects apart using all contacts at once.
+
+	Applying each MTV one at a time makes piles jitter, since fixing one pair pushes
+	an object into its neighbour. Instead, every contact is relaxed over a fixed number
+	of iterations, so corrections spread through the pile, and each object is moved
+	once at the end.
+
+	Corrections are split between the objects by inverse mass. Static objects (and
+	objects with a mass of 0, which is infinite) never move.
+
+	Use `.solve` with contacts from `~pgm.physics.CollisionWorld.get_contacts`
+	or from `~pgm.shapes.Hitbox.collide`.
+	"""
+
+	iterations: int
+	"""Number of relaxation iterations per solve"""
+	slop: float
+	"""Penetration depth that is allowed to remain (stops resting contacts from jittering)"""
+
+	def __init__(self, iterations: int = 8, slop: float = 0.01) -> None:
+		"""Create a contact solver.
+
+		Args:
+			iterations (int, optional):
+				Number of relaxation iterations per solve.
+				More iterations settle larger piles.
+				Defaults to 8.
+			slop (float, optional):
+				Penetration depth that is allowed to remain.
+				Defaults to 0.01.
+		"""
+		self.iterations = iterations
+		self.slop = slop
+
+	def solve(
+		self,
+		contacts: Iterable[tuple[Collider, Collider, Vec2]],
+		masses: Mapping[Collider, float] | None = None,
+		static: Collection[Collider] = (),
+	) -> None:
+		"""Move the objects of every contact out of each other.
+
+		Args:
+			contacts (Iterable[tuple[Collider, Collider, Vec2]]):
+				Each contact as (object a, object b, MTV moving a out of b)
+			masses (Mapping[Collider, float] | None, optional):
+				Mass of each object. Objects not included have a mass of 1.
+				A mass of 0 is infinite (the object is static).
+				Defaults to None.
+			static (Collection[Collider], optional):
+				Objects that never move.
+				Defaults to ().
+		"""
+		masses = masses or {}
+
+		# Index every object once and store its state in arrays
+		objects: list[Collider] = []
+		indices: dict[int, int] = {}
+		inv_masses = array('d')
+
+		# Contacts as (index a, index b, normal x, normal y, depth)
+		contact_a, contact_b = array('l'), array('l')
+		normal_x, normal_y, depths = array('d'), array('d'), array('d')
+
+		for a, b, MTV in contacts:
+			if not (depth := MTV.length()):
+				continue
+			for obj in a, b:
+				if id(obj) not in indices:
+					indices[id(obj)] = len(objects)
+					objects.append(obj)
+					inv_masses.append(self._get_inv_mass(obj, masses, static))
+			contact_a.append(indices[id(a)])
+			contact_b.append(indices[id(b)])
+			normal_x.append(MTV.x / depth)
+			normal_y.append(MTV.y / depth)
+			depths.append(depth)
+
+		# Total correction of each object
+		move_x = array('d', [0]) * len(objects)
+		move_y = array('d', [0]) * len(objects)
+
+		for _ in range(self.iterations):
+			for i in range(len(depths)):
+				a_index, b_index = contact_a[i], contact_b[i]
+				inv_mass_a, inv_mass_b = inv_masses[a_index], inv_masses[b_index]
+				if not inv_mass_a + inv_mass_b:
+					continue
+
+				# Penetration left after the corrections so far
+				remaining = (
+					depths[i]
+					- (move_x[a_index] - move_x[b_index]) * normal_x[i]
+					- (move_y[a_index] - move_y[b_index]) * normal_y[i]
+				)
+				if remaining <= self.slop:
+					continue
+
+				correction = (remaining - self.slop) / (inv_mass_a + inv_mass_b)
+				move_x[a_index] += normal_x[i] * correction * inv_mass_a
+				move_y[a_index] += normal_y[i] * correction * inv_mass_a
+				move_x[b_index] -= normal_x[i] * correction * inv_mass_b
+				move_y[b_index] -= normal_y[i] * correction * inv_mass_b
+
+		# One transform update per moved object
+		for obj, x, y in zip(objects, move_x, move_y):
+			if x or y:
+				obj.pos = obj.pos[0] + x, obj.pos[1] + y
+
+	@staticmethod
+	def _get_inv_mass(
+		obj: Collider, masses: Mapping[Collider, float], static: Collection[Collider]
+	) -> float:
+		# Static objects have infinite mass
+		if obj in static:
+			return 0
+		return get_inv_mass(masses.get(obj, 1))
+
+
+def get_inv_mass(mass: float) -> float:
+	"""Get the inverse mass used to split corrections and impulses.
+
+	A mass of 0 is treated as infinite (static), like `float('inf')`.
+
+	Args:
+		mass (float):
+			The mass. Must not be negative.
+
+	Returns:
+		float: The inverse mass (0 if static)
+	"""
+	if mass < 0:
+		raise ValueError(f'Mass must not be negative ({mass} passed).')
+	return 1 / mass if mass else 0
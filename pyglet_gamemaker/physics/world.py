@@ -0,0 +1,211 @@
+"""Module holding CollisionWorld class.
+
+Use `~pgm.physics.CollisionWorld` instead of `~pgm.physics.world.CollisionWorld`
+"""
+
+from __future__ import annotations
+
+import math
+from itertools import count
+from typing import TYPE_CHECKING
+
+from pyglet.event import EventDispatcher
+
+from ..shapes.compound import CompoundHitbox
+from ..shapes.hitbox import Hitbox
+
+if TYPE_CHECKING:
+	from pyglet.math import Vec2
+
+	from ..shapes.hitbox import HitboxRender, HitboxRenderCircle
+	from ..types import EventHandler
+
+	Collider = Hitbox | HitboxRender | HitboxRenderCircle | CompoundHitbox
+
+
+class CollisionWorld(EventDispatcher):
+	"""Finds every colliding pair of objects each frame and dispatches changes.
+
+	Add objects using `.add` and remove using `.remove`. Call `.update` once per frame.
+
+	Objects are given integer IDs, and each pair is stored as one integer key, so
+	comparing this frame's pairs with last frame's only costs the number of contacts.
+	Candidate pairs come from a uniform grid of `cell_size` px cells.
+
+	Dispatches:
+	- `on_collision_enter` when a pair starts colliding.
+		- Args: object a, object b, MTV moving a out of b
+	- `on_collision_stay` when a pair is still colliding.
+		- Args: object a, object b, MTV moving a out of b
+	- `on_collision_exit` when a pair stops colliding.
+		- Args: object a, object b
+
+	Object a is always the one added first.
+
+	Use kwargs to attach event handlers.
+	"""
+
+	cell_size: float
+	"""Size of the grid cells used to find candidate pairs"""
+	objects: dict[int, Collider]
+	"""Stores all objects in the world {id: object}"""
+	contacts: dict[int, Vec2]
+	"""The colliding pairs from the last `.update` {pair key: MTV}"""
+
+	_ids: dict[int, int]
+	"""Converts `id()` of each object to its ID in the world"""
+	_next_id: count[int]
+	"""Generates new IDs"""
+
+	def __init__(self, cell_size: float = 64, **kwargs: EventHandler) -> None:
+		"""Create a collision world.
+
+		Args:
+			cell_size (float, optional):
+				Size of the grid cells used to find candidate pairs.
+				Should be about the size of a typical object.
+				Defaults to 64.
+			**kwargs (EventHandler):
+				Event handlers to attach (name=func)
+		"""
+		self.cell_size = cell_size
+		self.objects = {}
+		self.contacts = {}
+		self._ids = {}
+		self._next_id = count()
+
+		self.push_handlers(**kwargs)
+
+	def add(self, obj: Collider) -> int:
+		"""Add an object to the world.
+
+		Args:
+			obj (Collider):
+				The object to add
+
+		Returns:
+			int: The ID of the object
+		"""
+		self._ids[id(obj)] = obj_id = next(self._next_id)
+		self.objects[obj_id] = obj
+		return obj_id
+
+	def remove(self, obj: Collider) -> None:
+		"""Remove an object from the world.
+
+		Its contacts are dropped without dispatching `on_collision_exit`.
+
+		Args:
+			obj (Collider):
+				The object to remove
+		"""
+		obj_id = self._ids.pop(id(obj))
+		del self.objects[obj_id]
+		self.contacts = {
+			key: MTV
+			for key, MTV in self.contacts.items()
+			if obj_id not in self._split_key(key)
+		}
+
+	def get_id(self, obj: Collider) -> int:
+		"""Get the ID of an object in the world.
+
+		Args:
+			obj (Collider):
+				The object
+
+		Returns:
+			int: The ID of the object
+		"""
+		return self._ids[id(obj)]
+
+	def get_contacts(self) -> list[tuple[Collider, Collider, Vec2]]:
+		"""Get the colliding pairs from the last `.update`.
+
+		Returns:
+			list[tuple[Collider, Collider, Vec2]]: Each contact as
+				(object a, object b, MTV moving a out of b)
+		"""
+		contacts = []
+		for key, MTV in self.contacts.items():
+			a_id, b_id = self._split_key(key)
+			contacts.append((self.objects[a_id], self.objects[b_id], MTV))
+		return contacts
+
+	def update(self) -> None:
+		"""Find the colliding pairs and dispatch changes since the last update."""
+		contacts = {}
+		for key in self._get_candidates():
+			a_id, b_id = self._split_key(key)
+			if (
+				MTV := self._collide(self.objects[a_id], self.objects[b_id])
+			) is not None:
+				contacts[key] = MTV
+
+		previous, self.contacts = self.contacts, contacts
+
+		for key, MTV in contacts.items():
+			a_id, b_id = self._split_key(key)
+			event = 'on_collision_stay' if key in previous else 'on_collision_enter'
+			self.dispatch_event(event, self.objects[a_id], self.objects[b_id], MTV)
+
+		for key in previous.keys() - contacts.keys():
+			a_id, b_id = self._split_key(key)
+			self.dispatch_event(
+				'on_collision_exit', self.objects[a_id], self.objects[b_id]
+			)
+
+	def _get_candidates(self) -> set[int]:
+		# Get the keys of all pairs sharing a grid cell
+		cells: dict[tuple[int, int], list[int]] = {}
+		candidates: set[int] = set()
+
+		for obj_id, obj in self.objects.items():
+			min_x, min_y, max_x, max_y = self._get_bounds(obj)
+			for cell_x in range(
+				math.floor(min_x / self.cell_size),
+				math.floor(max_x / self.cell_size) + 1,
+			):
+				for cell_y in range(
+					math.floor(min_y / self.cell_size),
+					math.floor(max_y / self.cell_size) + 1,
+				):
+					cell = cells.setdefault((cell_x, cell_y), [])
+					# IDs are added in increasing order, so other_id < obj_id
+					candidates.update(
+						self._make_key(other_id, obj_id) for other_id in cell
+					)
+					cell.append(obj_id)
+
+		return candidates
+
+	@staticmethod
+	def _collide(a: Collider, b: Collider) -> Vec2 | None:
+		# Get the MTV moving a out of b, or None if no collision
+		if isinstance(a, CompoundHitbox):
+			return a.collide(b)[1]
+		# Only compounds can collide with compounds, so flip the MTV
+		if isinstance(b, CompoundHitbox):
+			MTV = b.collide(a)[1]
+			return None if MTV is None else -MTV
+		return a.collide(b)[1]
+
+	@staticmethod
+	def _get_bounds(obj: Collider) -> tuple[float, float, float, float]:
+		if isinstance(obj, Hitbox | CompoundHitbox):
+			return obj.bounds
+		return obj.hitbox.bounds
+
+	@staticmethod
+	def _make_key(a_id: int, b_id: int) -> int:
+		# Pack a pair of IDs (a_id < b_id) into one integer
+		return a_id << 32 | b_id
+
+	@staticmethod
+	def _split_key(key: int) -> tuple[int, int]:
+		return key >> 32, key & 0xFFFFFFFF
+
+
+CollisionWorld.register_event_type('on_collision_enter')
+CollisionWorld.register_event_type('on_collision_stay')
+CollisionWorld.register_event_type('on_collision_exit')
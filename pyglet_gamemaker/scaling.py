@@ -0,0 +1,301 @@
+"""Module holding ScaledFrameCache class."""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from itertools import repeat
+from operator import add, mul
+from typing import TYPE_CHECKING, cast
+
+from pyglet.gl import (
+	GL_COLOR_ATTACHMENT0,
+	GL_PACK_ALIGNMENT,
+	GL_READ_FRAMEBUFFER,
+	GL_READ_FRAMEBUFFER_BINDING,
+	GL_RGBA,
+	GL_UNSIGNED_BYTE,
+	GLint,
+	GLubyte,
+	GLuint,
+	glBindFramebuffer,
+	glDeleteFramebuffers,
+	glFramebufferTexture2D,
+	glGenFramebuffers,
+	glGetIntegerv,
+	glPixelStorei,
+	glReadPixels,
+)
+from pyglet.image import ImageData, Texture
+
+if TYPE_CHECKING:
+	from collections.abc import Sequence
+
+	from pyglet.image import TextureRegion
+
+	from .sprite import SpriteSheet
+
+
+class ScaledFrameCache:
+	"""Pre-scaled copies of sprite sheet frames, made once and kept within a memory budget.
+
+	Stretching a frame on the GPU blurs it. Instead, every frame of a sheet is resized
+	on the CPU with a triangle filter (widened when shrinking, so every source pixel
+	is averaged in), with premultiplied alpha so edges don't darken.
+
+	The frames of one (sheet, scale) pair are packed together into one texture, so
+	sprites using them still share a draw call. When the textures take more than
+	`budget` bytes, the least recently used ones are dropped (and remade if needed).
+
+	Use `~pgm.sprite.SpriteSheet.scaled` to get frames from the shared cache.
+	"""
+
+	budget: int
+	"""Most bytes of scaled textures to keep"""
+	used: int = 0
+	"""Bytes of scaled textures kept"""
+	evictions: int = 0
+	"""Number of scaled textures dropped to stay within the budget"""
+
+	_variants: OrderedDict[tuple[SpriteSheet, float], tuple[list[TextureRegion], int]]
+	"""Holds (frames, bytes) of every (sheet, scale), least recently used first"""
+
+	def __init__(self, budget: int = 64 * 1024 * 1024) -> None:
+		"""Create a scaled frame cache.
+
+		Args:
+			budget (int, optional):
+				Most bytes of scaled textures to keep.
+				Defaults to 64 MiB.
+		"""
+		self.budget = budget
+		self._variants = OrderedDict()
+
+	def get(self, sheet: SpriteSheet, index: int | str, scale: float) -> TextureRegion:
+		"""Get a frame of a sheet scaled by `scale`, making every scaled frame if needed.
+
+		Args:
+			sheet (SpriteSheet):
+				The sprite sheet
+			index (int | str):
+				Sheet index (or name) of the frame
+			scale (float):
+				Scale factor
+
+		Returns:
+			TextureRegion: The scaled frame
+		"""
+		index = index if isinstance(index, int) else sheet.lookup[index]
+		return self.get_frames(sheet, scale)[index]
+
+	def get_frames(self, sheet: SpriteSheet, scale: float) -> list[TextureRegion]:
+		"""Get every frame of a sheet scaled by `scale`, making them if needed.
+
+		Args:
+			sheet (SpriteSheet):
+				The sprite sheet
+			scale (float):
+				Scale factor
+
+		Returns:
+			list[TextureRegion]: The scaled frames, in sheet order
+		"""
+		key = sheet, scale
+		if key in self._variants:
+			self._variants.move_to_end(key)
+			return self._variants[key][0]
+
+		frames, size = self._make(cast('list[TextureRegion]', sheet[:]), scale)
+		self._variants[key] = frames, size
+		self.used += size
+
+		# Never drop the variant just made, even if it is over the budget alone
+		while self.used > self.budget and len(self._variants) > 1:
+			_, (_, size) = self._variants.popitem(last=False)
+			self.used -= size
+			self.evictions += 1
+		return frames
+
+	def discard(self, sheet: SpriteSheet) -> None:
+		"""Drop every scaled texture of a sheet.
+
+		Args:
+			sheet (SpriteSheet):
+				The sprite sheet
+		"""
+		for key in [key for key in self._variants if key[0] is sheet]:
+			self.used -= self._variants.pop(key)[1]
+
+	def get_bytes(self, sheet: SpriteSheet) -> int:
+		"""Get the bytes of scaled textures kept for a sheet.
+
+		Args:
+			sheet (SpriteSheet):
+				The sprite sheet
+
+		Returns:
+			int: The bytes
+		"""
+		return sum(
+			size for (key, _), (_, size) in self._variants.items() if key is sheet
+		)
+
+	def clear(self) -> None:
+		"""Drop every scaled texture."""
+		self._variants.clear()
+		self.used = 0
+
+	@staticmethod
+	def _make(
+		frames: Sequence[TextureRegion], scale: float
+	) -> tuple[list[TextureRegion], int]:
+		# Scale every frame and pack them into one texture, like `AtlasBuilder`
+		# 	Only the area holding the frames is read back (not a whole atlas page)
+		left = min(frame.x for frame in frames)
+		bottom = min(frame.y for frame in frames)
+		pitch = (max(frame.x + frame.width for frame in frames) - left) * 4
+		pixels = _read_pixels(
+			frames[0].owner,
+			left,
+			bottom,
+			pitch // 4,
+			max(frame.y + frame.height for frame in frames) - bottom,
+		)
+
+		scaled = []
+		for frame in frames:
+			width = max(round(frame.width * scale), 1)
+			height = max(round(frame.height * scale), 1)
+			frame_pixels = b''.join(
+				pixels[start : start + frame.width * 4]
+				for start in range(
+					(frame.y - bottom) * pitch + (frame.x - left) * 4,
+					(frame.y - bottom + frame.height) * pitch,
+					pitch,
+				)
+			)
+			scaled.append(
+				(
+					width,
+					height,
+					_resample(frame_pixels, frame.width, frame.height, width, height),
+				)
+			)
+
+		# Shelf packing with 1 px between frames, in a texture of about square area
+		tex_width = max(
+			max(width for width, _, _ in scaled) + 1,
+			math.ceil(math.sqrt(sum((w + 1) * (h + 1) for w, h, _ in scaled))),
+		)
+		positions = [(0, 0)] * len(scaled)
+		shelf_x = shelf_y = shelf_height = 0
+		for i in sorted(range(len(scaled)), key=lambda i: -scaled[i][1]):
+			width, height, _ = scaled[i]
+			if shelf_x + width > tex_width:
+				shelf_x, shelf_y = 0, shelf_y + shelf_height + 1
+				shelf_height = 0
+			positions[i] = shelf_x, shelf_y
+			shelf_x += width + 1
+			shelf_height = max(shelf_height, height)
+		tex_height = shelf_y + shelf_height
+
+		page = Texture.create(tex_width, tex_height)
+		regions = []
+		for frame, (width, height, frame_pixels), (x, y) in zip(
+			frames, scaled, positions
+		):
+			page.blit_into(ImageData(width, height, 'RGBA', frame_pixels), x, y, 0)
+			region = page.get_region(x, y, width, height)
+			region.anchor_x = round(frame.anchor_x * scale)
+			region.anchor_y = round(frame.anchor_y * scale)
+			regions.append(region)
+
+		return regions, tex_width * tex_height * 4
+
+
+def _read_pixels(texture: Texture, x: int, y: int, width: int, height: int) -> bytes:
+	# Read part of a texture back from the GPU as RGBA, through a framebuffer
+	pixels = (GLubyte * (width * height * 4))()
+	previous = GLint()
+	glGetIntegerv(GL_READ_FRAMEBUFFER_BINDING, previous)
+	framebuffer = GLuint()
+	glGenFramebuffers(1, framebuffer)
+
+	glBindFramebuffer(GL_READ_FRAMEBUFFER, framebuffer.value)
+	glFramebufferTexture2D(
+		GL_READ_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, texture.target, texture.id, 0
+	)
+	glPixelStorei(GL_PACK_ALIGNMENT, 1)
+	glReadPixels(x, y, width, height, GL_RGBA, GL_UNSIGNED_BYTE, pixels)
+
+	glBindFramebuffer(GL_READ_FRAMEBUFFER, previous.value)
+	glDeleteFramebuffers(1, framebuffer)
+	return bytes(pixels)
+
+
+def _get_weights(size: int, new_size: int) -> list[tuple[int, list[float]]]:
+	# Get (first source pixel, weights) of every resized pixel along one axis
+	scale = new_size / size
+	# Shrinking widens the filter so every source pixel is used
+	support = max(1 / scale, 1)
+
+	weights = []
+	for i in range(new_size):
+		center = (i + 0.5) / scale
+		first = max(math.floor(center - support), 0)
+		last = min(math.ceil(center + support), size)
+		pixel_weights = [
+			max(1 - abs((j + 0.5 - center) / support), 0) for j in range(first, last)
+		]
+		total = sum(pixel_weights)
+		weights.append((first, [weight / total for weight in pixel_weights]))
+	return weights
+
+
+def _resample(
+	pixels: bytes, width: int, height: int, new_width: int, new_height: int
+) -> bytes:
+	# Resize RGBA pixels with a separable triangle filter, one channel at a time
+	alpha = list(pixels[3::4])
+	channels = [
+		# Premultiplied, so transparent pixels don't bleed their color
+		[value * a / 255 for value, a in zip(pixels[channel::4], alpha)]
+		for channel in range(3)
+	]
+	channels.append([float(a) for a in alpha])
+
+	x_weights = _get_weights(width, new_width)
+	y_weights = _get_weights(height, new_height)
+
+	resized = []
+	for channel in channels:
+		# Horizontal pass, row by row
+		rows = []
+		for y in range(height):
+			row = channel[y * width : (y + 1) * width]
+			rows.append(
+				[
+					sum(map(mul, row[first : first + len(weights)], weights))
+					for first, weights in x_weights
+				]
+			)
+
+		# Vertical pass, adding whole weighted rows
+		new_channel: list[float] = []
+		for first, weights in y_weights:
+			new_row = [0.0] * new_width
+			for row, weight in zip(rows[first : first + len(weights)], weights):
+				new_row = list(map(add, new_row, map(mul, row, repeat(weight))))
+			new_channel += new_row
+		resized.append(new_channel)
+
+	new_pixels = bytearray(new_width * new_height * 4)
+	new_alpha = resized[3]
+	for index in range(3):
+		new_pixels[index::4] = bytes(
+			# Back from premultiplied
+			min(round(value * 255 / a), 255) if a >= 0.5 else 0
+			for value, a in zip(resized[index], new_alpha)
+		)
+	new_pixels[3::4] = bytes(min(round(a), 255) for a in new_alpha)
+	return bytes(new_pixels)
@@ -11,15 +11,18 @@ from typing import TYPE_CHECKING
 from pyglet.event import EventDispatcher
 from pyglet.graphics import Batch, Group
 
+from .animation import Animator
 from .gui.button import Button
 from .gui.text import Text
 from .gui.text_button import TextButton
 from .shapes.rect import Rect
+from .sprite import SpritePool, SpriteSheet
 from .types import Color
 
 if TYPE_CHECKING:
+	from pyglet.image import AbstractImage
+
 	from .gui.widget import Widget
-	from .sprite import SpriteSheet
 	from .types import Anchor, EventHandler, FontInfo
 	from .window import Window
 
@@ -34,6 +37,11 @@ class Scene(ABC, EventDispatcher):
 	- `.enable()`: Enable scene (not rendering, just logic)
 	- `.disable()`: Disable scene (not rendering, just logic)
 
+	Optional Methods:
+	- `.update(dt)`: Game logic, run by the window at a fixed rate
+	- `.on_draw(alpha)`: Runs before drawing the batch. Use alpha to interpolate
+		render positions between the last two updates
+
 	Constants to set:
 	- `.WIDGET_POS`: Positions of widgets as scale to window (see `.WIDGET_POS`)
 	- `.default_font_info`: The default font information used if none passed into methods
@@ -87,6 +95,10 @@ class Scene(ABC, EventDispatcher):
 	"""Rendering subgroup for the text"""
 	widgets: dict[str, Widget]
 	"""Stores all widgets in the menu"""
+	sheets: list[SpriteSheet]
+	"""Stores all sprite sheets loaded with `.load_sheet`"""
+	animator: Animator
+	"""Plays the animations of the scene. Updated by the window after `.update`"""
 
 	def __init__(self, name: str, **kwargs: EventHandler) -> None:
 		"""Create a scene.
@@ -100,6 +112,8 @@ class Scene(ABC, EventDispatcher):
 		self.name = name
 		self.event_handlers = {}
 		self.widgets = {}
+		self.sheets = []
+		self.animator = Animator()
 
 		self.batch = Batch()
 		self.main_group = Group(0)
@@ -143,6 +157,32 @@ class Scene(ABC, EventDispatcher):
 		for name in args:
 			self.remove_handler(name, self.event_handlers.pop(name))
 
+	def load_sheet(self, file_path: str, rows: int, cols: int) -> SpriteSheet:
+		"""Load a sprite sheet shared with other scenes (see `~pgm.sprite.SpriteSheet.load`).
+
+		It is released when the scene is popped from the window.
+
+		Args:
+			file_path (str):
+				The path to the sprite sheet
+			rows (int):
+				The number of rows for sprites
+			cols (int):
+				The number of columns for sprites
+
+		Returns:
+			SpriteSheet: The shared sprite sheet
+		"""
+		sheet = SpriteSheet.load(file_path, rows, cols)
+		self.sheets.append(sheet)
+		return sheet
+
+	def release_sheets(self) -> None:
+		"""Release every sprite sheet loaded with `.load_sheet`."""
+		for sheet in self.sheets:
+			sheet.release()
+		self.sheets.clear()
+
 	def create_bg(self, color: Color) -> Rect:
 		"""Create a solid background for the menu.
 
@@ -212,6 +252,8 @@ class Scene(ABC, EventDispatcher):
 		anchor: Anchor = (0, 0),
 		dispatch: bool = True,
 		attach_events: bool = True,
+		size: tuple[int, int] | None = None,
+		nine_slice: tuple[int, int, int, int] | None = None,
 		**kwargs: EventHandler,
 	) -> None:
 		"""Create a button widget.
@@ -233,6 +275,12 @@ class Scene(ABC, EventDispatcher):
 				If False, don't attach mouse events to window.
 				Event handlers can still be manually invoked.
 				Defaults to True.
+			size (tuple[int, int] | None, optional):
+				Size to stretch the button images to. See `~pgm.gui.Button` for more info.
+				Defaults to None.
+			nine_slice (tuple[int, int, int, int] | None, optional):
+				Size of the image borders kept unstretched. See `~pgm.gui.Button` for more info.
+				Defaults to None.
 			**kwargs (EventHandler):
 				Name-function pair(s) representing handlers
 		"""
@@ -248,6 +296,8 @@ class Scene(ABC, EventDispatcher):
 			anchor,
 			dispatch,
 			attach_events,
+			size,
+			nine_slice,
 			**kwargs,
 		)
 		button.disable()
@@ -265,6 +315,8 @@ class Scene(ABC, EventDispatcher):
 		hover_enlarge: int = 0,
 		dispatch: bool = True,
 		attach_events: bool = True,
+		size: tuple[int, int] | None = None,
+		nine_slice: tuple[int, int, int, int] | None = None,
 		**kwargs: EventHandler,
 	) -> None:
 		"""Create a text button widget.
@@ -300,6 +352,12 @@ class Scene(ABC, EventDispatcher):
 				If False, don't attach mouse events to window.
 				Event handlers can still be manually invoked.
 				Defaults to True.
+			size (tuple[int, int] | None, optional):
+				Size to stretch the button images to. See `~pgm.gui.Button` for more info.
+				Defaults to None.
+			nine_slice (tuple[int, int, int, int] | None, optional):
+				Size of the image borders kept unstretched. See `~pgm.gui.Button` for more info.
+				Defaults to None.
 			**kwargs (EventHandler):
 				Name-function pair(s) representing handlers
 		"""
@@ -325,10 +383,55 @@ class Scene(ABC, EventDispatcher):
 			hover_enlarge,
 			dispatch,
 			attach_events,
+			size,
+			nine_slice,
 			**kwargs,
 		)
 		text_button.disable()
 
+	def create_sprite_pool(
+		self,
+		image: AbstractImage,
+		size: int = 64,
+		block_size: int = 64,
+		group: Group | None = None,
+	) -> SpritePool:
+		"""Create a pool of reusable sprites drawn on the scene's batch.
+
+		Args:
+			image (AbstractImage):
+				The image of new sprites (ex. a frame of a `~pgm.sprite.SpriteSheet`)
+			size (int, optional):
+				Number of sprites to create at the start.
+				Defaults to 64.
+			block_size (int, optional):
+				Number of sprites created when the pool runs out.
+				Defaults to 64.
+			group (Group | None, optional):
+				Group for rendering. If None, uses `.main_group`.
+				Defaults to None.
+
+		Returns:
+			SpritePool: The pool
+		"""
+		return SpritePool(image, self.batch, group or self.main_group, size, block_size)
+
+	def update(self, dt: float) -> None:
+		"""Update the scene logic. Called by the window at a fixed rate.
+
+		Args:
+			dt (float):
+				The fixed time step, in seconds
+		"""
+
+	def on_draw(self, alpha: float) -> None:
+		"""Prepare the scene for drawing. Called by the window before drawing the batch.
+
+		Args:
+			alpha (float):
+				How far (0-1) the time is between the last update and the next one
+		"""
+
 	@abstractmethod
 	def initialize(self) -> None:
 		"""Initialize the scene."""
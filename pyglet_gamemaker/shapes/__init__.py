@@ -1,2 +1,5 @@
-from .hitbox import Hitbox, HitboxRender, HitboxCircle, HitboxRenderCircle
-from .rect import Rect
\ No newline at end of file
+from .hitbox import Hitbox, HitboxShape, HitboxRender, HitboxCircle, HitboxRenderCircle
+from .compound import CompoundHitbox
+from .rect import Rect
+from .debug import HitboxDebugRenderer
+from .rect_batch import RectBatch
\ No newline at end of file
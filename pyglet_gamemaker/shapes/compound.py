@@ -0,0 +1,263 @@
+"""Module holding CompoundHitbox class.
+
+Use `~pgm.shapes.CompoundHitbox` instead of `~pgm.shapes.compound.CompoundHitbox`
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Literal
+
+from .hitbox import Hitbox, HitboxCircle, HitboxShape
+
+if TYPE_CHECKING:
+	from collections.abc import Sequence
+
+	from pyglet.math import Vec2
+
+	from ..types import Point2D
+	from .hitbox import HitboxRender, HitboxRenderCircle
+
+
+class CompoundHitbox:
+	"""A group of convex hitboxes (`Hitbox`/`HitboxCircle`) that move as one.
+
+	Children are positioned by their coords when passed in, taken relative to the
+	compound's (0, 0). Afterwards they are moved by the compound's single transform
+	and should not be transformed directly.
+
+	Collision checks the cached bounding box of the whole compound first, and only
+	then the children. The result includes the child that hit.
+	"""
+
+	_anchor: Point2D = 0, 0
+	_angle: float = 0
+
+	children: tuple[Hitbox, ...]
+	"""The child hitboxes"""
+	bounds: tuple[float, float, float, float]
+	"""The axis-aligned bounding box (min_x, min_y, max_x, max_y) of all children"""
+	_offsets: tuple[Point2D, ...]
+	"""Holds the origin of each child relative to the compound's (0, 0)"""
+	_trans_pos: Point2D
+	"""Holds the translation amount from (0, 0)"""
+
+	def __init__(
+		self,
+		children: Sequence[Hitbox],
+		pos: Point2D = (0, 0),
+		anchor_pos: Point2D = (0, 0),
+	) -> None:
+		"""Create a compound hitbox.
+
+		Args:
+			children (Sequence[Hitbox]):
+				The child hitboxes, with coords relative to the compound's (0, 0)
+			pos (Point2D, optional):
+				The starting position.
+				Defaults to (0, 0).
+			anchor_pos (Point2D, optional):
+				The starting anchor position.
+				Defaults to (0, 0).
+		"""
+		if not children:
+			raise ValueError('CompoundHitbox needs at least 1 child.')
+
+		self.children = tuple(children)
+		self._offsets = tuple(child.coords[0] for child in self.children)
+
+		# Bake each child's current transform into its shape so only the
+		# compound's transform has to be applied from now on
+		for child in self.children:
+			if not isinstance(child, HitboxCircle):
+				child.shape = HitboxShape.from_coords(child.coords)
+			child._anchor = 0, 0
+
+		self._trans_pos = pos
+		self.anchor = anchor_pos
+
+	def collide(
+		self,
+		other: Hitbox | HitboxRender | HitboxRenderCircle | CompoundHitbox,
+		sacrifice_MTV: bool = False,
+	) -> tuple[Literal[False], None, None] | tuple[Literal[True], Vec2, Hitbox]:
+		"""Run the SAT algorithm between the children and another object.
+
+		The MTV moves the compound out of the other object (see `~pgm.shapes.Hitbox.collide`).
+
+		Args:
+			other (Hitbox | HitboxRender | HitboxRenderCircle | CompoundHitbox):
+				The other hitbox to detect collision with
+			sacrifice_MTV (bool, optional):
+				If True, optimize speed in exchange for no MTV.
+				Defaults to False.
+
+		Returns:
+			tuple[Literal[False], None, None] | tuple[Literal[True], Vec2, Hitbox]: Whether
+				collision passed, MTV and the child that hit (None if no collision)
+		"""
+		# Get hitbox if not subclass
+		if not isinstance(other, Hitbox | CompoundHitbox):
+			other = other.hitbox
+
+		# If the bounding boxes do not overlap, no child can collide
+		other_bounds = other.bounds
+		if not self._overlap(self.bounds, other_bounds):
+			return False, None, None
+
+		others = other.children if isinstance(other, CompoundHitbox) else (other,)
+		for child in self.children:
+			if not self._overlap(child.bounds, other_bounds):
+				continue
+			for other_child in others:
+				collision_info = child.collide(other_child, sacrifice_MTV)
+				if collision_info[0]:
+					return True, collision_info[1], child
+
+		return False, None, None
+
+	def collide_any(
+		self,
+		others: list[Hitbox | HitboxRender | HitboxRenderCircle | CompoundHitbox],
+		sacrifice_MTV: bool = False,
+	) -> tuple[Literal[False], None, None] | tuple[Literal[True], Vec2, Hitbox]:
+		"""Run the SAT algorithm on a list of others.
+
+		Args:
+			others (list[Hitbox | HitboxRender | HitboxRenderCircle | CompoundHitbox]):
+				List of others to check collision with self
+			sacrifice_MTV (bool, optional):
+				If True, optimize speed in exchange for no MTV.
+				Defaults to False.
+
+		Returns:
+			tuple[Literal[False], None, None] | tuple[Literal[True], Vec2, Hitbox]: Whether
+				collision passed, MTV and the child that hit (None if no collision)
+		"""
+		for other in others:
+			if (collision_info := self.collide(other, sacrifice_MTV))[0]:
+				return collision_info
+
+		return False, None, None
+
+	@staticmethod
+	def _overlap(
+		b1: tuple[float, float, float, float], b2: tuple[float, float, float, float]
+	) -> bool:
+		# Check if two bounding boxes overlap
+		return b1[0] <= b2[2] and b2[0] <= b1[2] and b1[1] <= b2[3] and b2[1] <= b1[3]
+
+	def _calc_coords(self) -> None:
+		# Updates the coords of every child from the compound's transform,
+		# 	and the bounding box along with them.
+		# 	Each child origin is transformed like a vertex of a Hitbox, then
+		# 	the child's shape is rotated around its origin
+
+		cos, sin = math.cos(self._angle), math.sin(self._angle)
+		trans_x, trans_y = self._trans_pos
+		anchor_x, anchor_y = self._anchor
+
+		min_x = min_y = float('inf')
+		max_x = max_y = float('-inf')
+		for child, (offset_x, offset_y) in zip(self.children, self._offsets):
+			origin_x = (
+				trans_x + (offset_x - anchor_x) * cos - (offset_y - anchor_y) * sin
+			)
+			origin_y = (
+				trans_y + (offset_x - anchor_x) * sin + (offset_y - anchor_y) * cos
+			)
+
+			child._trans_pos = origin_x, origin_y
+			child._angle = self._angle
+			child.coords = tuple(
+				(origin_x + x * cos - y * sin, origin_y + x * sin + y * cos)
+				for x, y in child.shape.local_coords
+			)
+
+			child_bounds = child.bounds
+			min_x, min_y = min(min_x, child_bounds[0]), min(min_y, child_bounds[1])
+			max_x, max_y = max(max_x, child_bounds[2]), max(max_y, child_bounds[3])
+
+		self.bounds = min_x, min_y, max_x, max_y
+
+	@property
+	def x(self) -> float:
+		"""The x position of anchor point.
+
+		To set both `.x` and `.y`, use `.pos`.
+		"""
+		return self._trans_pos[0]
+
+	@x.setter
+	def x(self, val: float) -> None:
+		self._trans_pos = val, self._trans_pos[1]
+		self._calc_coords()
+
+	@property
+	def y(self) -> float:
+		"""The y position of anchor point.
+
+		To set both `.x` and `.y`, use `.pos`.
+		"""
+		return self._trans_pos[1]
+
+	@y.setter
+	def y(self, val: float) -> None:
+		self._trans_pos = self._trans_pos[0], val
+		self._calc_coords()
+
+	@property
+	def pos(self) -> Point2D:
+		"""The position of anchor point."""
+		return self._trans_pos
+
+	@pos.setter
+	def pos(self, val: Point2D) -> None:
+		self._trans_pos = val
+		self._calc_coords()
+
+	@property
+	def anchor_x(self) -> float:
+		"""The x anchor of the compound, relative to its (0, 0).
+
+		To set both `.anchor_x` and `.anchor_y`, use `.anchor`
+		"""
+		return self._anchor[0]
+
+	@anchor_x.setter
+	def anchor_x(self, val: float) -> None:
+		self._anchor = val, self.anchor_y
+		self._calc_coords()
+
+	@property
+	def anchor_y(self) -> float:
+		"""The y anchor of the compound, relative to its (0, 0).
+
+		To set both `.anchor_x` and `.anchor_y`, use `.anchor`
+		"""
+		return self._anchor[1]
+
+	@anchor_y.setter
+	def anchor_y(self, val: float) -> None:
+		self._anchor = self.anchor_x, val
+		self._calc_coords()
+
+	@property
+	def anchor(self) -> Point2D:
+		"""The anchor of the compound, relative to its (0, 0)."""
+		return self._anchor
+
+	@anchor.setter
+	def anchor(self, val: Point2D) -> None:
+		self._anchor = val
+		self._calc_coords()
+
+	@property
+	def angle(self) -> float:
+		"""Angle, in radians, of the compound."""
+		return self._angle
+
+	@angle.setter
+	def angle(self, val: float) -> None:
+		self._angle = val
+		self._calc_coords()
@@ -0,0 +1,299 @@
+"""Module holding HitboxDebugRenderer class.
+
+Use `~pgm.shapes.HitboxDebugRenderer` instead of `~pgm.shapes.debug.HitboxDebugRenderer`
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+from pyglet.gl import GL_LINES, GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA, GL_TRIANGLES
+from pyglet.shapes import _ShapeGroup, get_default_shader
+
+from ..types import Color
+from .compound import CompoundHitbox
+from .hitbox import Hitbox, HitboxCircle
+
+if TYPE_CHECKING:
+	from pyglet.graphics import Batch, Group
+	from pyglet.graphics.vertexdomain import VertexList
+
+	from ..types import Point2D
+	from .hitbox import HitboxRender, HitboxRenderCircle, HitboxShape
+
+
+class HitboxDebugRenderer:
+	"""Draws many hitboxes as outlines or fills from one vertex list.
+
+	Add hitboxes using `.add` and remove using `.remove`.
+	Call `.update` once per frame before drawing the batch.
+
+	Each hitbox gets a fixed range of the vertex list, and only the ranges of hitboxes
+	whose coords (or radius) changed since the last `.update` are rewritten. The vertex list grows
+	when it runs out of room.
+
+	Set `.enabled` to False to delete the vertex list. While disabled, `.update`
+	does nothing and nothing is drawn.
+	"""
+
+	_enabled: bool = True
+	_fill: bool = False
+
+	batch: Batch
+	"""Batch for rendering"""
+	group: Group | None
+	"""Group for rendering"""
+	color: Color
+	"""Color of every hitbox"""
+	hitboxes: list[Hitbox]
+	"""All hitboxes drawn, in vertex list order"""
+
+	_starts: list[int]
+	"""Holds the first vertex of each hitbox"""
+	_last_written: list[tuple[tuple[Point2D, ...], HitboxShape] | None]
+	"""Holds the (coords, shape) of each hitbox when last written (None if never written).
+
+	The shape is compared so a changed circle radius is also rewritten.
+	"""
+	_used: int = 0
+	"""Number of vertices used by hitboxes"""
+	_capacity: int
+	"""Number of vertices in the vertex list"""
+	_repack: bool = True
+	"""If True, every hitbox is rewritten on the next `.update`"""
+	_vertex_list: VertexList | None = None
+	_circle_points: tuple[Point2D, ...]
+	"""Holds points of a unit circle, for circle hitboxes"""
+
+	def __init__(
+		self,
+		batch: Batch,
+		group: Group | None = None,
+		color: Color = Color.WHITE,
+		fill: bool = False,
+		circle_segments: int = 16,
+		capacity: int = 1024,
+		enabled: bool = True,
+	) -> None:
+		"""Create a debug renderer.
+
+		Args:
+			batch (Batch):
+				Batch for rendering
+			group (Group | None, optional):
+				Group for rendering.
+				Defaults to None.
+			color (Color, optional):
+				Color of every hitbox.
+				Defaults to Color.WHITE.
+			fill (bool, optional):
+				If True, hitboxes are filled instead of outlined.
+				Defaults to False.
+			circle_segments (int, optional):
+				Number of segments used for circles.
+				Defaults to 16.
+			capacity (int, optional):
+				Starting number of vertices in the vertex list.
+				Defaults to 1024.
+			enabled (bool, optional):
+				If False, start disabled.
+				Defaults to True.
+		"""
+		self.batch, self.group = batch, group
+		self.color, self._fill = color, fill
+		self.hitboxes, self._starts, self._last_written = [], [], []
+		self._capacity = capacity
+		self._circle_points = tuple(
+			(
+				math.cos(2 * math.pi * i / circle_segments),
+				math.sin(2 * math.pi * i / circle_segments),
+			)
+			for i in range(circle_segments)
+		)
+		self._shape_group = _ShapeGroup(
+			GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, get_default_shader(), group
+		)
+		self.enabled = enabled
+
+	def add(
+		self, obj: Hitbox | HitboxRender | HitboxRenderCircle | CompoundHitbox
+	) -> None:
+		"""Add a hitbox to draw. Compound hitboxes add all of their children.
+
+		Args:
+			obj (Hitbox | HitboxRender | HitboxRenderCircle | CompoundHitbox):
+				The hitbox to draw
+		"""
+		if isinstance(obj, CompoundHitbox):
+			for child in obj.children:
+				self.add(child)
+			return
+		hitbox = obj if isinstance(obj, Hitbox) else obj.hitbox
+
+		self.hitboxes.append(hitbox)
+		self._starts.append(self._used)
+		self._last_written.append(None)
+		self._used += self._get_vertex_count(hitbox)
+
+		# Out of room: grow the vertex list on the next update
+		if self._used > self._capacity:
+			self._repack = True
+
+	def remove(
+		self, obj: Hitbox | HitboxRender | HitboxRenderCircle | CompoundHitbox
+	) -> None:
+		"""Remove a drawn hitbox. Compound hitboxes remove all of their children.
+
+		Args:
+			obj (Hitbox | HitboxRender | HitboxRenderCircle | CompoundHitbox):
+				The hitbox to remove
+		"""
+		if isinstance(obj, CompoundHitbox):
+			for child in obj.children:
+				self.remove(child)
+			return
+		hitbox = obj if isinstance(obj, Hitbox) else obj.hitbox
+
+		index = self.hitboxes.index(hitbox)
+		del self.hitboxes[index], self._starts[index], self._last_written[index]
+
+		# Close the gap on the next update
+		self._repack = True
+
+	def update(self) -> None:
+		"""Rewrite the vertices of hitboxes that changed since the last update."""
+		if not self._enabled or self._vertex_list is None:
+			return
+		if self._repack:
+			self._pack(self._vertex_list)
+			return
+
+		# Hitboxes are stored in vertex order, so neighbouring changed
+		# hitboxes are written together as one range
+		buffer = self._vertex_list.domain.attrib_name_buffers['position']
+		run: list[float] = []
+		run_start = 0
+		for i, hitbox in enumerate(self.hitboxes):
+			written = self._last_written[i]
+			if (
+				written is not None
+				and hitbox.coords is written[0]
+				and hitbox.shape is written[1]
+			):
+				if run:
+					buffer.set_region(run_start, len(run) // 2, run)
+					run = []
+				continue
+
+			if not run:
+				run_start = self._vertex_list.start + self._starts[i]
+			run += self._get_vertices(hitbox)
+			self._last_written[i] = hitbox.coords, hitbox.shape
+
+		if run:
+			buffer.set_region(run_start, len(run) // 2, run)
+
+	def _pack(self, vertex_list: VertexList) -> None:
+		# Lay out every hitbox from the start of the vertex list and rewrite all of them
+
+		self._used = 0
+		for i, hitbox in enumerate(self.hitboxes):
+			self._starts[i] = self._used
+			self._used += self._get_vertex_count(hitbox)
+
+		if self._used > self._capacity:
+			self._capacity = max(self._used, self._capacity * 2)
+			vertex_list.resize(self._capacity)
+			vertex_list.colors[:] = self.color.value * self._capacity  # type: ignore[attr-defined]
+
+		vertices = []
+		for i, hitbox in enumerate(self.hitboxes):
+			vertices += self._get_vertices(hitbox)
+			self._last_written[i] = hitbox.coords, hitbox.shape
+		# Unused vertices are collapsed to a point so nothing is drawn
+		vertices += (0, 0) * (self._capacity - self._used)
+		vertex_list.position[:] = vertices  # type: ignore[attr-defined]
+
+		self._repack = False
+
+	def _get_vertex_count(self, hitbox: Hitbox) -> int:
+		sides = (
+			len(self._circle_points)
+			if isinstance(hitbox, HitboxCircle)
+			else len(hitbox.coords)
+		)
+		if not self.fill:
+			return sides * 2
+		# Circles are a fan around the center; polygons a fan around the first vertex
+		return sides * 3 if isinstance(hitbox, HitboxCircle) else (sides - 2) * 3
+
+	def _get_vertices(self, hitbox: Hitbox) -> list[float]:
+		# Get the flattened vertices of a hitbox as lines or triangles
+		if isinstance(hitbox, HitboxCircle):
+			(x, y), radius = hitbox.coords[0], hitbox.radius
+			points = [
+				(x + point[0] * radius, y + point[1] * radius)
+				for point in self._circle_points
+			]
+		else:
+			points = list(hitbox.coords)
+
+		vertices: list[float] = []
+		if not self.fill:
+			for i in range(len(points)):
+				vertices += *points[i], *points[(i + 1) % len(points)]
+		elif isinstance(hitbox, HitboxCircle):
+			for i in range(len(points)):
+				vertices += (
+					*hitbox.coords[0],
+					*points[i],
+					*points[(i + 1) % len(points)],
+				)
+		else:
+			for i in range(1, len(points) - 1):
+				vertices += *points[0], *points[i], *points[i + 1]
+		return vertices
+
+	@property
+	def fill(self) -> bool:
+		"""If True, hitboxes are filled instead of outlined."""
+		return self._fill
+
+	@fill.setter
+	def fill(self, val: bool) -> None:
+		if val == self._fill:
+			return
+		self._fill = val
+
+		# The draw mode and the vertices of every hitbox change, so rebuild the vertex list
+		if self._vertex_list is not None:
+			self.enabled = False
+			self.enabled = True
+
+	@property
+	def enabled(self) -> bool:
+		"""If False, nothing is drawn or updated."""
+		return self._enabled
+
+	@enabled.setter
+	def enabled(self, val: bool) -> None:
+		self._enabled = val
+
+		if not val:
+			if self._vertex_list is not None:
+				self._vertex_list.delete()
+				self._vertex_list = None
+			return
+
+		if self._vertex_list is None:
+			self._capacity = max(self._capacity, self._used)
+			self._vertex_list = self._shape_group.program.vertex_list(
+				self._capacity,
+				GL_TRIANGLES if self.fill else GL_LINES,
+				self.batch,
+				self._shape_group,
+				position=('f', (0, 0) * self._capacity),
+				colors=('Bn', self.color.value * self._capacity),
+			)
+			self._repack = True
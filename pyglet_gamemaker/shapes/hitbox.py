@@ -6,14 +6,105 @@ Use `~pgm.shapes.{class}` instead of `~pgm.shapes.hitbox.{class}`
 from __future__ import annotations
 
 import math
-from typing import Literal, Self
+from array import array
+from typing import TYPE_CHECKING, ClassVar, Literal, Self
+from weakref import WeakValueDictionary
 
 import pyglet
 from pyglet.graphics import Batch, Group
 from pyglet.math import Vec2
 from pyglet.shapes import Circle, Polygon
 
-from ..types import Axis, Color, Point2D
+from ..types import Color, Point2D
+
+if TYPE_CHECKING:
+	from collections.abc import Sequence
+
+
+class HitboxShape:
+	"""The immutable local geometry of a hitbox (vertices, edge normals, bounding radius).
+
+	Hitboxes with the same geometry share one `HitboxShape` and only store their own
+	transform (position, anchor, angle). Use `.get()` or `.from_coords()` instead of
+	the constructor so identical shapes are interned. Interned shapes are freed once no
+	hitbox uses them.
+	"""
+
+	_cache: ClassVar[
+		WeakValueDictionary[tuple[tuple[Point2D, ...], float | None], HitboxShape]
+	] = WeakValueDictionary()
+	"""Holds all interned shapes, keyed by (local coords, radius)"""
+
+	local_coords: tuple[Point2D, ...]
+	"""The *untransformed* coords relative to first coordinate"""
+	axes: tuple[Point2D, ...]
+	"""The normalized edge normals of the *unrotated* shape (for SAT)"""
+	radius: float
+	"""Radius of the bounding circle around the first coordinate"""
+
+	def __init__(
+		self, local_coords: tuple[Point2D, ...], radius: float | None = None
+	) -> None:
+		"""Create a shape. Use `.get()` instead to share existing shapes.
+
+		Args:
+			local_coords (tuple[Point2D, ...]):
+				The coords relative to the first coordinate
+			radius (float | None, optional):
+				The bounding radius. If None, calculated from `local_coords`.
+				Defaults to None.
+		"""
+		self.local_coords = local_coords
+		self.radius = (
+			max(math.hypot(*coord) for coord in local_coords)
+			if radius is None
+			else radius
+		)
+
+		# Gets the normal axis of every edge (pairs of adjacent vertices)
+		axes = []
+		for i in range(len(local_coords) if len(local_coords) > 1 else 0):
+			p1, p2 = local_coords[i], local_coords[(i + 1) % len(local_coords)]
+			vec = p1[0] - p2[0], p1[1] - p2[1]
+			# Perpendicular vector, normalized to help get MTV
+			length = math.hypot(*vec) or 1
+			axes.append((-vec[1] / length, vec[0] / length))
+		self.axes = tuple(axes)
+
+	@classmethod
+	def get(
+		cls, local_coords: tuple[Point2D, ...], radius: float | None = None
+	) -> HitboxShape:
+		"""Get the shared shape with these local coords, creating it if needed.
+
+		Args:
+			local_coords (tuple[Point2D, ...]):
+				The coords relative to the first coordinate
+			radius (float | None, optional):
+				The bounding radius. If None, calculated from `local_coords`.
+				Defaults to None.
+
+		Returns:
+			HitboxShape: The interned shape
+		"""
+		key = local_coords, radius
+		if (shape := cls._cache.get(key)) is None:
+			shape = cls._cache[key] = cls(local_coords, radius)
+		return shape
+
+	@classmethod
+	def from_coords(cls, coords: Sequence[Point2D]) -> HitboxShape:
+		"""Get the shared shape of global coords (made relative to the first coordinate).
+
+		Args:
+			coords (Sequence[Point2D]):
+				The global coordinates of the hitbox
+
+		Returns:
+			HitboxShape: The interned shape
+		"""
+		origin_x, origin_y = coords[0]
+		return cls.get(tuple((x - origin_x, y - origin_y) for x, y in coords))
 
 
 class Hitbox:
@@ -22,27 +113,27 @@ class Hitbox:
 	Can use `.from_rect()` to get coords for rectangle.
 	Use `hitbox.HitboxCircle` for circle collisions.
 
-	For _coord vars (ex. `._local_coords`), there are 3 types of transformation
+	The geometry is held in a shared `HitboxShape` (`.shape`) and each hitbox only
+	holds its transform. There are 3 types of transformation:
 	- translated: Adding global position of hitbox to local position (moving in 2D space)
 	- rotated: Adding the rotation of the hitbox
 	- anchored: Shifting global position to account for anchor position of hitbox
 	"""
 
-	_local_coords: tuple[Point2D, ...] = tuple()
-	"""Holds the *untransformed* coords relative to first coordinate"""
-	_raw_coords: tuple[Point2D, ...] = tuple()
-	"""Holds the *unrotated* AND *unanchored*, but *translated/global* coords"""
-	_unanchored_coords: tuple[Point2D, ...] = tuple()
-	"""Holds the *unanchored*, *translated/global* coords"""
-	_anchor_coords: tuple[Point2D, ...] = tuple()
-	"""Holds the *untransformed* coords relative to anchor pos"""
-	_rotation_amount: tuple[Point2D, ...] = tuple()
-	"""Holds the translation due to rotation of each point"""
 	_anchor: Point2D = 0, 0
 	_angle: float = 0
 
-	coords: tuple[Point2D, ...]
-	"""The final coordinates of the hitbox"""
+	shape: HitboxShape
+	"""The shared, *untransformed* geometry of the hitbox"""
+	vertices: array[float] | None = None
+	"""The final coordinates flattened (x0, y0, x1, y1, ...) as float32, or None if not kept.
+
+	Set to an `array('f')` with 2 values per vertex to have the transform written
+	straight into it on every coordinate update, so a render can copy it into its
+	vertex list. `.coords` is then only calculated when read.
+	"""
+	_coords: tuple[Point2D, ...] | None = None
+	"""Holds the final coordinates, or None if not calculated since the last update"""
 	_trans_pos: Point2D
 	"""Holds the translation amount from (0, 0)"""
 	subtype: str | None
@@ -73,7 +164,7 @@ class Hitbox:
 			)
 
 		self._trans_pos = coords[0]
-		self._raw_coords = coords
+		self.shape = self._get_shape(coords)
 		self.anchor = anchor_pos
 		self.subtype = _subtype
 
@@ -101,38 +192,163 @@ class Hitbox:
 			_subtype='rect',
 		)
 
-	def _get_axes(self, remove_dupes: bool) -> list[Vec2]:
-		# Get the normal axes of the hitbox as Vec2 (for SAT).
+	@classmethod
+	def from_rects_array(
+		cls,
+		xywh_array: Sequence[float],
+		anchors: Point2D | Sequence[Point2D] = (0, 0),
+	) -> list[Self]:
+		"""Create many rectangle hitboxes in one pass.
 
-		axes = []
+		Skips the per-hitbox transform pipeline: new hitboxes are unrotated, so their
+		coords are just their shared shape shifted by position and anchor.
+
+		Args:
+			xywh_array (Sequence[float]):
+				Flat x, y, width, height of every rect. Any sequence of floats works,
+				such as a list, `array.array` or `memoryview` of pooled storage.
+			anchors (Point2D | Sequence[Point2D], optional):
+				One anchor position for every rect, or one anchor position per rect.
+				Defaults to (0, 0).
+
+		Returns:
+			list[Self]: The hitboxes, in the same order as `xywh_array`
+		"""
+		if len(xywh_array) % 4:
+			raise ValueError(
+				f'Hitbox.from_rects_array() needs 4 values per rect ({len(xywh_array)} passed).'
+			)
 
-		# Loops through vertices and gets all adjacent pairs
-		for i in range(
-			len(self.coords) // (2 if remove_dupes and self.subtype == 'rect' else 1)
+		# Rects of the same size share a shape, so only look each size up once
+		shapes: dict[tuple[float, float], HitboxShape] = {}
+		hitboxes = []
+		for (x, y, width, height), (anchor_x, anchor_y) in zip(
+			zip(xywh_array[0::4], xywh_array[1::4], xywh_array[2::4], xywh_array[3::4]),
+			cls._broadcast_anchors(anchors, len(xywh_array) // 4),
 		):
-			# Grabbing vertex positions
-			p1, p2 = self.coords[i], self.coords[(i + 1) % len(self.coords)]
+			if (shape := shapes.get((width, height))) is None:
+				shape = shapes[width, height] = HitboxShape.get(
+					((0, 0), (width, 0), (width, height), (0, height))
+				)
+
+			hitbox = cls.__new__(cls)
+			hitbox.shape = shape
+			hitbox.subtype = 'rect'
+			hitbox._trans_pos = x, y
+			hitbox._anchor = anchor_x, anchor_y
+			x, y = x - anchor_x, y - anchor_y
+			hitbox.coords = (
+				(x, y),
+				(x + width, y),
+				(x + width, y + height),
+				(x, y + height),
+			)
+			hitboxes.append(hitbox)
 
-			# Calculates the vector between them
-			vec = p1[0] - p2[0], p1[1] - p2[1]
-			# Gets perpendicular vector and normalizes it
-			# Normalizing helps get MTV
-			axes.append(Vec2(-vec[1], vec[0]).normalize())
+		return hitboxes
+
+	@classmethod
+	def from_polygons_array(
+		cls,
+		coords_array: Sequence[float],
+		vertex_count: int,
+		anchors: Point2D | Sequence[Point2D] = (0, 0),
+	) -> list[Self]:
+		"""Create many polygon hitboxes with the same number of vertices in one pass.
+
+		Like `.from_rects_array()`, skips the per-hitbox transform pipeline.
+
+		Args:
+			coords_array (Sequence[float]):
+				Flat x, y of every vertex of every polygon. Any sequence of floats works,
+				such as a list, `array.array` or `memoryview` of pooled storage.
+			vertex_count (int):
+				The number of vertices in each polygon
+			anchors (Point2D | Sequence[Point2D], optional):
+				One anchor position for every polygon, or one anchor position per polygon.
+				Defaults to (0, 0).
+
+		Returns:
+			list[Self]: The hitboxes, in the same order as `coords_array`
+		"""
+		if vertex_count < 2:
+			raise ValueError(
+				f'Hitbox needs at least 2 coordinates ({vertex_count} passed).'
+			)
+		stride = vertex_count * 2
+		if len(coords_array) % stride:
+			raise ValueError(
+				f'Hitbox.from_polygons_array() needs {stride} values per polygon ({len(coords_array)} passed).'
+			)
+
+		hitboxes = []
+		for start, (anchor_x, anchor_y) in zip(
+			range(0, len(coords_array), stride),
+			cls._broadcast_anchors(anchors, len(coords_array) // stride),
+		):
+			polygon = coords_array[start : start + stride]
+			x, y = polygon[0], polygon[1]
+
+			hitbox = cls.__new__(cls)
+			hitbox.shape = HitboxShape.get(
+				tuple(
+					zip(
+						[px - x for px in polygon[0::2]],
+						[py - y for py in polygon[1::2]],
+					)
+				)
+			)
+			hitbox.subtype = None
+			hitbox._trans_pos = x, y
+			hitbox._anchor = anchor_x, anchor_y
+			hitbox.coords = tuple(
+				(px - anchor_x, py - anchor_y)
+				for px, py in zip(polygon[0::2], polygon[1::2])
+			)
+			hitboxes.append(hitbox)
+
+		return hitboxes
 
-		return axes
+	@staticmethod
+	def _broadcast_anchors(
+		anchors: Point2D | Sequence[Point2D], count: int
+	) -> Sequence[Point2D]:
+		# Get one anchor per hitbox from either a single anchor or one per hitbox
+		# 	An empty sequence is an empty list of anchors (only valid for no hitboxes)
+		if len(anchors) and isinstance(anchors[0], int | float):
+			return (anchors,) * count  # type: ignore[return-value]
+		if len(anchors) != count:
+			raise ValueError(f'Expected {count} anchors ({len(anchors)} passed).')
+		return anchors  # type: ignore[return-value]
+
+	def _get_shape(self, coords: tuple[Point2D, ...]) -> HitboxShape:
+		# Get the shared shape for the coords passed to __init__
+		return HitboxShape.from_coords(coords)
+
+	def _get_axes(self, remove_dupes: bool) -> list[Vec2]:
+		# Get the normal axes of the hitbox as Vec2 (for SAT).
+		# 	The shape holds the unrotated normals, so they only need to be rotated
+
+		axes = self.shape.axes
+		if remove_dupes and self.subtype == 'rect':
+			axes = axes[: len(axes) // 2]
+
+		cos, sin = math.cos(self._angle), math.sin(self._angle)
+		return [Vec2(x * cos - y * sin, x * sin + y * cos) for x, y in axes]
 
 	def _project(self, axis: Vec2) -> tuple[float, float]:
 		# Project the hitbox onto an axis (use self._get_axes()) (for SAT).
 		# 	Returns a line
 
 		# Stores the left (minimum) and right (maximum) of line
-		maximum = minimum = axis.dot(Vec2(*self.coords[0]))
+		coords = self.coords
+		maximum = minimum = axis.dot(Vec2(*coords[0]))
 
 		# Gets projections for each vertice
 		# Vertice with lowest and highest projections are used in line
-		for i in range(1, len(self.coords)):
+		for i in range(1, len(coords)):
 			# Projection using dot product
-			pos = axis.dot(Vec2(*self.coords[i]))
+			pos = axis.dot(Vec2(*coords[i]))
 			maximum = max(maximum, pos)
 			minimum = min(minimum, pos)
 
@@ -211,6 +427,13 @@ class Hitbox:
 		if not isinstance(other, Hitbox):
 			other = other.hitbox
 
+		# * Step 0: If the bounding circles do not overlap, there cannot be a collision
+		if (
+			math.dist(self.coords[0], other.coords[0])
+			> self.shape.radius + other.shape.radius
+		):
+			return False, None
+
 		# Get special circle collision axis
 		if isinstance(self, HitboxCircle):
 			self._set_collision_axis(other)
@@ -270,59 +493,52 @@ class Hitbox:
 
 	def _calc_coords(self) -> None:
 		# Updates coordinates based on new position, angle, and/or anchor_pos.
+		# 	The local coords are shifted so the anchor is the origin, rotated
+		# 	around it, then translated to the global position
 
-		# Steps:
-		# 1. Update local coords
-		# 2. Update anchor coords
-		# 3. Get displacement caused by rotation of anchor coords
-		# 4. Add translation to local to get raw
-		# 5. Add anchor rotation displacement to raw to get unanchored
-		# 6. Add anchor to unanchored to get final
-
-		# Use the raw coords, which are precalculated in __init__
-		# before first ._calc_coords call
-		self._local_coords = tuple(
-			(
-				coord[0] - self._raw_coords[0][0],
-				coord[1] - self._raw_coords[0][1],
-			)
-			for coord in self._raw_coords
-		)
-
-		self._anchor_coords = tuple(
-			(coord[0] - self.anchor_x, coord[1] - self.anchor_y)
-			for coord in self._local_coords
-		)
+		vertices = self.vertices
+		if vertices is None:
+			self._coords = self._transform()
+			return
 
-		self._rotation_amount = tuple(
+		# Write the transform straight into the float32 array
+		# 	`.coords` is recalculated (in full precision) when next read
+		self._coords = None
+		cos, sin = math.cos(self._angle), math.sin(self._angle)
+		trans_x, trans_y = self._trans_pos
+		anchor_x, anchor_y = self._anchor
+		i = 0
+		for x, y in self.shape.local_coords:
+			x -= anchor_x
+			y -= anchor_y
+			vertices[i] = trans_x + x * cos - y * sin
+			vertices[i + 1] = trans_y + x * sin + y * cos
+			i += 2
+
+	def _transform(self) -> tuple[Point2D, ...]:
+		# Get the final coordinates from the shape and transform
+		cos, sin = math.cos(self._angle), math.sin(self._angle)
+		trans_x, trans_y = self._trans_pos
+		anchor_x, anchor_y = self._anchor
+
+		return tuple(
 			(
-				self._get_rotated_pos(coord, 'x') - coord[0],
-				self._get_rotated_pos(coord, 'y') - coord[1],
+				trans_x + (x - anchor_x) * cos - (y - anchor_y) * sin,
+				trans_y + (x - anchor_x) * sin + (y - anchor_y) * cos,
 			)
-			for coord in self._anchor_coords
-		)
-
-		self._raw_coords = tuple(
-			(coord[0] + self._trans_pos[0], coord[1] + self._trans_pos[1])
-			for coord in self._local_coords
-		)
-
-		self._unanchored_coords = tuple(
-			(coord[0] + rotation[0], coord[1] + rotation[1])
-			for coord, rotation in zip(self._raw_coords, self._rotation_amount)
+			for x, y in self.shape.local_coords
 		)
 
-		self.coords = tuple(
-			(coord[0] - self.anchor_x, coord[1] - self.anchor_y)
-			for coord in self._unanchored_coords
-		)
+	@property
+	def coords(self) -> tuple[Point2D, ...]:
+		"""The final coordinates of the hitbox."""
+		if self._coords is None:
+			self._coords = self._transform()
+		return self._coords
 
-	def _get_rotated_pos(self, coord: Point2D, axis: Axis) -> float:
-		# Gets position of point if it were rotated
-		if axis == 'x':
-			return coord[0] * math.cos(self.angle) - coord[1] * math.sin(self.angle)
-		if axis == 'y':
-			return coord[0] * math.sin(self.angle) + coord[1] * math.cos(self.angle)
+	@coords.setter
+	def coords(self, val: tuple[Point2D, ...]) -> None:
+		self._coords = val
 
 	@property
 	def x(self) -> float:
@@ -406,6 +622,14 @@ class Hitbox:
 		self._angle = val
 		self._calc_coords()
 
+	@property
+	def bounds(self) -> tuple[float, float, float, float]:
+		"""The axis-aligned bounding box (min_x, min_y, max_x, max_y) of the final coords."""
+		coords = self.coords
+		xs = [coord[0] for coord in coords]
+		ys = [coord[1] for coord in coords]
+		return min(xs), min(ys), max(xs), max(ys)
+
 
 class HitboxCircle(Hitbox):
 	"""Holds a hitbox for circle-polygon collisions.
@@ -415,8 +639,6 @@ class HitboxCircle(Hitbox):
 
 	axis: Vec2
 	"""The axis between the center and the closest point on last hitbox checked for collision."""
-	radius: float
-	"""The radius of the circle"""
 
 	def __init__(
 		self, x: float, y: float, radius: float, anchor_pos: Point2D = (0, 0)
@@ -434,9 +656,48 @@ class HitboxCircle(Hitbox):
 				The anchor position.
 				Defaults to (0, 0).
 		"""
-		super().__init__(((x, y), (radius, 0)), anchor_pos, _subtype='circle')
 		self.axis = Vec2(0, 0)
-		self.radius = radius
+		super().__init__(((x, y), (radius, 0)), anchor_pos, _subtype='circle')
+
+	@classmethod
+	def from_rects_array(
+		cls,
+		xywh_array: Sequence[float],
+		anchors: Point2D | Sequence[Point2D] = (0, 0),
+	) -> list[Self]:
+		"""Not supported for circles. Create each with `HitboxCircle(...)` instead."""
+		raise TypeError('HitboxCircle does not support from_rects_array().')
+
+	@classmethod
+	def from_polygons_array(
+		cls,
+		coords_array: Sequence[float],
+		vertex_count: int,
+		anchors: Point2D | Sequence[Point2D] = (0, 0),
+	) -> list[Self]:
+		"""Not supported for circles. Create each with `HitboxCircle(...)` instead."""
+		raise TypeError('HitboxCircle does not support from_polygons_array().')
+
+	def _get_shape(self, coords: tuple[Point2D, ...]) -> HitboxShape:
+		# A circle only has its center, so all circles with the same radius share a shape
+		# 	The radius is passed in the second coordinate
+		return HitboxShape.get(((0, 0),), coords[1][0])
+
+	@property
+	def radius(self) -> float:
+		"""The radius of the circle."""
+		return self.shape.radius
+
+	@radius.setter
+	def radius(self, val: float) -> None:
+		self.shape = HitboxShape.get(((0, 0),), val)
+
+	@property
+	def bounds(self) -> tuple[float, float, float, float]:
+		"""The axis-aligned bounding box (min_x, min_y, max_x, max_y) of the circle."""
+		x, y = self.coords[0]
+		radius = self.shape.radius
+		return x - radius, y - radius, x + radius, y + radius
 
 	def _get_axes(self, sacrifice_MTV: bool) -> list[Vec2]:
 		return [self.axis.normalize()]
@@ -517,44 +778,62 @@ class HitboxCircle(Hitbox):
 
 		self.axis = least[0]
 
-	def _calc_coords(self) -> None:
-		# Same algorithm as in Hitbox, but optimized for single center coordinate of circle
-		self._local_coords = ((0, 0),)
-		self._anchor_coords = ((-self.anchor_x, -self.anchor_y),)
-		self._rotation_amount = (
-			(
-				self._get_rotated_pos(self._anchor_coords[0], 'x')
-				- self._anchor_coords[0][0],
-				self._get_rotated_pos(self._anchor_coords[0], 'y')
-				- self._anchor_coords[0][1],
-			),
-		)
-		self._raw_coords = (self._trans_pos,)
-		self._unanchored_coords = (
-			(
-				self._raw_coords[0][0] + self._rotation_amount[0][0],
-				self._raw_coords[0][1] + self._rotation_amount[0][1],
-			),
-		)
-		self.coords = (
-			(
-				self._unanchored_coords[0][0] - self.anchor_x,
-				self._unanchored_coords[0][1] - self.anchor_y,
-			),
-		)
+
+class _VertexPolygon(Polygon):
+	# A polygon whose positions are the float32 vertices of a hitbox
+	# 	Its translation stays at (0, 0), so the positions are absolute
+
+	def __init__(
+		self,
+		hitbox: Hitbox,
+		color: tuple[int, int, int, int],
+		batch: Batch,
+		group: Group,
+	) -> None:
+		self._hitbox = hitbox
+		super().__init__(*hitbox.coords, color=color, batch=batch, group=group)
+		self._x = self._y = 0
+		self._update_translation()
+
+	def __contains__(self, point: tuple[float, float]) -> bool:
+		# The coordinates pyglet checks against are only updated when needed
+		self._coordinates = list(self._hitbox.coords)
+		return super().__contains__(point)
+
+	def _get_vertices(self) -> Sequence[float]:
+		if not self._visible or self._hitbox.vertices is None:
+			return (0, 0) * self._num_verts
+		return self._hitbox.vertices
 
 
 class HitboxRender:
-	"""Holds a Hitbox with `.hitbox` and `.render` objects."""
+	"""Holds a Hitbox with `.hitbox` and `.render` objects.
 
+	If `.deferred` is True, transform changes update the hitbox right away but only
+	mark the render as dirty. `HitboxRender.flush()` (called by `~pgm.Window` before
+	drawing) then updates each dirty render once, however many times it was changed.
+	Set `HitboxRender.deferred` to defer every render, or set it on single renders.
+
+	If created with `shared_vertices=True`, the hitbox keeps its final coords in a
+	float32 array (`.hitbox.vertices`) and the render's positions are copied from it
+	with one slice assignment. The render's translation is then fixed at (0, 0), so
+	use the transform of the `HitboxRender` instead of `.render.x`/`.render.y`.
+	"""
+
+	_pending: ClassVar[set[HitboxRender | HitboxRenderCircle]] = set()
+	"""Holds the deferred renders changed since the last `.flush`"""
 	_hitbox_color: Color
 
+	deferred: bool = False
+	"""If True, the render is only updated on `.flush`"""
 	hitbox: Hitbox
 	"""The hitbox object"""
 	render: Polygon
 	"""The render object"""
 	subtype: str | None
 	"""Subtype (ex. 'rect') of hitbox"""
+	shared_vertices: bool
+	"""If True, the render copies its positions from `.hitbox.vertices`"""
 
 	def __init__(
 		self,
@@ -565,6 +844,7 @@ class HitboxRender:
 		anchor_pos: Point2D = (0, 0),
 		*,
 		subtype: str | None = None,
+		shared_vertices: bool = False,
 	) -> None:
 		"""Create a hitbox render.
 
@@ -589,9 +869,18 @@ class HitboxRender:
 			subtype (str | None, optional):
 				The subtype of the hitbox. Ex: 'rect', 'circle'.
 				Defaults to None.
+			shared_vertices (bool, optional):
+				If True, the render copies its positions from `.hitbox.vertices`.
+				Defaults to False.
 		"""
-		self.render = Polygon(*coords, color=color.value, batch=batch, group=group)
 		self.hitbox = Hitbox(coords, anchor_pos, _subtype=subtype)
+		self.shared_vertices = shared_vertices
+		if shared_vertices:
+			self.hitbox.vertices = array('f', [0]) * (len(coords) * 2)
+			self.hitbox._calc_coords()
+			self.render = _VertexPolygon(self.hitbox, color.value, batch, group)
+		else:
+			self.render = Polygon(*coords, color=color.value, batch=batch, group=group)
 
 		self.subtype = subtype
 		self._hitbox_color = color
@@ -680,14 +969,44 @@ class HitboxRender:
 		"""
 		return self.hitbox.collide_any(others, sacrifice_MTV)
 
+	def delete(self) -> None:
+		"""Delete the render. The hitbox still works, but can't be drawn afterwards."""
+		# A pending update would write to the deleted vertex list on `.flush`
+		self._pending.discard(self)
+		self.render.delete()
+
+	@staticmethod
+	def flush() -> None:
+		"""Update every deferred render (including `HitboxRenderCircle`) changed since the last flush.
+
+		Call once per frame before drawing.
+		"""
+		for render in HitboxRender._pending:
+			render._sync_render()
+		HitboxRender._pending.clear()
+
 	def _calc_coords(self) -> None:
 		self.hitbox._calc_coords()
 
+		if self.deferred:
+			self._pending.add(self)
+		else:
+			self._sync_render()
+
+	def _sync_render(self) -> None:
+		if self.shared_vertices:
+			# Copy the float32 coords in one slice
+			# 	Hidden polygons keep zeroed positions until shown again
+			if self.render._visible:
+				self.render._vertex_list.position[:] = self.hitbox.vertices  # type: ignore[attr-defined]
+			return
+
 		# Update polygon render
+		# 	Set position directly so vertices and translation are each written once
 		self.render._coordinates = self.hitbox.coords  # type: ignore[assignment]
+		self.render._x, self.render._y = self.hitbox.coords[0]
 		self.render._update_vertices()
-		self.render.x = self.hitbox.coords[0][0]
-		self.render.y = self.hitbox.coords[0][1]
+		self.render._update_translation()
 
 	@property
 	def x(self) -> float:
@@ -783,10 +1102,16 @@ class HitboxRender:
 
 
 class HitboxRenderCircle:
-	"""Holds a Circle Hitbox with `.hitbox` and `.render` objects."""
+	"""Holds a Circle Hitbox with `.hitbox` and `.render` objects.
+
+	Supports deferred render updates like `HitboxRender`; they are also pushed by
+	`HitboxRender.flush()`.
+	"""
 
 	_hitbox_color: Color
 
+	deferred: bool = False
+	"""If True, the render is only updated on `HitboxRender.flush`"""
 	hitbox: HitboxCircle
 	"""The hitbox object"""
 	render: Circle
@@ -872,8 +1197,20 @@ class HitboxRenderCircle:
 		"""
 		return self.hitbox.collide_any(others, sacrifice_MTV)
 
+	def delete(self) -> None:
+		"""Delete the render. The hitbox still works, but can't be drawn afterwards."""
+		HitboxRender._pending.discard(self)
+		self.render.delete()
+
 	def _calc_coords(self) -> None:
 		self.hitbox._calc_coords()
+
+		if self.deferred:
+			HitboxRender._pending.add(self)
+		else:
+			self._sync_render()
+
+	def _sync_render(self) -> None:
 		self.render.position = self.hitbox.coords[0]
 
 	@property
@@ -886,7 +1223,7 @@ class HitboxRenderCircle:
 
 	@x.setter
 	def x(self, val: float) -> None:
-		self.hitbox.x = val
+		self.hitbox._trans_pos = val, self.hitbox._trans_pos[1]
 		self._calc_coords()
 
 	@property
@@ -899,7 +1236,7 @@ class HitboxRenderCircle:
 
 	@y.setter
 	def y(self, val: float) -> None:
-		self.hitbox.y = val
+		self.hitbox._trans_pos = self.hitbox._trans_pos[0], val
 		self._calc_coords()
 
 	@property
@@ -909,7 +1246,7 @@ class HitboxRenderCircle:
 
 	@pos.setter
 	def pos(self, val: Point2D) -> None:
-		self.hitbox.pos = val
+		self.hitbox._trans_pos = val
 		self._calc_coords()
 
 	@property
@@ -8,7 +8,7 @@ from __future__ import annotations
 from pyglet.graphics import Batch, Group
 
 from ..types import Color, Point2D
-from .hitbox import HitboxRender
+from .hitbox import HitboxRender, HitboxShape
 
 
 class Rect(HitboxRender):
@@ -83,35 +83,25 @@ class Rect(HitboxRender):
 	@property
 	def width(self) -> float:
 		"""The width of *unrotated* rectangle."""
-		return self.hitbox._raw_coords[1][0] - self.hitbox._raw_coords[0][0]
+		return self.hitbox.shape.local_coords[1][0]
 
 	@width.setter
 	def width(self, val: float) -> None:
-		# Set raw coords instead of local coords because ._calc_coords
-		# updates local coords. Updates to local coords would
-		# get overwritten when calling ._calc_coords
-		self.hitbox._raw_coords = (
-			self.hitbox._raw_coords[0],
-			(self.hitbox._raw_coords[0][0] + val, self.hitbox._raw_coords[1][1]),
-			(self.hitbox._raw_coords[3][0] + val, self.hitbox._raw_coords[2][1]),
-			self.hitbox._raw_coords[3],
+		# Rects of the same size share a shape, so swap to the one with the new size
+		self.hitbox.shape = HitboxShape.get(
+			((0, 0), (val, 0), (val, self.height), (0, self.height))
 		)
 		self._calc_coords()
 
 	@property
 	def height(self) -> float:
 		"""The height of *unrotated* rectangle."""
-		return self.hitbox._raw_coords[3][1] - self.hitbox._raw_coords[0][1]
+		return self.hitbox.shape.local_coords[3][1]
 
 	@height.setter
 	def height(self, val: float) -> None:
-		# Set raw coords instead of local coords because ._calc_coords
-		# updates local coords. Updates to local coords would
-		# get overwritten when calling ._calc_coords
-		self.hitbox._raw_coords = (
-			self.hitbox._raw_coords[0],
-			self.hitbox._raw_coords[1],
-			(self.hitbox._raw_coords[2][0], self.hitbox._raw_coords[1][1] + val),
-			(self.hitbox._raw_coords[3][0], self.hitbox._raw_coords[0][1] + val),
+		# Rects of the same size share a shape, so swap to the one with the new size
+		self.hitbox.shape = HitboxShape.get(
+			((0, 0), (self.width, 0), (self.width, val), (0, val))
 		)
 		self._calc_coords()
@@ -0,0 +1,256 @@
+"""Module holding RectBatch class.
+
+Use `~pgm.shapes.RectBatch` instead of `~pgm.shapes.rect_batch.RectBatch`
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+from pyglet.gl import GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA, GL_TRIANGLES
+from pyglet.shapes import _ShapeGroup, get_default_shader
+
+from .hitbox import Hitbox, HitboxShape
+
+if TYPE_CHECKING:
+	from pyglet.graphics import Batch, Group
+	from pyglet.graphics.vertexdomain import IndexedVertexList
+
+	from ..types import Color
+
+
+class RectBatch:
+	"""Draws many axis-aligned rectangles from one indexed vertex list.
+
+	Each rect is given a handle (its slot in the vertex list) by `.add`, which is
+	used to `.update` or `.remove` it. Removed slots are collapsed to a point and
+	reused by the next `.add`. The vertex list grows when every slot is used.
+
+	Unlike `~pgm.shapes.Rect`, there is no shape object per rect. Rects that are only
+	drawn can also skip their hitbox (`hitbox=False`).
+	"""
+
+	batch: Batch
+	"""Batch for rendering"""
+	group: Group | None
+	"""Group for rendering"""
+	rects: list[tuple[float, float, float, float] | None]
+	"""(x, y, width, height) of each slot (None if free)"""
+	hitboxes: list[Hitbox | None]
+	"""Hitbox of each slot (None if free or render-only)"""
+
+	_free: list[int]
+	"""Holds the free slots, reused last in first out"""
+	_positions: array[float]
+	"""Holds the positions of every slot, for rebuilding the vertex list"""
+	_colors: array[int]
+	"""Holds the colors of every slot, for rebuilding the vertex list"""
+	_vertex_list: IndexedVertexList
+
+	def __init__(
+		self, batch: Batch, group: Group | None = None, capacity: int = 256
+	) -> None:
+		"""Create a rect batch.
+
+		Args:
+			batch (Batch):
+				Batch for rendering
+			group (Group | None, optional):
+				Group for rendering.
+				Defaults to None.
+			capacity (int, optional):
+				Starting number of slots.
+				Defaults to 256.
+		"""
+		self.batch, self.group = batch, group
+		self.rects, self.hitboxes = [], []
+		self._free = []
+		self._positions, self._colors = array('f'), array('B')
+		self._shape_group = _ShapeGroup(
+			GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, get_default_shader(), group
+		)
+		self._add_slots(capacity)
+		self._vertex_list = self._create_vertex_list()
+
+	def add(
+		self,
+		x: float,
+		y: float,
+		width: float,
+		height: float,
+		color: Color,
+		hitbox: bool = True,
+	) -> int:
+		"""Add a rect.
+
+		Args:
+			x (float):
+				x position
+			y (float):
+				y position
+			width (float):
+				Width of rect
+			height (float):
+				Height of rect
+			color (Color):
+				The color of the rect
+			hitbox (bool, optional):
+				If False, the rect is only drawn and has no hitbox.
+				Defaults to True.
+
+		Returns:
+			int: The handle of the rect
+		"""
+		if not self._free:
+			# Double the slots and rebuild the vertex list to fit them
+			self._add_slots(len(self.rects) or 1)
+			self._vertex_list.delete()
+			self._vertex_list = self._create_vertex_list()
+		handle = self._free.pop()
+
+		self.rects[handle] = x, y, width, height
+		self.hitboxes[handle] = (
+			Hitbox.from_rect(x, y, width, height, (0, 0)) if hitbox else None
+		)
+		self._write_position(handle)
+		self._write_color(handle, color)
+		return handle
+
+	def update(
+		self,
+		handle: int,
+		x: float | None = None,
+		y: float | None = None,
+		width: float | None = None,
+		height: float | None = None,
+		color: Color | None = None,
+	) -> None:
+		"""Change a rect. Values left as None are unchanged.
+
+		Args:
+			handle (int):
+				The handle of the rect
+			x (float | None, optional):
+				New x position.
+				Defaults to None.
+			y (float | None, optional):
+				New y position.
+				Defaults to None.
+			width (float | None, optional):
+				New width.
+				Defaults to None.
+			height (float | None, optional):
+				New height.
+				Defaults to None.
+			color (Color | None, optional):
+				New color.
+				Defaults to None.
+		"""
+		rect = self.get_rect(handle)
+
+		if (x, y, width, height) != (None, None, None, None):
+			new_rect = (
+				rect[0] if x is None else x,
+				rect[1] if y is None else y,
+				rect[2] if width is None else width,
+				rect[3] if height is None else height,
+			)
+			self.rects[handle] = new_rect
+			self._write_position(handle)
+
+			if (hitbox := self.hitboxes[handle]) is not None:
+				if new_rect[2:] != rect[2:]:
+					# Rects of the same size share a shape
+					new_width, new_height = new_rect[2:]
+					hitbox.shape = HitboxShape.get(
+						(
+							(0, 0),
+							(new_width, 0),
+							(new_width, new_height),
+							(0, new_height),
+						)
+					)
+				hitbox._trans_pos = new_rect[:2]
+				hitbox._calc_coords()
+
+		if color is not None:
+			self._write_color(handle, color)
+
+	def remove(self, handle: int) -> None:
+		"""Remove a rect. Its slot is reused by a later `.add`.
+
+		Args:
+			handle (int):
+				The handle of the rect
+		"""
+		self.get_rect(handle)
+
+		self.rects[handle] = self.hitboxes[handle] = None
+		self._write_position(handle)
+		self._free.append(handle)
+
+	def get_rect(self, handle: int) -> tuple[float, float, float, float]:
+		"""Get (x, y, width, height) of a rect.
+
+		Args:
+			handle (int):
+				The handle of the rect
+
+		Returns:
+			tuple[float, float, float, float]: (x, y, width, height)
+		"""
+		if (rect := self.rects[handle]) is None:
+			raise KeyError(f'Rect handle {handle} is not in use.')
+		return rect
+
+	def delete(self) -> None:
+		"""Delete the vertex list. The batch can't be used afterwards."""
+		self._vertex_list.delete()
+
+	def __len__(self) -> int:
+		"""Get the number of rects in use."""
+		return len(self.rects) - len(self._free)
+
+	def _write_position(self, handle: int) -> None:
+		# Write the 4 corners of a slot (collapsed to a point if free)
+		if (rect := self.rects[handle]) is None:
+			vertices = array('f', (0,) * 8)
+		else:
+			x, y, width, height = rect
+			vertices = array(
+				'f', (x, y, x + width, y, x + width, y + height, x, y + height)
+			)
+
+		self._positions[handle * 8 : handle * 8 + 8] = vertices
+		self._vertex_list.domain.attrib_name_buffers['position'].set_region(
+			self._vertex_list.start + handle * 4, 4, vertices
+		)
+
+	def _write_color(self, handle: int, color: Color) -> None:
+		colors = array('B', color.value * 4)
+		self._colors[handle * 16 : handle * 16 + 16] = colors
+		self._vertex_list.domain.attrib_name_buffers['colors'].set_region(
+			self._vertex_list.start + handle * 4, 4, colors
+		)
+
+	def _add_slots(self, count: int) -> None:
+		start = len(self.rects)
+		self.rects += [None] * count
+		self.hitboxes += [None] * count
+		# Reversed so the lowest new slot is used first
+		self._free = list(range(start + count - 1, start - 1, -1)) + self._free
+		self._positions += array('f', (0,) * 8 * count)
+		self._colors += array('B', (0,) * 16 * count)
+
+	def _create_vertex_list(self) -> IndexedVertexList:
+		slots = len(self.rects)
+		return self._shape_group.program.vertex_list_indexed(
+			slots * 4,
+			GL_TRIANGLES,
+			[slot * 4 + i for slot in range(slots) for i in (0, 1, 2, 0, 2, 3)],
+			self.batch,
+			self._shape_group,
+			position=('f', self._positions),
+			colors=('Bn', self._colors),
+		)
@@ -1,15 +1,23 @@
-"""Module holding SpriteSheet class."""
+"""Module holding SpriteSheet, PackedSpriteSheet and SpritePool classes."""
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import json
+import posixpath
+import time
+from typing import TYPE_CHECKING, ClassVar
+from weakref import WeakValueDictionary
 
 import pyglet
 from pyglet.image import ImageGrid, TextureGrid
+from pyglet.sprite import Sprite
+
+from .scaling import ScaledFrameCache
 
 if TYPE_CHECKING:
-	from typing import SupportsIndex
+	from typing import Any, SupportsIndex
 
+	from pyglet.graphics import Batch, Group
 	from pyglet.image import AbstractImage, TextureRegion
 
 
@@ -18,31 +26,171 @@ class SpriteSheet:
 
 	Index to get portion of image to render.
 	Allows indexing by name using `.name()`.
+
+	Use `.load()` instead of the constructor to share one sheet (and its texture)
+	between everything loading the same file with the same grid. Each `.load()`
+	should be matched by a `.release()`. Once a sheet is fully released, it is
+	dropped from the cache and its texture is freed when nothing else uses it.
+
+	If created with `lazy=True`, the image is only decoded and uploaded the first
+	time it is needed (indexing, `.item_width`, `.grid`, ...) or on `.preload()`.
+	Every load is recorded in `SpriteSheet.load_log`.
+	"""
+
+	load_log: ClassVar[list[tuple[float, str, str, float]]] = []
+	"""Records every load as (time, file path, trigger, seconds taken).
+
+	The time is from `time.perf_counter()`, and the trigger is 'init', 'preload',
+	or the attribute whose access loaded a lazy sheet.
 	"""
 
+	scaled_cache: ClassVar[ScaledFrameCache] = ScaledFrameCache()
+	"""Holds the frames made by `.scaled`, shared by every sheet"""
+
+	_cache: ClassVar[WeakValueDictionary[tuple[str, int, int], SpriteSheet]] = (
+		WeakValueDictionary()
+	)
+	"""Holds all loaded sheets, keyed by (file path, rows, cols), or (data path, 0, 0) if packed"""
+	_refs: int = 0
+	"""Number of `.load()` calls not yet released"""
+
 	img: AbstractImage
 	"""Stores the original image"""
 	image_grid: ImageGrid
 	"""Stores the unoptimized image grid"""
 	grid: TextureGrid
 	"""Stores the optimized image grid (one actually rendered)"""
-	lookup: dict[str, int] = {}
+	lookup: dict[str, int]
 	"""The lookup table to convert aliases to integers for indexing"""
+	in_atlas: bool = False
+	"""If True, the image is a region of an `~pgm.atlas.AtlasBuilder` texture.
 
-	def __init__(self, file_path: str, rows: int, cols: int) -> None:
+	`~pgm.memory.TextureTracker` never unloads these, since reloading from the file
+	would take the sheet out of the atlas.
+	"""
+
+	_lazy_attrs: ClassVar[tuple[str, ...]] = ('img', 'image_grid', 'grid')
+	"""The attributes that load a lazy sheet when first used"""
+
+	def __init__(
+		self, file_path: str, rows: int, cols: int, lazy: bool = False
+	) -> None:
 		"""Create a sprite sheet from a file.
 
 		Args:
 			file_path (str): The path to the sprite sheet
 			rows (int): The number of rows for sprites
 			cols (int): The number of columns for sprites
+			lazy (bool, optional): If True, wait until first use to load the image.
+				Defaults to False.
 		"""
 		self.path, self.rows, self.cols = file_path, rows, cols
-		self.img = pyglet.resource.image(file_path)  # Loads og img
-		self.image_grid = ImageGrid(self.img, rows, cols)  # Creates image grid
-		self.grid = TextureGrid(
-			self.image_grid
-		)  # For efficient rendering, make it all one texture
+		self.lookup = {}
+		if not lazy:
+			self._load('init')
+
+	@classmethod
+	def load(
+		cls, file_path: str, rows: int, cols: int, lazy: bool = False
+	) -> SpriteSheet:
+		"""Get the shared sprite sheet for a file and grid, loading it if needed.
+
+		Args:
+			file_path (str): The path to the sprite sheet
+			rows (int): The number of rows for sprites
+			cols (int): The number of columns for sprites
+			lazy (bool, optional): If True and the sheet is new, wait until first use to
+				load the image. Defaults to False.
+
+		Returns:
+			SpriteSheet: The shared sprite sheet
+		"""
+		key = file_path, rows, cols
+		if (sheet := cls._cache.get(key)) is None:
+			sheet = cls._cache[key] = cls(file_path, rows, cols, lazy)
+
+		sheet._refs += 1
+		return sheet
+
+	def release(self) -> None:
+		"""Release one `.load()` of this sheet. The last release drops it from the cache."""
+		if self._refs <= 0:
+			raise RuntimeError(
+				f'SpriteSheet {self.path!r} was released more than loaded.'
+			)
+
+		self._refs -= 1
+		key = self._get_key()
+		if not self._refs and self._cache.get(key) is self:
+			del self._cache[key]
+			self.scaled_cache.discard(self)
+
+	def preload(self) -> None:
+		"""Load the image now if the sheet is lazy and not loaded yet."""
+		if not self.loaded:
+			self._load('preload')
+
+	@classmethod
+	def from_image(
+		cls, img: AbstractImage, rows: int, cols: int, file_path: str = ''
+	) -> SpriteSheet:
+		"""Create a sprite sheet from an already loaded image.
+
+		Args:
+			img (AbstractImage):
+				The sprite sheet image
+			rows (int):
+				The number of rows for sprites
+			cols (int):
+				The number of columns for sprites
+			file_path (str, optional):
+				The path the image came from.
+				Defaults to ''.
+
+		Returns:
+			SpriteSheet: The sprite sheet
+		"""
+		sheet = cls(file_path, rows, cols, lazy=True)
+		sheet._set_image(img)
+		return sheet
+
+	def unload(self) -> None:
+		"""Drop the image (and scaled sprites), so its texture can be freed.
+
+		The sheet loads again the first time it is used, like a lazy sheet.
+		The texture is only freed once nothing else (ex. sprites) uses it.
+		"""
+		for attr in self._lazy_attrs:
+			self.__dict__.pop(attr, None)
+		self.scaled_cache.discard(self)
+		# Loads again from the file, outside of any atlas
+		self.in_atlas = False
+
+	def _get_key(self) -> tuple[str, int, int]:
+		# Get the key of the sheet in `SpriteSheet._cache`
+		return self.path, self.rows, self.cols
+
+	def _load(self, trigger: str) -> None:
+		start = time.perf_counter()
+		self._set_image(pyglet.resource.image(self.path))  # Loads og img
+		self.load_log.append((start, self.path, trigger, time.perf_counter() - start))
+
+	def _set_image(self, img: AbstractImage) -> None:
+		self.img = img
+		# Creates image grid
+		self.image_grid = ImageGrid(img, self.rows, self.cols)
+		# For efficient rendering, make it all one texture
+		self.grid = TextureGrid(self.image_grid)
+
+	def __getattr__(self, attr: str) -> Any:
+		"""Load a lazy sheet the first time its image is used."""
+		# Only runs when the attribute is missing, so loaded sheets pay nothing
+		if attr in self._lazy_attrs:
+			self._load(attr)
+			return getattr(self, attr)
+		raise AttributeError(
+			f'{type(self).__name__!r} object has no attribute {attr!r}'
+		)
 
 	def name(self, *args: str) -> None:
 		"""Name all of the grid parts instead of indexing with numbers.
@@ -52,9 +200,10 @@ class SpriteSheet:
 				The names of the grid parts. Must be in same order as regular indexing.
 		"""
 		# Must be same number of names as parts of the grid
-		if len(args) != len(self.grid):
+		# 	(counted from the grid size so lazy sheets stay unloaded)
+		if len(args) != self.rows * self.cols:
 			raise ValueError(
-				f'SpriteSheet.name() takes {len(self.grid)} args, but {len(args)} were given.'
+				f'SpriteSheet.name() takes {self.rows * self.cols} args, but {len(args)} were given.'
 			)
 
 		# Add all to lookup table
@@ -78,6 +227,23 @@ class SpriteSheet:
 			return self.grid[self.lookup[index]]
 		raise ValueError(f'SpriteSheet[] recieved bad value: {index}')
 
+	def scaled(self, index: int | str, scale: float) -> TextureRegion:
+		"""Get a sprite resized by `scale` on the CPU, so it stays sharp.
+
+		Every sprite of the sheet is resized the first time and kept in
+		`SpriteSheet.scaled_cache` (see `~pgm.scaling.ScaledFrameCache`).
+
+		Args:
+			index (int | str):
+				Index (or name) of the sprite
+			scale (float):
+				Scale factor
+
+		Returns:
+			TextureRegion: The resized sprite
+		"""
+		return self.scaled_cache.get(self, index, scale)
+
 	@property
 	def item_width(self) -> int:
 		"""Width of single sprite."""
@@ -92,3 +258,327 @@ class SpriteSheet:
 	def item_dim(self) -> tuple[int, int]:
 		"""Dimensions of single sprite."""
 		return self.item_width, self.item_height
+
+	@property
+	def loaded(self) -> bool:
+		"""If True, the image has been loaded."""
+		return 'img' in self.__dict__
+
+	@property
+	def texture_bytes(self) -> int:
+		"""Texture memory used by the image, assuming RGBA (0 if not loaded)."""
+		return self.img.width * self.img.height * 4 if self.loaded else 0
+
+
+class PackedSpriteSheet(SpriteSheet):
+	"""A sprite sheet with frames of different sizes, described by a JSON data file.
+
+	Reads the JSON hash and array formats exported by TexturePacker and Aseprite. Frames
+	are named by their keys (`filename` in the array format), so they can be indexed by
+	name straight away, or by position in the file.
+
+	Packers trim the empty borders off frames. Each trimmed frame is anchored so it is
+	drawn at its place in the untrimmed frame, and sprites don't jump between frames.
+	Rotated frames are not supported.
+
+	There is no `.grid` or `.image_grid`, since frames are not in a grid. Users of
+	same-size grid images (`~pgm.particles.ParticleEmitter`, `~pgm.tilemap.TileLayer`
+	and `~pgm.bundle.AssetBundle`) don't accept packed sheets.
+	"""
+
+	data_path: str
+	"""The path to the JSON data file"""
+	rects: list[tuple[int, int, int, int]]
+	"""The (x, y, width, height) of every frame in the image, from the bottomleft"""
+	offsets: list[tuple[int, int]]
+	"""The position of every trimmed frame in its untrimmed frame, from the bottomleft"""
+	source_sizes: list[tuple[int, int]]
+	"""The untrimmed size of every frame"""
+	frames: list[TextureRegion]
+	"""Stores the image of every frame"""
+
+	_lazy_attrs = ('img', 'frames')
+
+	def __init__(
+		self, data_path: str, image_path: str | None = None, lazy: bool = False
+	) -> None:
+		"""Create a sprite sheet from a JSON data file.
+
+		Args:
+			data_path (str):
+				The path to the JSON data file
+			image_path (str | None, optional):
+				The path to the sheet image. If None, uses the image named in the
+				data file, next to it.
+				Defaults to None.
+			lazy (bool, optional):
+				If True, wait until first use to load the image.
+				Defaults to False.
+		"""
+		with pyglet.resource.file(data_path, 'r') as file:
+			data = json.load(file)
+		if image_path is None:
+			image_path = posixpath.join(
+				posixpath.dirname(data_path), data['meta']['image']
+			)
+
+		frames = data['frames']
+		if isinstance(frames, dict):
+			frames = [{'filename': name, **frame} for name, frame in frames.items()]
+
+		# The data file measures from the top, but pyglet from the bottom
+		image_height = data['meta']['size']['h']
+		self.data_path = data_path
+		self.rects, self.offsets, self.source_sizes = [], [], []
+		for frame in frames:
+			if frame.get('rotated'):
+				raise ValueError(
+					f'Frame {frame["filename"]!r} in {data_path!r} is rotated, '
+					'which PackedSpriteSheet does not support.'
+				)
+			rect, trimmed = frame['frame'], frame['spriteSourceSize']
+			source_width, source_height = (
+				frame['sourceSize']['w'],
+				frame['sourceSize']['h'],
+			)
+
+			self.rects.append(
+				(rect['x'], image_height - rect['y'] - rect['h'], rect['w'], rect['h'])
+			)
+			self.offsets.append(
+				(trimmed['x'], source_height - trimmed['y'] - trimmed['h'])
+			)
+			self.source_sizes.append((source_width, source_height))
+
+		# One row of frames, so `.name()` takes one name per frame
+		super().__init__(image_path, 1, len(frames), lazy)
+		self.lookup = {frame['filename']: i for i, frame in enumerate(frames)}
+
+	@classmethod
+	def load(  # type: ignore[override]
+		cls, data_path: str, image_path: str | None = None, lazy: bool = False
+	) -> PackedSpriteSheet:
+		"""Get the shared sprite sheet for a data file, loading it if needed.
+
+		Args:
+			data_path (str):
+				The path to the JSON data file
+			image_path (str | None, optional):
+				The path to the sheet image. If None, uses the image named in the
+				data file, next to it.
+				Defaults to None.
+			lazy (bool, optional):
+				If True and the sheet is new, wait until first use to load the image.
+				Defaults to False.
+
+		Returns:
+			PackedSpriteSheet: The shared sprite sheet
+		"""
+		key = data_path, 0, 0
+		if not isinstance(sheet := cls._cache.get(key), PackedSpriteSheet):
+			sheet = cls(data_path, image_path, lazy)
+			cls._cache[key] = sheet
+
+		sheet._refs += 1
+		return sheet
+
+	@classmethod
+	def from_image(  # type: ignore[override]
+		cls, img: AbstractImage, data_path: str, image_path: str | None = None
+	) -> PackedSpriteSheet:
+		"""Create a sprite sheet from an already loaded image.
+
+		Args:
+			img (AbstractImage):
+				The sprite sheet image
+			data_path (str):
+				The path to the JSON data file
+			image_path (str | None, optional):
+				The path the image came from. If None, uses the image named in the
+				data file, next to it.
+				Defaults to None.
+
+		Returns:
+			PackedSpriteSheet: The sprite sheet
+		"""
+		sheet = cls(data_path, image_path, lazy=True)
+		sheet._set_image(img)
+		return sheet
+
+	def _get_key(self) -> tuple[str, int, int]:
+		# Grid sheets always have rows and columns, so this can't clash with them
+		return self.data_path, 0, 0
+
+	def _set_image(self, img: AbstractImage) -> None:
+		self.img = img
+		texture = img.get_texture()
+		self.frames = []
+		for (x, y, width, height), (offset_x, offset_y) in zip(
+			self.rects, self.offsets
+		):
+			frame = texture.get_region(x, y, width, height)
+			# Moves the frame back to where it was before trimming
+			frame.anchor_x, frame.anchor_y = -offset_x, -offset_y
+			self.frames.append(frame)
+
+	def __getitem__(
+		self,
+		index: str
+		| int
+		| slice[SupportsIndex | None, SupportsIndex | None, SupportsIndex | None],
+	) -> TextureRegion | list[TextureRegion]:
+		"""Get the frame at position `index`.
+
+		Either a normal index or a frame name can be used.
+		"""
+		if isinstance(index, str):
+			return self.frames[self.lookup[index]]
+		if isinstance(index, slice | int):
+			return self.frames[index]
+		raise ValueError(f'PackedSpriteSheet[] recieved bad value: {index}')
+
+	@property
+	def item_width(self) -> int:
+		"""Width of the largest untrimmed frame."""
+		return max(width for width, _ in self.source_sizes)
+
+	@property
+	def item_height(self) -> int:
+		"""Height of the largest untrimmed frame."""
+		return max(height for _, height in self.source_sizes)
+
+
+class SpritePool:
+	"""Reuses a fixed set of sprites for objects that appear and disappear often.
+
+	Creating and deleting sprites (ex. for bullets) allocates vertex list space in the
+	batch each time. Instead, the pool creates sprites ahead of time and hides them.
+	`.acquire` shows a hidden sprite and `.release` hides it again.
+
+	When every sprite is in use, `block_size` more are created at once.
+	"""
+
+	batch: Batch
+	"""Batch for rendering"""
+	group: Group | None
+	"""Group for rendering"""
+	image: AbstractImage
+	"""The image of new sprites"""
+	block_size: int
+	"""Number of sprites created when the pool runs out"""
+	sprites: list[Sprite]
+	"""Every sprite in the pool"""
+	high_water: int = 0
+	"""Most sprites in use at once"""
+	reused: int = 0
+	"""Number of times `.acquire` reused a sprite instead of creating one"""
+
+	_free: list[Sprite]
+	"""Holds the hidden sprites"""
+
+	def __init__(
+		self,
+		image: AbstractImage,
+		batch: Batch,
+		group: Group | None = None,
+		size: int = 64,
+		block_size: int = 64,
+	) -> None:
+		"""Create a sprite pool.
+
+		Args:
+			image (AbstractImage):
+				The image of new sprites (ex. a frame of a `SpriteSheet`)
+			batch (Batch):
+				Batch for rendering
+			group (Group | None, optional):
+				Group for rendering.
+				Defaults to None.
+			size (int, optional):
+				Number of sprites to create at the start.
+				Defaults to 64.
+			block_size (int, optional):
+				Number of sprites created when the pool runs out.
+				Defaults to 64.
+		"""
+		self.image, self.batch, self.group = image, batch, group
+		self.block_size = block_size
+		self.sprites, self._free = [], []
+		self._grow(size)
+
+	def acquire(
+		self, x: float = 0, y: float = 0, image: AbstractImage | None = None
+	) -> Sprite:
+		"""Show a hidden sprite, creating more if none are left.
+
+		Other properties (ex. rotation, scale, opacity) keep their last values.
+
+		Args:
+			x (float, optional):
+				x position.
+				Defaults to 0.
+			y (float, optional):
+				y position.
+				Defaults to 0.
+			image (AbstractImage | None, optional):
+				The image of the sprite. If None, it is left unchanged.
+				Defaults to None.
+
+		Returns:
+			Sprite: The sprite
+		"""
+		if self._free:
+			self.reused += 1
+		else:
+			self._grow(self.block_size)
+		sprite = self._free.pop()
+
+		if image is not None and sprite.image is not image:
+			sprite.image = image
+		sprite.position = x, y, sprite.z
+		sprite.visible = True
+
+		self.high_water = max(self.high_water, self.in_use)
+		return sprite
+
+	def release(self, sprite: Sprite) -> None:
+		"""Hide a sprite so it can be reused.
+
+		Args:
+			sprite (Sprite):
+				A sprite from `.acquire`
+		"""
+		sprite.visible = False
+		self._free.append(sprite)
+
+	def delete(self) -> None:
+		"""Delete every sprite. The pool can't be used afterwards."""
+		for sprite in self.sprites:
+			sprite.delete()
+		self.sprites.clear()
+		self._free.clear()
+
+	def get_stats(self) -> dict[str, int]:
+		"""Get the pool usage.
+
+		Returns:
+			dict[str, int]: `size`, `in_use`, `high_water` and `reused`
+		"""
+		return {
+			'size': len(self.sprites),
+			'in_use': self.in_use,
+			'high_water': self.high_water,
+			'reused': self.reused,
+		}
+
+	def _grow(self, count: int) -> None:
+		for _ in range(count):
+			sprite = Sprite(self.image, batch=self.batch, group=self.group)
+			sprite.visible = False
+			self.sprites.append(sprite)
+			self._free.append(sprite)
+
+	@property
+	def in_use(self) -> int:
+		"""Number of sprites acquired and not released."""
+		return len(self.sprites) - len(self._free)
@@ -0,0 +1,2 @@
+from .layer import TileLayer
+from .collider import TileCollider
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""Module holding TileCollider class.
+
+Use `~pgm.tilemap.TileCollider` instead of `~pgm.tilemap.collider.TileCollider`
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import TYPE_CHECKING, Literal, Self
+
+from ..shapes.hitbox import Hitbox
+
+if TYPE_CHECKING:
+	from collections.abc import Collection, Sequence
+
+	from pyglet.math import Vec2
+
+	from ..shapes.hitbox import HitboxRender, HitboxRenderCircle
+	from ..types import Point2D
+	from .layer import TileLayer
+
+
+class TileCollider:
+	"""Collides hitboxes with a grid of solid tiles.
+
+	Adjacent solid tiles are merged into as few rects as possible (runs along each
+	row, joined with identical runs in the rows above), so hitboxes slide along
+	flat walls without catching on the edges between tiles.
+
+	`.collide` only checks the rects under the bounding box of the hitbox, so the
+	cost does not grow with the size of the map.
+	"""
+
+	width: int
+	"""Number of columns of tiles"""
+	height: int
+	"""Number of rows of tiles"""
+	tile_size: tuple[float, float]
+	"""Size of a tile"""
+	pos: Point2D
+	"""Position of the bottomleft corner of the grid"""
+	rects: list[Hitbox]
+	"""The merged solid rects"""
+
+	_cells: array[int]
+	"""Holds the index of the rect covering each tile (-1 if not solid)"""
+
+	def __init__(
+		self,
+		solid: Sequence[Sequence[bool | int]],
+		tile_size: tuple[float, float],
+		pos: Point2D = (0, 0),
+	) -> None:
+		"""Create a tile collider.
+
+		Args:
+			solid (Sequence[Sequence[bool | int]]):
+				Rows of tiles, from the bottom. Truthy tiles are solid.
+			tile_size (tuple[float, float]):
+				Size of a tile
+			pos (Point2D, optional):
+				Position of the bottomleft corner of the grid.
+				Defaults to (0, 0).
+		"""
+		if any(len(row) != len(solid[0]) for row in solid):
+			raise ValueError('TileCollider rows must all be the same length.')
+
+		self.height, self.width = len(solid), len(solid[0]) if solid else 0
+		self.tile_size, self.pos = tile_size, pos
+		self.rects = []
+		self._cells = array('i', [-1]) * (self.width * self.height)
+
+		# Merged rects as [col, row, cols, rows], in tiles
+		merged: list[list[int]] = []
+		# Rects that can still grow upwards {(first col, last col): rect index}
+		growing: dict[tuple[int, int], int] = {}
+		for row_index, row in enumerate(solid):
+			still_growing = {}
+			col = 0
+			while col < self.width:
+				if not row[col]:
+					col += 1
+					continue
+				start = col
+				while col < self.width and row[col]:
+					col += 1
+
+				# Join the rect below if it covers exactly the same columns
+				if (span := (start, col)) in growing:
+					index = growing[span]
+					merged[index][3] += 1
+				else:
+					index = len(merged)
+					merged.append([start, row_index, col - start, 1])
+				still_growing[span] = index
+				self._cells[
+					row_index * self.width + start : row_index * self.width + col
+				] = array('i', [index]) * (col - start)
+			growing = still_growing
+
+		tile_width, tile_height = tile_size
+		for rect_col, rect_row, cols, rows in merged:
+			self.rects.append(
+				Hitbox.from_rect(
+					pos[0] + rect_col * tile_width,
+					pos[1] + rect_row * tile_height,
+					cols * tile_width,
+					rows * tile_height,
+					(0, 0),
+				)
+			)
+
+	@classmethod
+	def from_layer(cls, layer: TileLayer, solid_tiles: Collection[int | str]) -> Self:
+		"""Create a tile collider matching a tile layer.
+
+		Args:
+			layer (TileLayer):
+				The tile layer
+			solid_tiles (Collection[int | str]):
+				The sheet indices (or names) of solid tiles
+
+		Returns:
+			Self: The tile collider
+		"""
+		solid = {layer._get_index(tile) for tile in solid_tiles}
+		return cls(
+			[
+				[
+					layer.tiles[row * layer.width + col] in solid
+					for col in range(layer.width)
+				]
+				for row in range(layer.height)
+			],
+			(layer.tile_width, layer.tile_height),
+			layer.pos,
+		)
+
+	def query(self, bounds: tuple[float, float, float, float]) -> list[Hitbox]:
+		"""Get the rects covering any tile under a bounding box.
+
+		Args:
+			bounds (tuple[float, float, float, float]):
+				(min_x, min_y, max_x, max_y)
+
+		Returns:
+			list[Hitbox]: The rects, each once
+		"""
+		min_x, min_y, max_x, max_y = bounds
+		tile_width, tile_height = self.tile_size
+		min_col = max(math.floor((min_x - self.pos[0]) / tile_width), 0)
+		min_row = max(math.floor((min_y - self.pos[1]) / tile_height), 0)
+		max_col = min(math.floor((max_x - self.pos[0]) / tile_width), self.width - 1)
+		max_row = min(math.floor((max_y - self.pos[1]) / tile_height), self.height - 1)
+
+		indices = {
+			index
+			for row in range(min_row, max_row + 1)
+			for index in self._cells[
+				row * self.width + min_col : row * self.width + max_col + 1
+			]
+			if index >= 0
+		}
+		return [self.rects[index] for index in sorted(indices)]
+
+	def collide(
+		self,
+		other: Hitbox | HitboxRender | HitboxRenderCircle,
+		sacrifice_MTV: bool = False,
+	) -> tuple[Literal[False], None] | tuple[Literal[True], Vec2]:
+		"""Run the SAT algorithm between a hitbox and the solid tiles under it.
+
+		If several rects overlap the hitbox, the MTV of the deepest one is returned.
+		Move by it and collide again to resolve the rest.
+
+		Args:
+			other (Hitbox | HitboxRender | HitboxRenderCircle):
+				The hitbox to detect collision with
+			sacrifice_MTV (bool, optional):
+				If True, stop at the first collision and optimize speed
+				in exchange for no MTV.
+				Defaults to False.
+
+		Returns:
+			tuple[Literal[False], None] | tuple[Literal[True], Vec2]: Whether
+				collision passed and MTV moving `other` out of the tiles
+				(None if no collision)
+		"""
+		hitbox = other if isinstance(other, Hitbox) else other.hitbox
+
+		deepest: Vec2 | None = None
+		for rect in self.query(hitbox.bounds):
+			if not (collision_info := hitbox.collide(rect, sacrifice_MTV))[0]:
+				continue
+			if sacrifice_MTV:
+				return collision_info
+			if deepest is None or collision_info[1].length() > deepest.length():
+				deepest = collision_info[1]
+
+		if deepest is None:
+			return False, None
+		return True, deepest
@@ -0,0 +1,259 @@
+"""Module holding TileLayer class.
+
+Use `~pgm.tilemap.TileLayer` instead of `~pgm.tilemap.layer.TileLayer`
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import TYPE_CHECKING
+
+from pyglet.gl import GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA, GL_TRIANGLES
+from pyglet.sprite import SpriteGroup, get_default_shader
+
+from ..sprite import PackedSpriteSheet
+
+if TYPE_CHECKING:
+	from collections.abc import Sequence
+
+	from pyglet.graphics import Batch, Group
+	from pyglet.graphics.vertexdomain import IndexedVertexList
+
+	from ..sprite import SpriteSheet
+	from ..types import Point2D
+
+
+class TileLayer:
+	"""A grid of tiles drawn from a `~pgm.sprite.SpriteSheet`.
+
+	Tiles are indices into the sheet (or names from `SpriteSheet.name()`), with -1 for
+	no tile. Row 0 is the bottom row, like `SpriteSheet` indexing.
+
+	The layer is split into square chunks of `chunk_size` tiles, each drawn from one
+	vertex list. Changing a tile with `.set_tile` only rebuilds its chunk, and chunks
+	outside the view set by `.set_view` are not built at all.
+
+	Call `.update` once per frame (or after changes) to rebuild chunks.
+	"""
+
+	sheet: SpriteSheet
+	"""The sprite sheet holding the tile images"""
+	batch: Batch
+	"""Batch for rendering"""
+	pos: Point2D
+	"""Position of the bottomleft corner of the layer"""
+	width: int
+	"""Number of columns of tiles"""
+	height: int
+	"""Number of rows of tiles"""
+	tile_width: int
+	"""Width of a tile"""
+	tile_height: int
+	"""Height of a tile"""
+	chunk_size: int
+	"""Number of tiles along each side of a chunk"""
+	tiles: array[int]
+	"""The sheet index of every tile, row by row from the bottom (-1 if empty)"""
+	view: tuple[float, float, float, float] | None = None
+	"""The visible rectangle (x, y, width, height), or None if everything is visible"""
+
+	_chunks: dict[tuple[int, int], IndexedVertexList | None]
+	"""Holds the vertex list of every built chunk (None if it has no tiles)"""
+	_dirty: set[tuple[int, int]]
+	"""Holds the chunks to rebuild on the next `.update`"""
+	_tex_coords: list[tuple[float, ...]]
+	"""Holds the texture coords of every image in the sheet"""
+
+	def __init__(
+		self,
+		sheet: SpriteSheet,
+		tiles: Sequence[Sequence[int | str]],
+		batch: Batch,
+		group: Group | None = None,
+		pos: Point2D = (0, 0),
+		chunk_size: int = 32,
+		tile_size: tuple[int, int] | None = None,
+	) -> None:
+		"""Create a tile layer.
+
+		Args:
+			sheet (SpriteSheet):
+				The sprite sheet holding the tile images
+			tiles (Sequence[Sequence[int | str]]):
+				Rows of tiles, from the bottom. Each is a sheet index, a name, or -1 for no tile.
+			batch (Batch):
+				Batch for rendering
+			group (Group | None, optional):
+				Group for rendering.
+				Defaults to None.
+			pos (Point2D, optional):
+				Position of the bottomleft corner of the layer.
+				Defaults to (0, 0).
+			chunk_size (int, optional):
+				Number of tiles along each side of a chunk.
+				Defaults to 32.
+			tile_size (tuple[int, int] | None, optional):
+				Size each tile is drawn at. If None, uses the size of a sheet image.
+				Defaults to None.
+		"""
+		if any(len(row) != len(tiles[0]) for row in tiles):
+			raise ValueError('TileLayer rows must all be the same length.')
+		if isinstance(sheet, PackedSpriteSheet):
+			raise TypeError(
+				'TileLayer needs same-size images from a SpriteSheet grid, not a PackedSpriteSheet.'
+			)
+
+		self.sheet, self.batch, self.pos = sheet, batch, pos
+		self.height, self.width = len(tiles), len(tiles[0]) if tiles else 0
+		self.tile_width, self.tile_height = tile_size or sheet.item_dim
+		self.chunk_size = chunk_size
+		self.tiles = array(
+			'i', (self._get_index(tile) for row in tiles for tile in row)
+		)
+
+		self._tex_coords = [region.tex_coords for region in sheet.grid.items]
+		self._sprite_group = SpriteGroup(
+			sheet.grid.get_texture(),
+			GL_SRC_ALPHA,
+			GL_ONE_MINUS_SRC_ALPHA,
+			get_default_shader(),
+			group,
+		)
+		self._chunks = {}
+		self._dirty = set()
+
+	def get_tile(self, col: int, row: int) -> int:
+		"""Get the sheet index of a tile.
+
+		Args:
+			col (int):
+				Column of the tile
+			row (int):
+				Row of the tile, from the bottom
+
+		Returns:
+			int: The sheet index (-1 if empty)
+		"""
+		return self.tiles[row * self.width + col]
+
+	def set_tile(self, col: int, row: int, tile: int | str) -> None:
+		"""Change a tile. Its chunk is rebuilt on the next `.update`.
+
+		Args:
+			col (int):
+				Column of the tile
+			row (int):
+				Row of the tile, from the bottom
+			tile (int | str):
+				Sheet index, name, or -1 for no tile
+		"""
+		if not (0 <= col < self.width and 0 <= row < self.height):
+			raise IndexError(f'Tile ({col}, {row}) is outside of the layer.')
+
+		self.tiles[row * self.width + col] = self._get_index(tile)
+		self._dirty.add((col // self.chunk_size, row // self.chunk_size))
+
+	def set_view(self, x: float, y: float, width: float, height: float) -> None:
+		"""Set the visible rectangle. Chunks outside of it are dropped on the next `.update`.
+
+		Args:
+			x (float):
+				x position
+			y (float):
+				y position
+			width (float):
+				Width of view
+			height (float):
+				Height of view
+		"""
+		self.view = x, y, width, height
+
+	def update(self) -> None:
+		"""Build chunks that changed or came into view and drop chunks out of view."""
+		visible = self._get_visible_chunks()
+
+		for chunk in self._chunks.keys() - visible:
+			if (vertex_list := self._chunks.pop(chunk)) is not None:
+				vertex_list.delete()
+
+		# Chunks out of view were dropped, so they are rebuilt once visible anyway
+		for chunk in visible:
+			if chunk in self._dirty or chunk not in self._chunks:
+				self._build_chunk(chunk)
+		self._dirty.clear()
+
+	def delete(self) -> None:
+		"""Delete every chunk. The layer can't be drawn afterwards."""
+		for vertex_list in self._chunks.values():
+			if vertex_list is not None:
+				vertex_list.delete()
+		self._chunks.clear()
+
+	def _get_index(self, tile: int | str) -> int:
+		return tile if isinstance(tile, int) else self.sheet.lookup[tile]
+
+	def _get_visible_chunks(self) -> set[tuple[int, int]]:
+		# Get every chunk overlapping the view
+		chunk_width = self.chunk_size * self.tile_width
+		chunk_height = self.chunk_size * self.tile_height
+		cols = math.ceil(self.width / self.chunk_size)
+		rows = math.ceil(self.height / self.chunk_size)
+
+		if self.view is None:
+			min_col, min_row, max_col, max_row = 0, 0, cols - 1, rows - 1
+		else:
+			x, y, width, height = self.view
+			x, y = x - self.pos[0], y - self.pos[1]
+			min_col = max(math.floor(x / chunk_width), 0)
+			min_row = max(math.floor(y / chunk_height), 0)
+			max_col = min(math.floor((x + width) / chunk_width), cols - 1)
+			max_row = min(math.floor((y + height) / chunk_height), rows - 1)
+
+		return {
+			(col, row)
+			for col in range(min_col, max_col + 1)
+			for row in range(min_row, max_row + 1)
+		}
+
+	def _build_chunk(self, chunk: tuple[int, int]) -> None:
+		# Write every tile of a chunk into a new vertex list
+		if (old := self._chunks.get(chunk)) is not None:
+			old.delete()
+
+		positions: list[float] = []
+		tex_coords: list[float] = []
+		tile_width, tile_height = self.tile_width, self.tile_height
+		for row in range(
+			chunk[1] * self.chunk_size,
+			min((chunk[1] + 1) * self.chunk_size, self.height),
+		):
+			for col in range(
+				chunk[0] * self.chunk_size,
+				min((chunk[0] + 1) * self.chunk_size, self.width),
+			):
+				if (tile := self.tiles[row * self.width + col]) < 0:
+					continue
+				x = self.pos[0] + col * tile_width
+				y = self.pos[1] + row * tile_height
+				x2, y2 = x + tile_width, y + tile_height
+				positions += x, y, 0, x2, y, 0, x2, y2, 0, x, y2, 0
+				tex_coords += self._tex_coords[tile]
+
+		if not (count := len(positions) // 12):
+			self._chunks[chunk] = None
+			return
+
+		self._chunks[chunk] = get_default_shader().vertex_list_indexed(
+			count * 4,
+			GL_TRIANGLES,
+			[tile * 4 + i for tile in range(count) for i in (0, 1, 2, 0, 2, 3)],
+			self.batch,
+			self._sprite_group,
+			position=('f', positions),
+			colors=('Bn', (255, 255, 255, 255) * count * 4),
+			translate=('f', (0, 0, 0) * count * 4),
+			scale=('f', (1, 1) * count * 4),
+			rotation=('f', (0,) * count * 4),
+			tex_coords=('f', tex_coords),
+		)
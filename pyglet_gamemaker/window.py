@@ -10,6 +10,9 @@ from typing import TYPE_CHECKING
 import pyglet
 from pyglet.window import Window as PygletWin
 
+from .memory import TextureTracker
+from .shapes.hitbox import HitboxRender
+
 if TYPE_CHECKING:
 	from typing import Any
 
@@ -31,6 +34,11 @@ class Window(PygletWin):
 	Add scenes using `.add_scene` and remove using `.pop_scenes`.
 
 	Use `.run` to run the game.
+
+	The game logic runs at a fixed rate (`.update_rate`) by calling `.update` on the
+	current scene, independent of the frame rate. When frames are slow, several updates
+	run to catch up, up to `.max_update_steps` per frame. Drawing passes `.alpha` to the
+	scene's `.on_draw` to interpolate between the last two updates.
 	"""
 
 	scenes: dict[str, Scene] = {}
@@ -40,6 +48,16 @@ class Window(PygletWin):
 
 	centered: bool
 	"""If True, the window is centered. Do not set."""
+	update_rate: float
+	"""Number of scene updates per second"""
+	max_update_steps: int
+	"""Maximum number of scene updates per frame. The rest of the backlog is dropped."""
+	alpha: float = 0
+	"""How far (0-1) the time is between the last update and the next one"""
+	textures: TextureTracker
+	"""Accounts for the texture memory of every scene (see `~pgm.memory.TextureTracker`)"""
+	_accumulator: float = 0
+	"""Holds the time not yet simulated by updates"""
 
 	def __init__(
 		self,
@@ -58,6 +76,9 @@ class Window(PygletWin):
 		config: Config | None = None,
 		context: Context | None = None,
 		mode: ScreenMode | None = None,
+		update_rate: float = 60,
+		max_update_steps: int = 5,
+		texture_budget: int | None = None,
 		**kwargs: EventHandler,
 	) -> None:
 		"""Create a Window object.
@@ -111,6 +132,16 @@ class Window(PygletWin):
 				The screen will be switched to this mode if `fullscreen` is True.
 				If None, an appropriate mode is selected to accommodate ``width``
 				and ``height``.
+			update_rate (float, optional):
+				Number of scene updates per second.
+				Defaults to 60.
+			max_update_steps (int, optional):
+				Maximum number of scene updates per frame when catching up.
+				Defaults to 5.
+			texture_budget (int | None, optional):
+				Most bytes of textures to keep. Sheets of inactive scenes are
+				unloaded on scene changes to stay under it.
+				Defaults to None (no limit).
 			**kwargs (EventHandler):
 				Any extra arguments to add to pyglet window constructor.
 				Read `pyglet.window.Window` documentation or see
@@ -135,6 +166,10 @@ class Window(PygletWin):
 			**kwargs,
 		)
 
+		self.update_rate = update_rate
+		self.max_update_steps = max_update_steps
+		self.textures = TextureTracker(self, texture_budget)
+
 		# Center if requested
 		self.centered = center_window
 		if center_window:
@@ -161,12 +196,38 @@ class Window(PygletWin):
 		# Enable beginning scene
 		self.scenes[self.scene].enable()
 
+		pyglet.clock.schedule(self._tick)
 		pyglet.app.run()
 
 	def on_draw(self) -> None:  # noqa: D102
 		self.clear()
+		self.scenes[self.scene].on_draw(self.alpha)
+		# Push deferred hitbox renders once per frame
+		HitboxRender.flush()
 		self.scenes[self.scene].batch.draw()
 
+	def _tick(self, dt: float) -> None:
+		# Runs every frame to update the scene at a fixed rate
+		# 	Time builds up in the accumulator and is spent in fixed steps
+
+		step = 1 / self.update_rate
+		self._accumulator += dt
+
+		steps = 0
+		while self._accumulator >= step:
+			# Too far behind: drop the backlog instead of falling further
+			# 	behind every frame trying to catch up
+			if steps == self.max_update_steps:
+				self._accumulator %= step
+				break
+
+			self.scenes[self.scene].update(step)
+			self.scenes[self.scene].animator.update(step)
+			self._accumulator -= step
+			steps += 1
+
+		self.alpha = self._accumulator / step
+
 	def add_scene(self, name: str, obj: Scene) -> None:
 		"""Add a scene to the game.
 
@@ -186,13 +247,17 @@ class Window(PygletWin):
 	def pop_scene(self, name: str) -> Scene:
 		"""Pop and return a scene from the game.
 
+		Releases the sprite sheets the scene loaded with `~pgm.Scene.load_sheet`.
+
 		Args:
 			name (str): The name of the scene
 
 		Returns:
 			Scene: The Scene object removed
 		"""
-		return self.scenes.pop(name)
+		scene = self.scenes.pop(name)
+		scene.release_sheets()
+		return scene
 
 	def _on_scene_change(self, new_scene: str, *args: Any, **kwargs: Any) -> None:
 		# Runs when the scene needs to be changed to a new one
@@ -204,3 +269,5 @@ class Window(PygletWin):
 		self.scene = new_scene
 		# Enable new scene
 		self.scenes[self.scene].enable(*args, **kwargs)
+		# Unload textures of inactive scenes if over the budget
+		self.textures.enforce()
@@ -5,13 +5,31 @@ import pyglet
 # Holds all imports for tests
 tests = [
 	'sprite_spritesheet',
+	'sprite_pool',
+	'particles',
+	'animation',
+	'sprite_atlas',
+	'assets_loader',
 	'gui_button',
 	'gui_text',
 	'gui_text_button',
+	'gui_nine_slice',
 	'shapes_hitbox',
+	'shapes_array',
+	'shapes_deferred',
 	'shapes_rect',
 	'shapes_circle',
+	'shapes_compound',
+	'shapes_debug',
+	'shapes_rect_batch',
+	'physics_world',
+	'physics_solver',
+	'physics_body',
+	'tilemap_layer',
+	'tilemap_collider',
 	'scene',
+	'memory',
+	'window_tick',
 	'window',
 ]
 
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pyglet
+from pyglet.graphics import Batch
+from pyglet.sprite import Sprite
+from pyglet.window import Window
+
+from pyglet_gamemaker.animation import Animation, Animator
+from pyglet_gamemaker.sprite import SpriteSheet
+
+window = Window(640, 480, caption=__name__)
+batch = Batch()
+
+sheet = SpriteSheet('Default Button.png', 3, 1)
+sheet.name('Unpressed', 'Hover', 'Pressed')
+cycle = Animation.from_range(sheet, 'Unpressed', 'Pressed', 0.2)
+press = Animation(sheet, ['Hover', 'Pressed'], (0.5, 0.1), loop=False)
+
+
+def on_animation_end(sprite, animation):
+	# Click animations go back to cycling once done
+	animator.play(sprite, cycle)
+
+
+# One scheduled tick for every sprite
+animator = Animator(on_animation_end=on_animation_end)
+animator.schedule()
+sprites = [
+	Sprite(sheet[0], 10 + i % 8 * 78, 10 + i // 8 * 40, batch=batch) for i in range(96)
+]
+for sprite in sprites:
+	sprite.scale = 0.25
+	animator.play(sprite, cycle)
+
+
+@window.event
+def on_mouse_press(x, y, button, modifiers):
+	for sprite in sprites:
+		if (
+			sprite.x <= x < sprite.x + sprite.width
+			and sprite.y <= y < sprite.y + sprite.height
+		):
+			animator.play(sprite, press)
+
+
+@window.event
+def on_draw():
+	window.clear()
+	batch.draw()
+
+
+pyglet.app.run()
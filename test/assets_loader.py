@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import time
+
+import pyglet
+from pyglet.graphics import Batch
+from pyglet.window import Window
+
+from pyglet_gamemaker.assets import AssetLoader
+from pyglet_gamemaker.sprite import SpriteSheet
+
+window = Window(640, 480, caption=__name__)
+batch = Batch()
+sprites = []
+
+
+def on_load_progress(progress):
+	window.set_caption(f'{__name__} loading: {progress:.0%}')
+
+
+def on_load_complete(sheets):
+	# Started twice, but loaded once, timed from when the sheet started decoding
+	entries = [entry for entry in SpriteSheet.load_log if entry[2] == 'loader']
+	assert len(entries) == 1, entries
+	when, path, _, seconds = entries[0]
+	assert path == 'Default Button.png' and when >= started, entries
+	assert when + seconds <= time.perf_counter()
+
+	sheet = sheets['Default Button.png']
+	sheet.name('Unpressed', 'Hover', 'Pressed')
+	for i, name in enumerate(('Unpressed', 'Hover', 'Pressed')):
+		sprites.append(
+			pyglet.sprite.Sprite(sheet[name], 100, 100 + i * 100, batch=batch)
+		)
+	window.set_caption(f'{__name__} loaded {list(sheets)}')
+
+
+# Small budget so the upload is spread over several frames
+loader = AssetLoader(
+	upload_budget=16 * 1024,
+	on_load_progress=on_load_progress,
+	on_load_complete=on_load_complete,
+)
+loader.add('Default Button.png', 3, 1)
+started = time.perf_counter()
+loader.start()
+# Starting again while loading does nothing
+executor = loader._executor
+loader.start()
+assert loader._executor is executor
+
+
+@window.event
+def on_draw():
+	window.clear()
+	batch.draw()
+
+
+pyglet.app.run()
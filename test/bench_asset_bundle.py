@@ -0,0 +1,50 @@
+"""Compare loading sheets from an `AssetBundle` with `pyglet.resource.image`.
+
+Run from the repo root: `python -m test.bench_asset_bundle`
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+
+import pyglet
+
+from pyglet_gamemaker.bundle import AssetBundle
+from pyglet_gamemaker.sprite import SpriteSheet
+
+REPEATS = 50
+
+# Resolved against the script home, so use an absolute path
+pyglet.resource.path = [os.path.dirname(os.path.abspath(__file__))]
+pyglet.resource.reindex()
+# Textures need a GL context
+window = pyglet.window.Window(visible=False)
+
+
+def measure_resource() -> float:
+	start = time.perf_counter()
+	for _ in range(REPEATS):
+		# Nothing keeps the image alive, so pyglet decodes it again every time
+		pyglet.resource.image('Default Button.png')
+	return (time.perf_counter() - start) / REPEATS
+
+
+def measure_bundle(file_path: str) -> float:
+	start = time.perf_counter()
+	for _ in range(REPEATS):
+		bundle = AssetBundle(file_path)
+		bundle.load('Default Button.png')
+		bundle.close()
+	return (time.perf_counter() - start) / REPEATS
+
+
+with tempfile.TemporaryDirectory() as folder:
+	bundle_path = os.path.join(folder, 'sheets.bundle')
+	AssetBundle.build(bundle_path, [SpriteSheet('Default Button.png', 3, 1)])
+
+	print(f'pyglet.resource.image: {measure_resource() * 1000:.2f} ms per sheet')
+	print(f'AssetBundle.load: {measure_bundle(bundle_path) * 1000:.2f} ms per sheet')
+
+window.close()
@@ -0,0 +1,37 @@
+"""Measure per-instance memory of `Hitbox.from_rect` with `tracemalloc`.
+
+Run from the repo root: `python -m test.bench_hitbox_memory`
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+
+import pyglet
+
+# Nothing is rendered, so no GL context is needed
+pyglet.options['shadow_window'] = False
+
+from pyglet_gamemaker.shapes import Hitbox
+
+COUNT = 100_000
+
+
+def measure(count: int) -> float:
+	tracemalloc.start()
+	before = tracemalloc.take_snapshot()
+
+	hitboxes = [
+		Hitbox.from_rect(i % 1000, i // 1000, 32, 32, (0, 0)) for i in range(count)
+	]
+
+	after = tracemalloc.take_snapshot()
+	tracemalloc.stop()
+
+	total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+	# Only keep the list alive until measurement is done
+	del hitboxes
+	return total / count
+
+
+print(f'{COUNT} rects: {measure(COUNT):.1f} bytes per Hitbox')
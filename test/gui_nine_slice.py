@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pyglet
+from pyglet.graphics import Batch, Group
+from pyglet.window import Window
+
+from pyglet_gamemaker.gui import Button
+from pyglet_gamemaker.sprite import SpriteSheet
+
+window = Window(640, 480, caption=__name__)
+pyglet.gl.glClearColor(1, 1, 1, 1)
+batch = Batch()
+button_group = Group()
+
+sheet = SpriteSheet('Default Button.png', 3, 1)
+sheet.name('Unpressed', 'Hover', 'Pressed')
+
+
+def on_full_click(button):
+	print(f'{button.ID} ({button.width}x{button.height}) fully pressed and released!')
+
+
+@window.event
+def on_draw():
+	window.clear()
+	batch.draw()
+
+
+# Same small sheet, many sizes, borders kept sharp
+buttons = [
+	Button(
+		f'Button {i}',
+		320,
+		y,
+		sheet,
+		0,
+		window,
+		batch,
+		button_group,
+		anchor=('center', 'center'),
+		size=size,
+		nine_slice=(20, 20, 20, 20),
+		on_full_click=on_full_click,
+	)
+	for i, (y, size) in enumerate(
+		((420, (100, 50)), (330, (300, 70)), (200, (500, 120)), (70, (60, 60)))
+	)
+]
+
+pyglet.app.run()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from pyglet_gamemaker.atlas import AtlasBuilder
+from pyglet_gamemaker.scene import Scene
+from pyglet_gamemaker.sprite import SpriteSheet
+from pyglet_gamemaker.window import Window
+
+# Every sheet is the whole 320x360 image
+SHEET_BYTES = 320 * 360 * 4
+
+
+class SheetScene(Scene):
+	def __init__(self, name, grid, button=False):
+		super().__init__(name)
+		self.WIDGET_POS = {'Button': (0.5, 0.5)}
+		self.grid, self.button = grid, button
+
+	def initialize(self):
+		self.sheet = self.load_sheet('Default Button.png', *self.grid)
+		if self.button:
+			self.button_sheet = SpriteSheet('Default Button.png', 3, 1)
+			self.create_button('Button', self.button_sheet, 0)
+
+	def enable(self):
+		pass
+
+	def disable(self):
+		pass
+
+
+# Room for 2 of the 4 sheets
+window = Window(
+	640, 480, caption=__name__, visible=False, texture_budget=SHEET_BYTES * 2
+)
+menu = SheetScene('Menu', (1, 1), button=True)
+level1 = SheetScene('Level1', (1, 3))
+level2 = SheetScene('Level2', (3, 3))
+for scene in menu, level1, level2:
+	window.add_scene(scene.name, scene)
+
+report = window.textures.report()
+assert report['Menu'] == {
+	'sheets': SHEET_BYTES * 2,
+	'scaled': 0,
+	'glyphs': 0,
+	'total': SHEET_BYTES * 2,
+}, report
+assert report['Level1']['total'] == report['Level2']['total'] == SHEET_BYTES
+assert window.textures.get_total() == SHEET_BYTES * 4
+
+# Over budget: inactive scenes lose their sheets, but the sheet held by the
+# menu's button stays loaded (and counted), since unloading it frees nothing
+window._on_scene_change('Level1')
+assert not menu.sheet.loaded and not level2.sheet.loaded
+assert menu.button_sheet.loaded and level1.sheet.loaded
+assert window.textures.evictions == 2
+assert window.textures.report()['Menu']['sheets'] == SHEET_BYTES
+assert window.textures.get_total() == SHEET_BYTES * 2
+
+# Using a sheet loads it again, going over budget until the next scene change
+window._on_scene_change('Level2')
+level2.sheet[0]
+assert window.textures.get_total() == SHEET_BYTES * 3
+
+# Level1 was active less recently than Level2, so its sheet is unloaded first
+window._on_scene_change('Menu')
+assert not level1.sheet.loaded and level2.sheet.loaded
+assert window.textures.evictions == 3
+assert window.textures.get_total() == SHEET_BYTES * 2
+
+# Sheets packed into an atlas stay loaded (and in the atlas), even over budget
+builder = AtlasBuilder(1024, 1024)
+builder.add(level1.sheet)
+builder.build()
+window._on_scene_change('Level2')
+assert level1.sheet.loaded and level1.sheet.in_atlas
+assert level1.sheet[0].owner is builder.pages[0]
+assert window.textures.evictions == 3
+assert window.textures.get_total() == SHEET_BYTES * 3
+
+for name in list(window.scenes):
+	window.pop_scene(name)
+window.close()
+print('Texture budget unloads the least recently active sheets first')
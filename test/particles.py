@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pyglet
+from pyglet.graphics import Batch
+from pyglet.window import Window
+
+from pyglet_gamemaker.particles import ParticleEmitter
+from pyglet_gamemaker.sprite import SpriteSheet
+from pyglet_gamemaker.types import Color
+
+window = Window(640, 480, caption=__name__)
+batch = Batch()
+
+sheet = SpriteSheet('Default Button.png', 3, 1)
+sheet.name('Unpressed', 'Hover', 'Pressed')
+emitter = ParticleEmitter(sheet, batch, capacity=20000, gravity=(0, -200))
+
+
+@window.event
+def on_mouse_drag(x, y, dx, dy, buttons, modifiers):
+	emitter.emit(
+		200,
+		(x, y),
+		speed=(50, 300),
+		life=(0.5, 2),
+		frames=('Unpressed', 'Hover', 'Pressed'),
+		color=Color.ORANGE,
+	)
+
+
+def update(dt):
+	emitter.update(dt)
+	window.set_caption(f'{__name__} {emitter.count} particles')
+
+
+@window.event
+def on_draw():
+	window.clear()
+	batch.draw()
+
+
+pyglet.clock.schedule_interval(update, 1 / 60)
+pyglet.app.run()
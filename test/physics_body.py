@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import math
+
+import pyglet
+
+# Nothing is rendered, so no GL context is needed
+pyglet.options['shadow_window'] = False
+
+from pyglet_gamemaker.physics import BodySystem
+from pyglet_gamemaker.shapes import Hitbox
+
+system = BodySystem(gravity=(0, -10))
+falling = system.add(Hitbox.from_rect(0, 100, 10, 10, (0, 0)))
+spinning = system.add(
+	Hitbox.from_rect(50, 50, 10, 10, (5, 5)), vel=(20, 0), angular_vel=1, mass=0
+)
+heavy = system.add(Hitbox.from_rect(0, 0, 10, 10, (0, 0)), mass=4)
+
+# Semi-implicit Euler: velocity changes first, then moves the object
+system.step(0.5)
+assert falling.vel == (0, -5), falling.vel
+assert falling.obj.pos == (0, 97.5), falling.obj.pos
+assert falling.obj.coords[0] == (0, 97.5), falling.obj.coords
+
+# A mass of 0 is static: no gravity, but still moves by its own velocity
+assert spinning.mass == math.inf
+assert spinning.vel == (20, 0), spinning.vel
+assert spinning.obj.pos == (60, 50), spinning.obj.pos
+assert spinning.obj.angle == 0.5, spinning.obj.angle
+
+# Impulses are scaled by inverse mass, and ignored by static bodies
+heavy.vel = falling.vel = 0, 0
+heavy.apply_impulse((8, 0))
+falling.apply_impulse((8, 0))
+spinning.apply_impulse((8, 0))
+assert heavy.vel == (2, 0), heavy.vel
+assert falling.vel == (8, 0), falling.vel
+assert spinning.vel == (20, 0), spinning.vel
+
+# Objects moved elsewhere are picked up on the next step
+falling.obj.pos = 0, 0
+system.gravity = 0, 0
+system.step(1)
+assert falling.obj.pos == (8, 0), falling.obj.pos
+
+# Removing keeps the other handles pointing at their own state
+system.remove(falling)
+assert heavy.index == 0 and spinning.index == 1
+assert heavy.vel == (2, 0) and spinning.vel == (20, 0)
+
+# Removing a stale handle fails instead of removing the body now at its index
+try:
+	system.remove(falling)
+except ValueError:
+	pass
+else:
+	raise AssertionError('Removing a removed body should fail')
+assert system.bodies == [heavy, spinning]
+
+heavy.mass = 0
+assert heavy.mass == math.inf
+try:
+	heavy.mass = -1
+except ValueError:
+	pass
+else:
+	raise AssertionError('Negative mass should fail')
+
+print('BodySystem integrates and applies impulses')
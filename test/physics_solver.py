@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pyglet
+from pyglet.math import Vec2
+
+# Nothing is rendered, so no GL context is needed
+pyglet.options['shadow_window'] = False
+
+from pyglet_gamemaker.physics import CollisionWorld, ContactSolver
+from pyglet_gamemaker.shapes import Hitbox
+
+solver = ContactSolver(iterations=16)
+
+# A pile of 8 boxes, each sunk 10 px into the one below, on a floor
+floor = Hitbox.from_rect(-100, -50, 300, 50, (0, 0))
+anvil = Hitbox.from_rect(100, -10, 50, 50, (0, 0))
+boxes = [Hitbox.from_rect(0, i * 30 - 10, 40, 40, (0, 0)) for i in range(8)]
+
+world = CollisionWorld()
+for obj in (floor, anvil, *boxes):
+	world.add(obj)
+
+# A mass of 0 is infinite, so the anvil stays put like the static floor
+masses = dict.fromkeys(boxes, 1.0) | {anvil: 0}
+for _ in range(20):
+	world.update()
+	if not (contacts := world.get_contacts()):
+		break
+	solver.solve(contacts, masses, static=(floor,))
+
+assert floor.pos == (-100, -50), floor.pos
+assert anvil.pos == (100, -10), anvil.pos
+
+# Settled without overlap (past the allowed slop), still stacked in order
+for below, above in zip((floor, *boxes), boxes):
+	_, min_y, _, _ = above.bounds
+	_, _, _, max_y = below.bounds
+	assert min_y >= max_y - solver.slop * 2, (below.bounds, above.bounds)
+	assert above.x == 0, above.pos
+print(f'Pile settled: top box at y={boxes[-1].y:.2f}')
+
+# Negative masses are rejected
+a, b = Hitbox.from_rect(0, 0, 10, 10, (0, 0)), Hitbox.from_rect(5, 0, 10, 10, (0, 0))
+try:
+	solver.solve([(a, b, Vec2(-5, 0))], {a: -1})
+except ValueError:
+	pass
+else:
+	raise AssertionError('Negative mass should fail')
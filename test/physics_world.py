@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pyglet
+from pyglet.graphics import Batch, Group
+from pyglet.window import Window
+
+from pyglet_gamemaker.physics import CollisionWorld
+from pyglet_gamemaker.shapes import HitboxRender, HitboxRenderCircle
+from pyglet_gamemaker.types import Color
+
+window = Window(640, 480, caption=__name__)
+batch = Batch()
+group = Group()
+
+player = HitboxRender.from_rect(100, 100, 50, 50, Color.WHITE, batch, group)
+walls = [
+	HitboxRender.from_rect(300, 300, 100, 50, Color.RED, batch, group),
+	HitboxRender.from_rect(100, 300, 50, 100, Color.GREEN, batch, group),
+	HitboxRenderCircle(450, 150, 40, Color.BLUE, batch, group),
+]
+
+
+def on_collision_enter(a, b, MTV):
+	print(f'Enter: {b.hitbox_color.name} ({MTV})')
+	b.render.opacity = 128
+
+
+def on_collision_exit(a, b):
+	print(f'Exit: {b.hitbox_color.name}')
+	b.render.opacity = 255
+
+
+world = CollisionWorld(
+	on_collision_enter=on_collision_enter, on_collision_exit=on_collision_exit
+)
+world.add(player)
+for wall in walls:
+	world.add(wall)
+
+
+@window.event
+def on_mouse_motion(x, y, dx, dy):
+	player.pos = x, y
+
+
+def update(dt):
+	world.update()
+
+
+@window.event
+def on_draw():
+	window.clear()
+	batch.draw()
+
+
+pyglet.clock.schedule_interval(update, 1 / 60)
+pyglet.app.run()
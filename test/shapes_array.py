@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from array import array
+
+import pyglet
+
+# Nothing is rendered, so no GL context is needed
+pyglet.options['shadow_window'] = False
+
+from pyglet_gamemaker.shapes import Hitbox, HitboxCircle
+
+rects = [(10, 20, 30, 40), (-5, 0, 30, 40), (100, 50, 8, 8)]
+anchors = [(0, 0), (15, 20), (4, 4)]
+
+# Array construction matches per-object construction
+for bulk, (x, y, w, h), anchor in zip(
+	Hitbox.from_rects_array(array('f', [v for rect in rects for v in rect]), anchors),
+	rects,
+	anchors,
+):
+	single = Hitbox.from_rect(x, y, w, h, anchor)
+	assert bulk.coords == single.coords, (bulk.coords, single.coords)
+	assert bulk.shape is single.shape
+	assert bulk.subtype == single.subtype == 'rect'
+	assert bulk.pos == single.pos and bulk.anchor == single.anchor
+
+	# ... and keeps matching after being transformed
+	bulk.angle = single.angle = 0.5
+	bulk.pos = single.pos = 7, 9
+	assert bulk.coords == single.coords, (bulk.coords, single.coords)
+
+triangles = [((0, 0), (10, 0), (5, 8)), ((20, 20), (40, 20), (30, 35))]
+for bulk, coords in zip(
+	Hitbox.from_polygons_array(
+		[v for tri in triangles for point in tri for v in point], 3, (2, 3)
+	),
+	triangles,
+):
+	single = Hitbox(coords, (2, 3))
+	assert bulk.coords == single.coords, (bulk.coords, single.coords)
+	assert bulk.shape is single.shape
+
+# One anchor is broadcast to every rect, and no rects need no anchors
+assert [h.anchor for h in Hitbox.from_rects_array([0, 0, 1, 1] * 3, (1, 1))] == [
+	(1, 1)
+] * 3
+assert Hitbox.from_rects_array([], []) == []
+assert Hitbox.from_rects_array([]) == []
+for bad_anchors in ([], [(0, 0)] * 2):
+	try:
+		Hitbox.from_rects_array([0, 0, 1, 1] * 3, bad_anchors)
+	except ValueError:
+		pass
+	else:
+		raise AssertionError(f'{bad_anchors} anchors for 3 rects should fail')
+
+# Circles can't be built from rect or polygon arrays
+for method, args in (
+	(HitboxCircle.from_rects_array, ([0, 0, 1, 1],)),
+	(HitboxCircle.from_polygons_array, ([0, 0, 1, 1], 2)),
+):
+	try:
+		method(*args)
+	except TypeError:
+		pass
+	else:
+		raise AssertionError(f'{method.__name__} should fail for circles')
+
+print('Array constructors match per-object construction')
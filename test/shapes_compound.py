@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pyglet
+from pyglet.graphics import Batch, Group
+from pyglet.shapes import Circle, Polygon
+from pyglet.window import Window, key
+
+from pyglet_gamemaker.shapes import (
+	CompoundHitbox,
+	Hitbox,
+	HitboxCircle,
+	HitboxRender,
+)
+from pyglet_gamemaker.types import Color
+
+window = Window(640, 480, caption=__name__)
+batch = Batch()
+group = Group()
+
+body = Hitbox.from_rect(0, 0, 40, 80, (0, 0))
+head = HitboxCircle(20, 100, 16)
+sword = Hitbox.from_rect(40, 30, 60, 8, (0, 0))
+character = CompoundHitbox([body, head, sword], (100, 100), (20, 40))
+
+renders = {
+	body: Polygon(*body.coords, color=Color.WHITE.value, batch=batch, group=group),
+	head: Circle(0, 0, head.radius, color=Color.WHITE.value, batch=batch, group=group),
+	sword: Polygon(*sword.coords, color=Color.WHITE.value, batch=batch, group=group),
+}
+wall = HitboxRender.from_rect(300, 300, 100, 50, Color.RED, batch, group)
+
+
+def sync_renders():
+	for child, render in renders.items():
+		if isinstance(child, HitboxCircle):
+			render.position = child.coords[0]
+		else:
+			render._coordinates = child.coords
+			render._x, render._y = child.coords[0]
+			render._update_vertices()
+			render._update_translation()
+
+
+@window.event
+def on_mouse_motion(x, y, dx, dy):
+	character.pos = x, y
+
+
+@window.event
+def on_key_press(symbol, modifiers):
+	if symbol == key.A:
+		character.anchor_x -= 10
+	elif symbol == key.D:
+		character.anchor_x += 10
+	elif symbol == key.W:
+		character.anchor_y += 10
+	elif symbol == key.S:
+		character.anchor_y -= 10
+	elif symbol == key.LEFT:
+		character.angle -= 0.1
+	elif symbol == key.RIGHT:
+		character.angle += 0.1
+
+
+def update(dt):
+	sync_renders()
+
+	# Only the child that hit is highlighted
+	_, _, child = character.collide(wall)
+	for other, render in renders.items():
+		render.opacity = 128 if other is child else 255
+
+
+@window.event
+def on_draw():
+	window.clear()
+	batch.draw()
+
+
+pyglet.clock.schedule_interval(update, 1 / 60)
+pyglet.app.run()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import math
+import random
+
+import pyglet
+from pyglet.gl import GL_LINES, GL_TRIANGLES
+from pyglet.graphics import Batch
+from pyglet.window import Window, key
+
+from pyglet_gamemaker.shapes import Hitbox, HitboxCircle, HitboxDebugRenderer
+from pyglet_gamemaker.types import Color
+
+window = Window(640, 480, caption=__name__)
+batch = Batch()
+
+hitboxes = Hitbox.from_rects_array(
+	[
+		value
+		for _ in range(2000)
+		for value in (random.uniform(0, 640), random.uniform(0, 480), 10, 10)
+	]
+) + [
+	HitboxCircle(random.uniform(0, 640), random.uniform(0, 480), 8) for _ in range(500)
+]
+
+
+def get_mode(renderer):
+	# Get the draw mode of the renderer's vertex list
+	return next(
+		key[2]
+		for key, domain in renderer.batch.group_map[renderer._shape_group].items()
+		if domain is renderer._vertex_list.domain
+	)
+
+
+def get_positions(renderer):
+	return list(renderer._vertex_list.position[: renderer._used * 2])
+
+
+def is_written(renderer, *hitboxes):
+	# Check the vertex list holds the hitboxes' vertices (as float32)
+	expected = [
+		value for hitbox in hitboxes for value in renderer._get_vertices(hitbox)
+	]
+	return all(
+		math.isclose(a, b, abs_tol=1e-4)
+		for a, b in zip(get_positions(renderer), expected, strict=True)
+	)
+
+
+# Changing fill while enabled rebuilds the vertex list with the new draw mode
+checked = HitboxDebugRenderer(Batch())
+rect, dot = Hitbox.from_rect(0, 0, 10, 10, (0, 0)), HitboxCircle(50, 50, 5)
+checked.add(rect)
+checked.add(dot)
+checked.update()
+assert get_mode(checked) == GL_LINES
+checked.fill = True
+checked.update()
+assert get_mode(checked) == GL_TRIANGLES
+assert checked._starts == [0, 6]
+assert is_written(checked, rect, dot)
+
+# Changing a circle's radius (without moving it) rewrites its vertices
+dot.radius = 20
+checked.update()
+assert is_written(checked, rect, dot)
+assert math.isclose(max(get_positions(checked)[12:]), 70, abs_tol=1e-4)
+checked.enabled = False
+
+renderer = HitboxDebugRenderer(batch, color=Color.GREEN)
+for hitbox in hitboxes:
+	renderer.add(hitbox)
+
+
+@window.event
+def on_key_press(symbol, modifiers):
+	# H toggles debug draw, F toggles fill
+	if symbol == key.H:
+		renderer.enabled = not renderer.enabled
+	elif symbol == key.F:
+		renderer.fill = not renderer.fill
+
+
+def update(dt):
+	# Only some hitboxes move each frame, so only their ranges are rewritten
+	for hitbox in random.sample(hitboxes, 100):
+		hitbox.angle += 0.1
+	renderer.update()
+
+
+@window.event
+def on_draw():
+	window.clear()
+	batch.draw()
+
+
+pyglet.clock.schedule_interval(update, 1 / 60)
+pyglet.app.run()
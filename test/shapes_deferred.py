@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pyglet.graphics import Batch, Group
+from pyglet.window import Window
+
+from pyglet_gamemaker.shapes import HitboxRender, HitboxRenderCircle
+from pyglet_gamemaker.types import Color
+
+# Only needed for a GL context
+window = Window(640, 480, caption=__name__, visible=False)
+batch = Batch()
+group = Group()
+
+rect = HitboxRender.from_rect(100, 100, 50, 50, Color.WHITE, batch, group)
+circle = HitboxRenderCircle(300, 300, 20, Color.RED, batch, group)
+rect.deferred = circle.deferred = True
+
+# The hitboxes move right away, but the renders wait for the flush
+for i in range(1, 11):
+	rect.pos = 100 + i, 100
+	circle.pos = 300, 300 + i
+assert rect.hitbox.coords[0] == (110, 100), rect.hitbox.coords
+assert rect.render.position == (100, 100), rect.render.position
+assert circle.render.position == (300, 300), circle.render.position
+
+HitboxRender.flush()
+assert rect.render.position == (110, 100), rect.render.position
+assert circle.render.position == (300, 310), circle.render.position
+assert not HitboxRender._pending
+
+# Deleting a render with a pending update drops the update
+rect.angle = circle.angle = 0.5
+rect.delete()
+circle.delete()
+assert not HitboxRender._pending
+HitboxRender.flush()
+
+window.close()
+print('Deferred renders are updated once on flush')
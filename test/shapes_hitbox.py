@@ -12,16 +12,39 @@ batch = Batch()
 group = Group()
 
 hitbox = HitboxRender.from_rect(100, 100, 100, 50, Color.WHITE, batch, group)
+# Copies its positions from the hitbox's float32 vertices
+shared = HitboxRender(
+	((400, 100), (500, 100), (500, 150), (400, 150)),
+	Color.BLUE,
+	batch,
+	group,
+	subtype='rect',
+	shared_vertices=True,
+)
 hitbox2 = HitboxRender.from_rect(300, 300, 100, 50, Color.RED, batch, group)
 circle = HitboxRenderCircle(100, 100, 50, color=Color.WHITE, batch=batch, group=group)
 circle.render.visible = False
 
+# Moving a hidden shared render keeps it hidden, and showing it uses the new position
+shared.render.visible = False
+shared.x = 450
+assert not any(shared.render._vertex_list.position[:])
+shared.render.visible = True
+assert list(shared.render._vertex_list.position[:]) == list(shared.hitbox.vertices)
+# The float32 vertices are written in place, and coords are calculated from the transform
+shared.pos = 410.25, 120.5
+assert shared.hitbox.coords[0] == (410.25, 120.5)
+assert list(shared.hitbox.vertices) == [410.25, 120.5, 510.25, 120.5, 510.25, 170.5, 410.25, 170.5]
+assert list(shared.render._vertex_list.position[:]) == list(shared.hitbox.vertices)
+assert (450, 150) in shared.render and (350, 150) not in shared.render
+
 mode = 'rect'
 
 
 @window.event
 def on_mouse_motion(x, y, dx, dy):
 	hitbox.pos = x, y
+	shared.pos = x + 150, y
 	circle.pos = x, y
 
 
@@ -51,10 +74,10 @@ def on_key_press(symbol, modifiers):
 	if symbol == key.C:
 		mode = 'circle' if mode == 'rect' else 'rect'
 		if mode == 'rect':
-			hitbox.render.visible = True
+			hitbox.render.visible = shared.render.visible = True
 			circle.render.visible = False
 		elif mode == 'circle':
-			hitbox.render.visible = False
+			hitbox.render.visible = shared.render.visible = False
 			circle.render.visible = True
 
 
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import random
+
+import pyglet
+from pyglet.graphics import Batch, Group
+from pyglet.window import Window, key
+
+from pyglet_gamemaker.shapes import HitboxRender, RectBatch
+from pyglet_gamemaker.types import Color
+
+window = Window(640, 480, caption=__name__)
+batch = Batch()
+
+rects = RectBatch(batch)
+# Render-only background tiles
+for x in range(0, 640, 20):
+	for y in range(0, 480, 20):
+		rects.add(x + 1, y + 1, 18, 18, Color.GRAY, hitbox=False)
+# Collidable panels
+panels = [
+	rects.add(random.uniform(0, 600), random.uniform(0, 440), 40, 40, Color.WHITE)
+	for _ in range(20)
+]
+cursor = HitboxRender.from_rect(0, 0, 20, 20, Color.RED, batch, Group(1))
+
+
+@window.event
+def on_mouse_motion(x, y, dx, dy):
+	cursor.pos = x, y
+
+
+@window.event
+def on_key_press(symbol, modifiers):
+	# Space removes a panel, its slot is reused by the next one added
+	if symbol == key.SPACE and panels:
+		rects.remove(panels.pop())
+	elif symbol == key.A:
+		panels.append(
+			rects.add(
+				random.uniform(0, 600), random.uniform(0, 440), 40, 40, Color.WHITE
+			)
+		)
+
+
+def update(dt):
+	for panel in panels:
+		hitbox = rects.hitboxes[panel]
+		assert hitbox is not None
+		rects.update(
+			panel, color=Color.GREEN if cursor.collide(hitbox)[0] else Color.WHITE
+		)
+
+
+@window.event
+def on_draw():
+	window.clear()
+	batch.draw()
+
+
+pyglet.clock.schedule_interval(update, 1 / 60)
+pyglet.app.run()
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pyglet_gamemaker.atlas import AtlasBuilder
+from pyglet_gamemaker.sprite import PackedSpriteSheet, SpriteSheet
+
+buttons = SpriteSheet('Default Button.png', 3, 1)
+buttons.name('Unpressed', 'Hover', 'Pressed')
+rows = SpriteSheet('Default Button.png', 1, 1)
+packed = PackedSpriteSheet('Default Button.json')
+
+builder = AtlasBuilder(1024, 1024)
+builder.add(buttons, rows, packed)
+pages = builder.build()
+print(f'Pages: {len(pages)}')
+print(f'Shared texture: {buttons["Hover"].owner is rows[0].owner}')
+print(f'Single item: {buttons.item_dim}')
+print(f'Region in atlas: {buttons["Pressed"].x}, {buttons["Pressed"].y}')
+
+# Packed frames keep their size and trim anchor in the atlas
+hover = packed['Hover']
+assert hover.owner is buttons['Hover'].owner
+assert (hover.width, hover.height, hover.anchor_x) == (300, 100, -10)
+print(f'Packed region in atlas: {hover.x}, {hover.y}')
+
+# Packed sheets are marked, until unloaded (reloading leaves the atlas)
+assert buttons.in_atlas and rows.in_atlas and packed.in_atlas
+rows.unload()
+assert not rows.in_atlas
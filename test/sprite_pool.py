@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pyglet
+from pyglet.graphics import Batch
+from pyglet.window import Window
+
+from pyglet_gamemaker.sprite import SpritePool, SpriteSheet
+
+window = Window(640, 480, caption=__name__)
+batch = Batch()
+
+sheet = SpriteSheet('Default Button.png', 3, 1)
+pool = SpritePool(sheet[0], batch, size=16, block_size=16)
+bullets = []
+
+
+@window.event
+def on_mouse_drag(x, y, dx, dy, buttons, modifiers):
+	# Each frame of the sheet is used in turn
+	bullets.append(pool.acquire(x, y, sheet[len(bullets) % 3]))
+
+
+def update(dt):
+	for bullet in bullets[:]:
+		bullet.x += 400 * dt
+		if bullet.x > window.width:
+			bullets.remove(bullet)
+			pool.release(bullet)
+	window.set_caption(f'{__name__} {pool.get_stats()}')
+
+
+@window.event
+def on_draw():
+	window.clear()
+	batch.draw()
+
+
+pyglet.clock.schedule_interval(update, 1 / 60)
+pyglet.app.run()
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from pyglet_gamemaker.sprite import SpriteSheet
+from pyglet.graphics import Batch
+
+from pyglet_gamemaker.bundle import AssetBundle
+from pyglet_gamemaker.particles import ParticleEmitter
+from pyglet_gamemaker.scaling import ScaledFrameCache
+from pyglet_gamemaker.sprite import PackedSpriteSheet, SpriteSheet
+from pyglet_gamemaker.tilemap import TileLayer
 
 sheet = SpriteSheet('Default Button.png', 3, 1)
 print(f'Lookup before naming: {sheet.lookup}')
@@ -9,3 +15,85 @@ print(f'Lookup after naming: {sheet.lookup}')
 print(f'Single item: {sheet.item_dim}')
 print(f'Cols: {sheet.cols}, Rows: {sheet.rows}')
 print(f'Total Dim: {sheet.img.width}, {sheet.img.height}')
+
+# Loading the same file and grid twice shares one sheet
+shared = SpriteSheet.load('Default Button.png', 3, 1)
+print(f'Shared: {shared is SpriteSheet.load("Default Button.png", 3, 1)}')
+shared.release()
+shared.release()
+print(f'Cached after release: {("Default Button.png", 3, 1) in SpriteSheet._cache}')
+
+# Lazy sheets only load on first use
+lazy = SpriteSheet('Default Button.png', 1, 1, lazy=True)
+print(f'Loaded before use: {lazy.loaded}')
+print(f'Single item: {lazy.item_dim}')
+print(f'Loaded after use: {lazy.loaded}')
+for when, path, trigger, seconds in SpriteSheet.load_log:
+	print(f'{when:.3f}: {path} loaded by {trigger} in {seconds * 1000:.1f} ms')
+
+# Frames of different sizes from a JSON data file, named by their keys
+packed = PackedSpriteSheet('Default Button.json')
+print(f'Packed names: {packed.lookup}')
+print(f'Packed item: {packed.item_dim}')
+hover = packed['Hover']
+print(
+	f'Trimmed frame: {hover.width}x{hover.height}, anchor {hover.anchor_x}, {hover.anchor_y}'
+)
+print(f'Lookups shared: {packed.lookup is sheet.lookup}')
+
+# Packed sheets are shared by their data file, like grid sheets by file and grid
+packed_shared = PackedSpriteSheet.load('Default Button.json')
+assert packed_shared is PackedSpriteSheet.load('Default Button.json')
+assert packed_shared['Hover'].width == hover.width
+packed_shared.release()
+packed_shared.release()
+assert ('Default Button.json', 0, 0) not in SpriteSheet._cache
+
+# ... and can use an already loaded image
+from_image = PackedSpriteSheet.from_image(sheet.img, 'Default Button.json')
+assert from_image.path == 'Default Button.png'
+assert (from_image['Hover'].width, from_image['Hover'].anchor_x) == (300, -10)
+
+# Users of same-size grid images reject packed sheets
+for create in (
+	lambda: ParticleEmitter(packed, Batch()),
+	lambda: TileLayer(packed, [[0]], Batch()),
+	lambda: AssetBundle.build('unused.pgmb', [packed]),
+):
+	try:
+		create()
+	except TypeError as error:
+		print(f'Rejected: {error}')
+	else:
+		raise AssertionError('Packed sheet should be rejected')
+
+# Resized on the CPU once, then shared
+big = sheet.scaled('Hover', 1.5)
+assert (big.width, big.height) == (480, 180), (big.width, big.height)
+assert big is sheet.scaled('Hover', 1.5)
+assert big.owner is sheet.scaled('Pressed', 1.5).owner
+print(f'Scaled cache bytes: {SpriteSheet.scaled_cache.used}')
+
+# At a scale of 1, opaque pixels come out unchanged
+original = sheet['Hover'].get_image_data().get_bytes('RGBA', 320 * 4)
+same = sheet.scaled('Hover', 1).get_image_data().get_bytes('RGBA', 320 * 4)
+assert all(
+	original[i : i + 4] == same[i : i + 4]
+	for i in range(0, len(original), 4)
+	if original[i + 3] == 255
+)
+
+# Packed frames keep their own sizes and trim anchors
+packed_big = packed.scaled('Hover', 0.5)
+assert (packed_big.width, packed_big.height, packed_big.anchor_x) == (150, 50, -5)
+
+# The least recently used scale is dropped to stay within the budget
+small_cache = ScaledFrameCache(budget=1)
+half = small_cache.get(sheet, 'Hover', 0.5)
+assert small_cache.get(sheet, 'Hover', 0.5) is half
+small_cache.get(sheet, 'Hover', 0.25)
+assert small_cache.evictions == 1
+assert small_cache.get(sheet, 'Hover', 0.5) is not half
+assert small_cache.evictions == 2
+assert small_cache.used == small_cache.get_bytes(sheet)
+print(f'Scaled frames evicted: {small_cache.evictions}')
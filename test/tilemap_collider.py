@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pyglet
+from pyglet.graphics import Batch, Group
+from pyglet.window import Window
+
+from pyglet_gamemaker.shapes import HitboxRenderCircle, RectBatch
+from pyglet_gamemaker.tilemap import TileCollider
+from pyglet_gamemaker.types import Color
+
+window = Window(640, 480, caption=__name__)
+batch = Batch()
+
+# A walled room with a floating platform, from the bottom row up
+solid = (
+	[[1] * 20]
+	+ [[1] + [0] * 18 + [1] for _ in range(5)]
+	+ [[1] + [0] * 6 + [1] * 6 + [0] * 6 + [1]]
+	+ [[1] + [0] * 18 + [1] for _ in range(7)]
+	+ [[1] * 20]
+)
+tiles = TileCollider(solid, (32, 32))
+
+# Each merged rect is drawn once, so edges between tiles disappear
+rects = RectBatch(batch)
+for i, rect in enumerate(tiles.rects):
+	min_x, min_y, max_x, max_y = rect.bounds
+	color = Color.GRAY if i % 2 else Color.WHITE
+	rects.add(min_x + 1, min_y + 1, max_x - min_x - 2, max_y - min_y - 2, color, False)
+player = HitboxRenderCircle(320, 100, 20, Color.RED, batch, Group(1))
+
+
+@window.event
+def on_mouse_motion(x, y, dx, dy):
+	player.pos = x, y
+	# Push out of every overlapping rect
+	for _ in range(4):
+		collided, MTV = tiles.collide(player)
+		if not collided:
+			break
+		player.pos = player.pos[0] + MTV.x, player.pos[1] + MTV.y
+
+
+@window.event
+def on_draw():
+	window.clear()
+	batch.draw()
+
+
+pyglet.app.run()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import random
+
+import pyglet
+from pyglet.graphics import Batch
+from pyglet.window import Window
+
+from pyglet_gamemaker.sprite import SpriteSheet
+from pyglet_gamemaker.tilemap import TileLayer
+
+window = Window(640, 480, caption=__name__)
+batch = Batch()
+
+sheet = SpriteSheet('Default Button.png', 3, 1)
+sheet.name('Unpressed', 'Hover', 'Pressed')
+tiles = [[random.choice((-1, 0, 1, 2)) for _ in range(200)] for _ in range(150)]
+# Shrink tiles so the map fits in the window
+layer = TileLayer(sheet, tiles, batch, chunk_size=16, tile_size=(4, 4))
+
+
+@window.event
+def on_mouse_motion(x, y, dx, dy):
+	# Only chunks around the mouse are built
+	layer.set_view(x - 100, y - 100, 200, 200)
+
+
+@window.event
+def on_mouse_press(x, y, button, modifiers):
+	# Only the clicked tile's chunk is rebuilt
+	layer.set_tile(x // layer.tile_width, y // layer.tile_height, 'Pressed')
+
+
+def update(dt):
+	layer.update()
+
+
+@window.event
+def on_draw():
+	window.clear()
+	batch.draw()
+
+
+pyglet.clock.schedule_interval(update, 1 / 60)
+pyglet.app.run()
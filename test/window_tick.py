@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pyglet
+
+# Nothing is rendered, so no GL context is needed
+pyglet.options['shadow_window'] = False
+
+from pyglet_gamemaker.window import Window
+
+
+class StepCounter:
+	"""Stands in for a scene, recording its updates and draws."""
+
+	def __init__(self):
+		self.steps = []
+		self.alphas = []
+		self.animator = SimpleNamespace(update=lambda dt: None)
+		self.batch = SimpleNamespace(draw=lambda: None)
+
+	def update(self, dt):
+		self.steps.append(dt)
+
+	def on_draw(self, alpha):
+		self.alphas.append(alpha)
+
+
+# Only the fixed timestep state of a window is needed, so skip creating one
+scene = StepCounter()
+window = SimpleNamespace(
+	update_rate=4,
+	max_update_steps=3,
+	_accumulator=0,
+	alpha=0,
+	scene='Test',
+	scenes={'Test': scene},
+	clear=lambda: None,
+)
+
+
+def tick(dt):
+	scene.steps.clear()
+	Window._tick(window, dt)
+	Window.on_draw(window)
+	return len(scene.steps), scene.alphas[-1]
+
+
+# Less than a step: no update, time carried over
+assert tick(0.125) == (0, 0.5)
+# Carried time adds up to exactly 1 step (0.25 s)
+assert tick(0.125) == (1, 0)
+assert scene.steps == [0.25]
+# 2.5 steps: 2 updates, halfway to the next
+assert tick(0.625) == (2, 0.5)
+# 0.5 + 4.25 steps: capped at 3 updates, and the whole-step backlog is dropped
+assert tick(1.0625) == (3, 0.75)
+assert window._accumulator == 0.1875
+# Back to normal afterwards
+assert tick(0.0625) == (1, 0)
+
+print('Window runs fixed steps and passes alpha to drawing')